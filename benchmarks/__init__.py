@@ -0,0 +1 @@
+"""Performance benchmarks for the streams (run with: make benchmark)."""
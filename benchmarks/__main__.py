@@ -0,0 +1,66 @@
+"""
+Run the benchmarks, or compare the results of two runs.
+
+Usage:
+-----
+    python -m benchmarks [--filter TEXT] [--repeat N] [--output FILE]
+    python -m benchmarks compare BASELINE.json CURRENT.json [--threshold 1.1]
+
+"""
+
+import argparse
+import importlib
+import json
+import pkgutil
+import sys
+from pathlib import Path
+
+import benchmarks
+from benchmarks.suite import REGISTRY, compare, report, run
+
+
+def _load_benchmarks() -> None:
+    for module in pkgutil.iter_modules(benchmarks.__path__):
+        if module.name.startswith("bench_"):
+            importlib.import_module(f"benchmarks.{module.name}")
+
+
+def _run(args: argparse.Namespace) -> int:
+    _load_benchmarks()
+    selected = [bench for bench in REGISTRY if args.filter in bench.name]
+    results = report(run(selected, repeat=args.repeat))
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"Results written to {args.output}")
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    baseline = json.loads(args.baseline.read_text())
+    current = json.loads(args.current.read_text())
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) slower than {baseline['commit']} by more than x{args.threshold}")
+        return 1
+    return 0
+
+
+def main(argv: list[str]) -> int:
+    """Parse the command line arguments, and run the requested command."""
+    if argv[:1] == ["compare"]:
+        parser = argparse.ArgumentParser(prog="python -m benchmarks compare")
+        parser.add_argument("baseline", type=Path)
+        parser.add_argument("current", type=Path)
+        parser.add_argument("--threshold", type=float, default=1.1, help="ratio considered a regression")
+        return _compare(parser.parse_args(argv[1:]))
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--filter", default="", help="only run the benchmarks whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="file where to write the results (JSON)")
+    return _run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
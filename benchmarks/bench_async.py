@@ -0,0 +1,75 @@
+"""Per-element overhead of AsyncStream, against raw async comprehensions and one generator per stage."""
+
+from typing import AsyncIterator, Callable
+
+from benchmarks.suite import benchmark
+from pystream_collections import AsyncStream
+
+ELEMENTS = 50_000
+DEPTHS = (1, 2, 4, 8, 16)
+
+
+def _identity(x: int) -> int:
+    return x
+
+
+def _always(_: int) -> bool:
+    return True
+
+
+async def _source() -> AsyncIterator[int]:
+    for i in range(ELEMENTS):
+        yield i
+
+
+async def _map(mapper_fn: Callable, values: AsyncIterator) -> AsyncIterator:
+    async for e in values:
+        yield mapper_fn(e)
+
+
+async def _filter(filter_fn: Callable, values: AsyncIterator) -> AsyncIterator:
+    async for e in values:
+        if filter_fn(e):
+            yield e
+
+
+@benchmark(ELEMENTS, depth=DEPTHS)
+async def stream_chain(depth: int) -> None:
+    """Alternate map and filter stages."""
+    stream = AsyncStream(_source())
+    for i in range(depth):
+        stream = stream.map(_identity) if i % 2 == 0 else stream.filter(_always)
+    await stream.collect()
+
+
+@benchmark(ELEMENTS, depth=DEPTHS)
+async def nested_generators(depth: int) -> None:
+    """Baseline: one async generator per stage (how the stream ran before fusing the stages)."""
+    values = _source()
+    for i in range(depth):
+        values = _map(_identity, values) if i % 2 == 0 else _filter(_always, values)
+    [e async for e in values]
+
+
+@benchmark(ELEMENTS)
+async def raw_comprehension() -> None:
+    """Baseline: an async comprehension with a filter and a map, written by hand."""
+    [_identity(e) async for e in _source() if _always(e)]
+
+
+@benchmark(ELEMENTS)
+async def stream_filter_map() -> None:
+    """Run the same filter and map of the raw comprehension, with a stream."""
+    await AsyncStream(_source()).filter(_always).map(_identity).collect()
+
+
+@benchmark(ELEMENTS)
+async def stream_reduce() -> None:
+    """Reduce an async stream."""
+    await AsyncStream(_source()).map(_identity).reduce(max)
+
+
+@benchmark(ELEMENTS, max_concurrency=(1, 16))
+async def map_concurrent(max_concurrency: int) -> None:
+    """Overhead of the concurrent map, with a mapper that does no I/O."""
+    await AsyncStream(_source()).map_concurrent(_identity, max_concurrency=max_concurrency).collect()
@@ -0,0 +1,54 @@
+"""Cost of collecting the results of the streams into different containers."""
+
+from collections import Counter
+from typing import AsyncIterator
+
+from benchmarks.suite import benchmark
+from pystream_collections import AsyncStream, Stream
+from pystream_collections.collectors import grouping_by, to_counter
+
+ELEMENTS = 100_000
+KEYS = [i % 100 for i in range(ELEMENTS)]
+PAIRS = [(i, i) for i in range(ELEMENTS)]
+CONTAINERS = {"list": list, "set": set, "Counter": Counter}
+
+
+async def _source(values: list) -> AsyncIterator:
+    for value in values:
+        yield value
+
+
+@benchmark(ELEMENTS, container=tuple(CONTAINERS))
+def stream_collect(container: str) -> None:
+    """Collect into a type."""
+    Stream(KEYS).collect(CONTAINERS[container])
+
+
+@benchmark(ELEMENTS)
+def stream_collect_dict() -> None:
+    """Collect key/value pairs into a dictionary."""
+    Stream(PAIRS).collect(dict)
+
+
+@benchmark(ELEMENTS)
+def stream_collect_counter_collector() -> None:
+    """Collect with the collector equivalent to Counter."""
+    Stream(KEYS).collect(to_counter())
+
+
+@benchmark(ELEMENTS)
+def stream_collect_grouping() -> None:
+    """Collect grouping by a key."""
+    Stream(KEYS).collect(grouping_by(lambda x: x % 10))
+
+
+@benchmark(ELEMENTS, container=tuple(CONTAINERS))
+async def async_collect(container: str) -> None:
+    """Collect an async stream into a type."""
+    await AsyncStream(_source(KEYS)).collect(CONTAINERS[container])
+
+
+@benchmark(ELEMENTS)
+async def async_collect_dict() -> None:
+    """Collect an async stream of key/value pairs into a dictionary."""
+    await AsyncStream(_source(PAIRS)).collect(dict)
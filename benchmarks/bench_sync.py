@@ -0,0 +1,75 @@
+"""Per-element overhead of Stream, against hand-written generators and itertools."""
+
+from itertools import islice
+
+from benchmarks.suite import benchmark
+from pystream_collections import Pipeline, Stream
+
+ELEMENTS = 100_000
+DEPTHS = (1, 2, 4, 8, 16)
+DATA = list(range(ELEMENTS))
+
+
+def _identity(x: int) -> int:
+    return x
+
+
+def _always(_: int) -> bool:
+    return True
+
+
+@benchmark(ELEMENTS, depth=DEPTHS)
+def stream_chain(depth: int) -> None:
+    """Alternate map and filter stages, with a skip at the end."""
+    stream = Stream(DATA)
+    for i in range(depth):
+        stream = stream.map(_identity) if i % 2 == 0 else stream.filter(_always)
+    stream.skip(1).collect()
+
+
+@benchmark(ELEMENTS, depth=DEPTHS)
+def pipeline_chain(depth: int) -> None:
+    """Run the same chain, as a reusable pipeline."""
+    pipeline = Pipeline()
+    for i in range(depth):
+        pipeline = pipeline.map(_identity) if i % 2 == 0 else pipeline.filter(_always)
+    pipeline.skip(1).collect(DATA)
+
+
+@benchmark(ELEMENTS, depth=DEPTHS)
+def itertools_chain(depth: int) -> None:
+    """Baseline: the builtin map, filter, and islice, chained by hand."""
+    values = iter(DATA)
+    for i in range(depth):
+        values = map(_identity, values) if i % 2 == 0 else filter(_always, values)
+    list(islice(values, 1, None))
+
+
+@benchmark(ELEMENTS, depth=DEPTHS)
+def generator_chain(depth: int) -> None:
+    """Baseline: a single hand-written generator with all the stages."""
+    steps = [(i % 2 == 0, _identity if i % 2 == 0 else _always) for i in range(depth)]
+
+    def _run() -> object:
+        for element in DATA:
+            for is_map, fn in steps:
+                if is_map:
+                    element = fn(element)
+                elif not fn(element):
+                    break
+            else:
+                yield element
+
+    list(islice(_run(), 1, None))
+
+
+@benchmark(ELEMENTS)
+def stream_reduce() -> None:
+    """Reduce a mapped stream."""
+    Stream(DATA).map(_identity).reduce(max)
+
+
+@benchmark(ELEMENTS)
+def short_circuit_find() -> None:
+    """Find an element in the middle (only half of the elements are read, but it's normalized by all of them)."""
+    Stream(DATA).map(_identity).find(lambda x: x == ELEMENTS // 2)
@@ -0,0 +1,118 @@
+"""Registry and runner of the benchmarks, with the results in a machine-readable (JSON) format."""
+
+import asyncio
+import inspect
+import itertools
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from typing import Callable, Iterable, NamedTuple
+
+
+class Benchmark(NamedTuple):
+    """A function to measure, for a given combination of parameters."""
+
+    name: str
+    fn: Callable
+    params: dict
+    elements: int
+
+
+class Result(NamedTuple):
+    """The time it takes to run a benchmark, per element processed."""
+
+    name: str
+    params: dict
+    elements: int
+    ns_per_element: float
+    stdev: float
+    repeat: int
+
+    @property
+    def key(self) -> str:
+        """Identify the benchmark with its parameters, to compare it with other runs."""
+        params = ",".join(f"{key}={value}" for key, value in self.params.items())
+        return f"{self.name}[{params}]" if params else self.name
+
+
+REGISTRY: list[Benchmark] = []
+
+
+def benchmark(elements: int, **params: Iterable) -> Callable[[Callable], Callable]:
+    """
+    Register the decorated function as a benchmark, for every combination of the given <params>.
+
+    The function (sync or async) processes <elements> values, so the results are normalized per element.
+    """
+
+    def _register(fn: Callable) -> Callable:
+        name = f"{fn.__module__.rsplit('.', 1)[-1].removeprefix('bench_')}.{fn.__name__}"
+        keys = list(params)
+        for values in itertools.product(*params.values()):
+            REGISTRY.append(Benchmark(name, fn, dict(zip(keys, values)), elements))
+        return fn
+
+    return _register
+
+
+def _time_once(bench: Benchmark) -> float:
+    if inspect.iscoroutinefunction(bench.fn):
+        start = time.perf_counter()
+        asyncio.run(bench.fn(**bench.params))
+        return time.perf_counter() - start
+    start = time.perf_counter()
+    bench.fn(**bench.params)
+    return time.perf_counter() - start
+
+
+def run(benchmarks: Iterable[Benchmark], repeat: int = 5) -> list[Result]:
+    """Run each benchmark <repeat> times (after a warm-up run), and keep the best time."""
+    results = []
+    for bench in benchmarks:
+        _time_once(bench)
+        timings = [_time_once(bench) * 1e9 / bench.elements for _ in range(repeat)]
+        stdev = statistics.stdev(timings) if repeat > 1 else 0.0
+        result = Result(bench.name, bench.params, bench.elements, min(timings), stdev, repeat)
+        print(f"{result.key:<55} {result.ns_per_element:>10.1f} ns/element (± {result.stdev:.1f})")
+        results.append(result)
+    return results
+
+
+def _commit() -> str | None:
+    try:
+        command = ["git", "rev-parse", "--short", "HEAD"]
+        return subprocess.run(command, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def report(results: list[Result]) -> dict:
+    """Build the report of a run, including the context needed to compare it with others."""
+    return {
+        "commit": _commit(),
+        "date": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": [{**result._asdict(), "key": result.key} for result in results],
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """
+    Print the ratio (current / baseline) of every benchmark present in both reports.
+
+    Return the keys of the ones that got slower by more than the <threshold> (e.g. 1.1 is 10% slower).
+    """
+    previous = {result["key"]: result["ns_per_element"] for result in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        if (before := previous.get(result["key"])) is None:
+            continue
+        ratio = result["ns_per_element"] / before
+        flag = "SLOWER" if ratio > threshold else ("faster" if ratio < 1 / threshold else "")
+        print(f"{result['key']:<55} {before:>10.1f} -> {result['ns_per_element']:>10.1f} ns  x{ratio:.2f} {flag}")
+        if ratio > threshold:
+            regressions.append(result["key"])
+    return regressions
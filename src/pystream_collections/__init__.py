@@ -1,7 +1,10 @@
 """Entry point to the package from where to import the definitions."""
 
+from .array_stream import ArrayStream
 from .async_stream import AsyncStream
+from .collectors import Collector
 from .enums import OperationType
+from .pipeline import Pipeline
 from .stream import Stream
 
-__all__ = ["Stream", "OperationType", "AsyncStream"]
+__all__ = ["Stream", "OperationType", "AsyncStream", "ArrayStream", "Collector", "Pipeline"]
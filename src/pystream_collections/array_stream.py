@@ -0,0 +1,208 @@
+"""Stream over numeric data that keeps it in numpy arrays, processing whole blocks at a time."""
+
+import functools
+from itertools import chain
+from typing import Iterator, Self
+
+from pystream_collections.base import BaseStream
+from pystream_collections.collectors import Collector, collect
+from pystream_collections.compat import require_numpy
+from pystream_collections.enums import OperationType
+from pystream_collections.typedef import Filter, Mapper, Reducer, Transformation
+
+_NOT_SET = object()
+# The binary ufuncs that are associative, so each block can be reduced on its own, and the partial results combined.
+_ASSOCIATIVE_UFUNCS = frozenset(
+    {"add", "multiply", "maximum", "minimum", "logical_and", "logical_or", "bitwise_and", "bitwise_or", "bitwise_xor"}
+)
+
+
+def _vectorized_result(fn: Mapper | Filter, block: object, as_mask: bool) -> object | None:
+    """
+    Return the result of calling <fn> with the whole <block>, or None if it doesn't work on arrays.
+
+    Only blocks of scalars (1-D) are tried: with rows, a function written for a single row can also work on the whole
+    block (e.g. ``row[0]`` takes the first row), returning an array of the right length with other values.
+    """
+    np = require_numpy()
+    if block.ndim != 1:  # type: ignore[attr-defined]
+        return None
+    try:
+        result = fn(block)
+    except Exception:
+        return None
+    if not isinstance(result, np.ndarray) or result.shape[:1] != block.shape[:1]:
+        return None
+    if as_mask and (result.dtype != np.bool_ or result.ndim != 1):
+        return None
+    return result
+
+
+def _mapped(mapper_fn: Mapper, blocks: Iterator) -> Iterator:
+    np = require_numpy()
+    vectorized = isinstance(mapper_fn, np.ufunc) or None
+    for block in blocks:
+        if vectorized is None:
+            result = _vectorized_result(mapper_fn, block, as_mask=False)
+            vectorized = result is not None
+            if vectorized:
+                yield result
+                continue
+        yield mapper_fn(block) if vectorized else np.array([mapper_fn(e) for e in block])
+
+
+def _filtered(filter_fn: Filter, blocks: Iterator) -> Iterator:
+    np = require_numpy()
+    vectorized = None
+    for block in blocks:
+        if vectorized is None:
+            mask = _vectorized_result(filter_fn, block, as_mask=True)
+            vectorized = mask is not None
+        elif vectorized:
+            mask = filter_fn(block)
+        if not vectorized:
+            mask = np.fromiter(map(filter_fn, block), dtype=bool, count=len(block))
+        yield block[mask]
+
+
+def _skipped(n: int, blocks: Iterator) -> Iterator:
+    for block in blocks:
+        if n >= len(block):
+            n -= len(block)
+            continue
+        yield block[n:]
+        n = 0
+
+
+def _limited(n: int, blocks: Iterator) -> Iterator:
+    if n <= 0:
+        return
+    for block in blocks:
+        if n <= len(block):
+            yield block[:n]
+            return
+        yield block
+        n -= len(block)
+
+
+_BLOCK_OPERATIONS = {
+    OperationType.MAP: _mapped,
+    OperationType.FILTER: _filtered,
+    OperationType.SKIP: _skipped,
+    OperationType.LIMIT: _limited,
+}
+
+
+class ArrayStream(BaseStream):
+    """
+    A stream over a numpy array, that processes the data in blocks instead of element by element.
+
+    Functions that work on whole arrays (ufuncs, or any callable that returns an array of the same length, like
+    ``lambda x: x * 2 + 1``) are called once per block. Filters that return a boolean mask are applied as such.
+    Functions that don't (e.g. they use ``if`` on the value) are detected on the first block, and applied element by
+    element instead. Multidimensional arrays are streamed by rows, and the functions are applied row by row (except
+    ufuncs, which are still called on whole blocks). This requires numpy to be installed.
+    """
+
+    def __init__(self, array: object, block_size: int = 65536) -> None:
+        """
+        Initialize the stream with an array (or anything numpy can convert into one).
+
+        Args:
+        ----
+            array: The data to stream. Multidimensional arrays are streamed by rows (their first axis).
+            block_size (int): How many elements are processed at once.
+
+        """
+        if block_size < 1:
+            raise ValueError("The size of the block must be a positive number")
+        self._array = require_numpy().asarray(array)
+        self._block_size = block_size
+        self._transformations: list[Transformation] = []
+        self._is_closed = False
+
+    def _validate_is_not_closed(self) -> None:
+        if self._is_closed:
+            raise ValueError("Stream is closed and cannot be further chained")
+
+    def _close(self) -> None:
+        self._is_closed = True
+
+    def map(self, mapper_fn: Mapper) -> Self:
+        """Add a transformation function, applied to whole blocks when it supports arrays."""
+        self._validate_is_not_closed()
+        self._transformations.append((OperationType.MAP, mapper_fn))
+        return self
+
+    def filter(self, filter_fn: Filter) -> Self:
+        """Add a filtering function, applied as a boolean mask over whole blocks when it supports arrays."""
+        self._validate_is_not_closed()
+        self._transformations.append((OperationType.FILTER, filter_fn))
+        return self
+
+    def skip(self, n: int) -> Self:
+        """Skip <n> elements from the current stream, by slicing the blocks."""
+        self._validate_is_not_closed()
+        if n < 0:
+            raise ValueError("The number of elements to skip cannot be a negative number")
+        self._transformations.append((OperationType.SKIP, n))
+        return self
+
+    def limit(self, n: int) -> Self:
+        """Keep only the first <n> elements of the current stream, without processing any further block."""
+        self._validate_is_not_closed()
+        if n < 0:
+            raise ValueError("The limit cannot be a negative number")
+        self._transformations.append((OperationType.LIMIT, n))
+        return self
+
+    def _blocks(self) -> Iterator:
+        size = self._block_size
+        blocks = (self._array[i : i + size] for i in range(0, len(self._array), size))
+        for op_type, arg in self._transformations:
+            blocks = _BLOCK_OPERATIONS[op_type](arg, blocks)
+        return (block for block in blocks if len(block))
+
+    def collect(self, collectable_type: type | Collector | None = None) -> object:
+        """
+        Return the processed values into a final collectable, by default a numpy array.
+
+        For other types (e.g. list) the values are converted into Python objects first. A Collector can also be given.
+        """
+        self._validate_is_not_closed()
+        np = require_numpy()
+        blocks = list(self._blocks())
+        self._close()
+        if isinstance(collectable_type, Collector):
+            return collect(collectable_type, chain.from_iterable(block.tolist() for block in blocks))
+        result = np.concatenate(blocks) if blocks else self._array[:0]
+        if collectable_type is None or collectable_type is np.ndarray:
+            return result
+        return collectable_type(result.tolist())
+
+    def reduce(self, reducer_fn: Reducer, initial: object = _NOT_SET) -> object:
+        """
+        Reduce the stream to a final value based on the provided operation.
+
+        Associative ufuncs (e.g. numpy.add, numpy.maximum) reduce each block at once, and then combine the partial
+        results. Other functions (including ufuncs like numpy.subtract) are applied element by element, in order. This
+        action is FINAL.
+        """
+        self._validate_is_not_closed()
+        np = require_numpy()
+        blocks = self._blocks()
+        self._close()
+        if isinstance(reducer_fn, np.ufunc) and reducer_fn.__name__ in _ASSOCIATIVE_UFUNCS:
+            values = map(reducer_fn.reduce, blocks)
+        else:
+            values = chain.from_iterable(blocks)
+        if initial is _NOT_SET:
+            return functools.reduce(reducer_fn, values)
+        return functools.reduce(reducer_fn, values, initial)
+
+    def count(self) -> int:
+        """Return the number of elements in the stream. This action is FINAL."""
+        self._validate_is_not_closed()
+        result = sum(map(len, self._blocks()))
+        self._close()
+        return result
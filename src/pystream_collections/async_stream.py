@@ -1,24 +1,170 @@
 """Async version of the Stream."""
 
-from typing import AsyncIterator, Callable, Self
-
+import asyncio
+import functools
+import inspect
+from collections import deque
+from concurrent.futures import Executor
+from typing import AsyncIterable, AsyncIterator, Self
+
+from pystream_collections import collectors
 from pystream_collections.base import BaseStream
-from pystream_collections.typedef import Collectable, Filter, Mapper, Reducer
+from pystream_collections.batching import batched_async, on_array, unbatched_async
+from pystream_collections.cache import AsyncStreamCache
+from pystream_collections.collectors import Collector, collect, collect_async, collector_for
+from pystream_collections.compat import require_numpy
+from pystream_collections.concurrency import AdaptiveLimiter, ConcurrencyInfo, TokenBucket, limited_calls
+from pystream_collections.fan_in import interleaved, merged, zipped
+from pystream_collections.instrumentation import (
+    INSTRUMENTED_CALLABLES,
+    StageStats,
+    StatsHook,
+    counted_in_async,
+    counted_out_async,
+    reported_async,
+    timed,
+)
+from pystream_collections.memo import CacheInfo, MemoCache, memoized_async
+from pystream_collections.plan import fuse, fused_async, limited_async
+from pystream_collections.ranking import running_ranking
+from pystream_collections.reduction import combine_in_tree_async, reduce_chunk_async
+from pystream_collections.sources import DEFAULT_READ_SIZE, AsyncReader, Framing, read_frames_async
+from pystream_collections.tee import teed_async
+from pystream_collections.typedef import Collectable, Filter, KeyFunction, Mapper, Reducer, Transformation
+from pystream_collections.windows import windowing
 
 from .enums import OperationType
 
 _NOT_SET = object()
-
-
-async def _map(mapper_fn: Mapper, values: AsyncIterator) -> AsyncIterator:
-    async for e in values:
-        yield mapper_fn(e)
-
-
-async def _filter(filter_fn: Filter, values: AsyncIterator) -> AsyncIterator:
-    async for e in values:
-        if filter_fn(e):
-            yield e
+_END = object()
+
+
+async def _resolve(mapper_fn: Mapper, element: object) -> object:
+    result = mapper_fn(element)
+    if inspect.isawaitable(result):
+        return await result
+    return result
+
+
+def _ready_results(pending: deque[asyncio.Future], ordered: bool) -> list[asyncio.Future]:
+    """Take out of <pending> the calls whose results can be yielded already."""
+    if ordered:
+        ready = []
+        while pending and pending[0].done():
+            ready.append(pending.popleft())
+        return ready
+    ready = [task for task in pending if task.done()]
+    for task in ready:
+        pending.remove(task)
+    return ready
+
+
+async def _map_concurrently(
+    mapper_fn: Mapper, values: AsyncIterator, max_concurrency: int, ordered: bool
+) -> AsyncIterator:
+    """
+    Map the <values> with up to <max_concurrency> calls to <mapper_fn> in flight at the same time.
+
+    The source is pulled as a task of its own, so results that are ready are yielded even while waiting for the
+    next element to arrive. In ordered mode only the oldest call is awaited, so results come out in input order.
+    """
+    iterator = values.__aiter__()
+    pending: deque[asyncio.Future] = deque()
+    ready: list[asyncio.Future] = []
+    next_value: asyncio.Future | None = None
+    exhausted = False
+    try:
+        while pending or not exhausted:
+            if not exhausted and next_value is None and len(pending) < max_concurrency:
+                next_value = asyncio.ensure_future(iterator.__anext__())
+
+            waiting = {pending[0]} if ordered and pending else set(pending)
+            if next_value is not None:
+                waiting.add(next_value)
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+
+            if next_value in done:
+                try:
+                    element = next_value.result()
+                except StopAsyncIteration:
+                    exhausted = True
+                else:
+                    pending.append(asyncio.ensure_future(_resolve(mapper_fn, element)))
+                next_value = None
+
+            ready = _ready_results(pending, ordered)
+            for task in ready:
+                yield task.result()
+    finally:
+        # The ready ones are included too, so the errors of those not yielded (after one that failed) are retrieved.
+        leftovers = [*pending, *ready, next_value] if next_value is not None else [*pending, *ready]
+        for task in leftovers:
+            task.cancel()
+        await asyncio.gather(*leftovers, return_exceptions=True)
+
+
+async def _filter_concurrently(filter_fn: Filter, values: AsyncIterator, max_concurrency: int) -> AsyncIterator:
+    async def _evaluate(element: object) -> tuple[object, object]:
+        return element, await _resolve(filter_fn, element)
+
+    async for element, keep in _map_concurrently(_evaluate, values, max_concurrency, ordered=True):
+        if keep:
+            yield element
+
+
+async def _prefetch(values: AsyncIterator, n: int) -> AsyncIterator:
+    """
+    Read the <values> in a background task, keeping up to <n> of them in a queue ahead of the consumer.
+
+    Errors from the source are raised to the consumer once it reaches them, and closing (or cancelling) the consumer
+    cancels the background task.
+    """
+    queue: asyncio.Queue[tuple[object, Exception | None]] = asyncio.Queue(maxsize=n)
+
+    async def _produce() -> None:
+        try:
+            async for element in values:
+                await queue.put((element, None))
+        except Exception as error:
+            await queue.put((_END, error))
+        else:
+            await queue.put((_END, None))
+
+    producer = asyncio.create_task(_produce())
+    try:
+        while True:
+            element, error = await queue.get()
+            if error is not None:
+                raise error
+            if element is _END:
+                return
+            yield element
+    finally:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+
+
+async def _flattened(values: AsyncIterator[tuple]) -> AsyncIterator:
+    async for group in values:
+        for element in group:
+            yield element
+
+
+async def _values_of(source: "AsyncStream | AsyncIterable") -> AsyncIterator:
+    """Yield the values of the <source>, after the operations of the stream, if it's an AsyncStream."""
+    values = await source._collect() if isinstance(source, AsyncStream) else source
+    async for element in values:
+        yield element
+
+
+async def _aclose(values: AsyncIterator) -> None:
+    aclose = getattr(values, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+def _in_executor(executor: Executor | None, fn: Mapper | Filter, element: object) -> asyncio.Future:
+    return asyncio.get_running_loop().run_in_executor(executor, fn, element)
 
 
 class AsyncStream(BaseStream):
@@ -34,9 +180,122 @@ class AsyncStream(BaseStream):
 
         """
         self._async_iterator = async_iterator
-        self._transformations = []
+        self._transformations: list[Transformation] = []
+        self._instrumented = False
+        self._stats: list[StageStats] | None = None
+        self._stats_hook: StatsHook | None = None
+        self._memo_caches: list[MemoCache] = []
+        self._limiters: list[AdaptiveLimiter] = []
         self._is_closed = False
 
+    @classmethod
+    def from_reader(
+        cls,
+        reader: AsyncReader,
+        framing: Framing = "lines",
+        delimiter: bytes = b"\n",
+        record_size: int | None = None,
+        length_format: str = "!I",
+        read_size: int = DEFAULT_READ_SIZE,
+    ) -> Self:
+        """
+        Create a stream with the frames read from an asynchronous byte stream (e.g. an asyncio.StreamReader).
+
+        The reader is read in large chunks (of up to <read_size> bytes), which are split into frames all at once,
+        instead of awaiting each frame on its own. The frames are bytes.
+
+        Args:
+        ----
+            reader (AsyncReader): The source of bytes, with an async .read(n) method (an empty result means the end).
+            framing (Framing): How the frames are delimited:
+                - "lines": split on the <delimiter> (the last frame doesn't need to end with it).
+                - "length-prefixed": each frame starts with its length, packed as <length_format> (a struct format,
+                  4-byte big-endian unsigned by default).
+                - "fixed": every frame has <record_size> bytes.
+            delimiter (bytes): The delimiter of the "lines" framing.
+            record_size (int | None): The size of the frames, for the "fixed" framing.
+            length_format (str): The struct format of the length of the "length-prefixed" framing.
+            read_size (int): The maximum number of bytes read at once.
+
+        Returns:
+        -------
+            Self: A new stream, whose values are the frames. Raises ValueError if the reader ends in the middle of
+            a frame.
+
+        """
+        return cls(read_frames_async(reader, framing, delimiter, record_size, length_format, read_size))
+
+    @staticmethod
+    def _fan_in_sources(sources: tuple, buffer_size: int) -> tuple[AsyncIterator, ...]:
+        if buffer_size < 1:
+            raise ValueError("The size of the buffer must be a positive number")
+        for source in sources:
+            if isinstance(source, AsyncStream):
+                source._validate_is_not_closed()
+                source._close()
+        return tuple(_values_of(source) for source in sources)
+
+    @classmethod
+    def merge(cls, *sources: "AsyncStream | AsyncIterable", buffer_size: int = 1) -> Self:
+        """
+        Create a stream with the values of all the <sources>, in the order they arrive.
+
+        The sources (async streams, or async iterables) are read concurrently, each one in a task of its own, so the
+        total latency is the one of the slowest source, and not the sum of all of them. Each source reads ahead up to
+        <buffer_size> elements, and then waits for the stream to consume them. If a source fails, the error is
+        raised by the stream, and the rest of the sources are cancelled (like when the stream isn't read to the end).
+
+        Args:
+        ----
+            sources (AsyncStream | AsyncIterable): The streams to read from (they can't be used on their own after).
+            buffer_size (int): How many elements each source can read ahead.
+
+        Returns:
+        -------
+            Self: A new stream, with the values of the sources.
+
+        """
+        return cls(merged(cls._fan_in_sources(sources, buffer_size), buffer_size))
+
+    @classmethod
+    def zip(cls, *sources: "AsyncStream | AsyncIterable", buffer_size: int = 1) -> Self:
+        """
+        Create a stream of tuples, with the next value of each one of the <sources>, until the shortest one ends.
+
+        The sources are read concurrently, like in .merge().
+
+        Args:
+        ----
+            sources (AsyncStream | AsyncIterable): The streams to read from (they can't be used on their own after).
+            buffer_size (int): How many elements each source can read ahead.
+
+        Returns:
+        -------
+            Self: A new stream, with the tuples of values of the sources.
+
+        """
+        return cls(zipped(cls._fan_in_sources(sources, buffer_size), buffer_size))
+
+    @classmethod
+    def interleave(cls, *sources: "AsyncStream | AsyncIterable", buffer_size: int = 1) -> Self:
+        """
+        Create a stream with the values of the <sources> in turns (round-robin), until all of them end.
+
+        The sources are read concurrently, like in .merge(). The ones that end are skipped, and the order of the
+        values is deterministic (unlike .merge()).
+
+        Args:
+        ----
+            sources (AsyncStream | AsyncIterable): The streams to read from (they can't be used on their own after).
+            buffer_size (int): How many elements each source can read ahead.
+
+        Returns:
+        -------
+            Self: A new stream, with the values of the sources, in turns.
+
+        """
+        return cls(interleaved(cls._fan_in_sources(sources, buffer_size), buffer_size))
+
     def _validate_is_not_closed(self) -> None:
         if self._is_closed:
             raise ValueError("Stream is closed and cannot be further chained")
@@ -67,6 +326,313 @@ class AsyncStream(BaseStream):
         self._transformations.append((OperationType.FILTER, filter_fn))
         return self
 
+    def map_concurrent(self, mapper_fn: Mapper, max_concurrency: int = 8, ordered: bool = True) -> Self:
+        """
+        Add a mapper function that runs with several calls in flight at the same time.
+
+        The mapper can be a coroutine function (or any callable returning an awaitable), in which case its result is
+        awaited. Up to <max_concurrency> calls run at once while the rest of the stream keeps consuming the results.
+
+        Args:
+        ----
+            mapper_fn (Mapper): A unary function (sync or async) that transforms single values.
+            max_concurrency (int): The maximum number of calls to <mapper_fn> running at the same time.
+            ordered (bool): If True (default), the results keep the order of the input. Otherwise, they are yielded
+                as soon as each one completes.
+
+        Returns:
+        -------
+            Self: A reference to this same object, with the concurrent mapper registered.
+
+        """
+        self._validate_is_not_closed()
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive number")
+        stage = functools.partial(_map_concurrently, mapper_fn, max_concurrency=max_concurrency, ordered=ordered)
+        self._transformations.append((OperationType.CONCURRENT_MAP, stage))
+        return self
+
+    def map_cached(
+        self,
+        mapper_fn: Mapper,
+        key: KeyFunction | None = None,
+        maxsize: int | None = 1024,
+        ttl: float | None = None,
+        max_concurrency: int = 8,
+        ordered: bool = True,
+    ) -> Self:
+        """
+        Add a mapper function (sync or async) whose results are memoized, so it's not called again for repeated values.
+
+        It runs like .map_concurrent(), and concurrent calls for the same key share the one in flight instead of
+        calling <mapper_fn> again. Errors are not cached. The hits and misses are reported by .cache_info().
+
+        Args:
+        ----
+            mapper_fn (Mapper): A unary function (sync or async) that transforms single values.
+            key (KeyFunction | None): The function to get the key of the results of each value (the value itself by
+                default, so it must be hashable).
+            maxsize (int | None): How many results to keep, evicting the least recently used ones (None for
+                unbounded).
+            ttl (float | None): If given, results older than this number of seconds are computed again.
+            max_concurrency (int): The maximum number of calls to <mapper_fn> running at the same time.
+            ordered (bool): If True (default), the results keep the order of the input.
+
+        Returns:
+        -------
+            Self: A reference to this same object, with the memoized mapper registered.
+
+        """
+        self._validate_is_not_closed()
+        cache = MemoCache(maxsize, ttl)
+        self._memo_caches.append(cache)
+        return self.map_concurrent(memoized_async(mapper_fn, cache, key), max_concurrency, ordered)
+
+    def cache_info(self) -> list[CacheInfo]:
+        """Return the statistics of the cache of each .map_cached() stage, in the order they were registered."""
+        return [cache.info() for cache in self._memo_caches]
+
+    def map_adaptive(
+        self,
+        mapper_fn: Mapper,
+        max_concurrency: int = 64,
+        min_concurrency: int = 1,
+        latency_tolerance: float = 2.0,
+        rate: float | None = None,
+        burst: int = 1,
+        retry_on: tuple[type[Exception], ...] = (),
+        max_retries: int = 3,
+        ordered: bool = True,
+    ) -> Self:
+        """
+        Add a mapper function (sync or async) whose number of calls in flight adapts to how the service behind it copes.
+
+        The limit starts at <min_concurrency> and grows (up to <max_concurrency>) while the latency of the calls stays
+        within <latency_tolerance> times the lowest one seen recently. Once the latency goes beyond that (requests are
+        queueing), or a call fails with one of the <retry_on> errors, the limit is halved. The errors in <retry_on>
+        (e.g. timeouts, or "too many requests") are retried up to <max_retries> times; any other error is raised.
+        The current limit and the latency percentiles are reported by .concurrency_info().
+
+        Args:
+        ----
+            mapper_fn (Mapper): A unary function (sync or async) that transforms single values.
+            max_concurrency (int): The maximum number of calls to <mapper_fn> running at the same time.
+            min_concurrency (int): The minimum number of calls allowed in flight (and the initial limit).
+            latency_tolerance (float): How many times slower than the fastest recent call a call can be, before
+                considering that the service is overloaded.
+            rate (float | None): If given, the maximum number of calls started per second (on average).
+            burst (int): How many calls can start at once, under the <rate> limit.
+            retry_on (tuple[type[Exception], ...]): The errors that signal overload.
+            max_retries (int): How many times a call that fails with an error in <retry_on> is retried.
+            ordered (bool): If True (default), the results keep the order of the input.
+
+        Returns:
+        -------
+            Self: A reference to this same object, with the adaptive mapper registered.
+
+        """
+        self._validate_is_not_closed()
+        if max_retries < 0:
+            raise ValueError("max_retries cannot be a negative number")
+        limiter = AdaptiveLimiter(min_concurrency, max_concurrency, latency_tolerance)
+        rate_limit = TokenBucket(rate, burst) if rate is not None else None
+        self._limiters.append(limiter)
+        call = limited_calls(mapper_fn, limiter, rate_limit, retry_on, max_retries)
+        stage = functools.partial(_map_concurrently, call, max_concurrency=max_concurrency, ordered=ordered)
+        self._transformations.append((OperationType.CONCURRENT_MAP, stage))
+        return self
+
+    def concurrency_info(self) -> list[ConcurrencyInfo]:
+        """Return the limit and latency statistics of each .map_adaptive() stage, in the order they were registered."""
+        return [limiter.info() for limiter in self._limiters]
+
+    def map_in_executor(self, mapper_fn: Mapper, executor: Executor | None = None, max_in_flight: int = 8) -> Self:
+        """
+        Add a blocking mapper function, that runs in an executor instead of the event loop.
+
+        This is meant for synchronous functions that block (e.g. parsing a file, or calling a synchronous driver),
+        so the event loop stays responsive while they run. The results keep the order of the input.
+
+        Args:
+        ----
+            mapper_fn (Mapper): A unary (synchronous) function that transforms single values.
+            executor (Executor | None): Where to run the function. Defaults to the default executor of the loop.
+            max_in_flight (int): The maximum number of calls submitted to the executor at the same time.
+
+        Returns:
+        -------
+            Self: A reference to this same object, with the mapper registered.
+
+        """
+        self._validate_is_not_closed()
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be a positive number")
+        run_mapper = functools.partial(_in_executor, executor, mapper_fn)
+        stage = functools.partial(_map_concurrently, run_mapper, max_concurrency=max_in_flight, ordered=True)
+        self._transformations.append((OperationType.EXECUTOR_MAP, stage))
+        return self
+
+    def filter_in_executor(self, filter_fn: Filter, executor: Executor | None = None, max_in_flight: int = 8) -> Self:
+        """
+        Register a blocking filtering function, that runs in an executor instead of the event loop.
+
+        Args:
+        ----
+            filter_fn (Filter): A (synchronous) function that evaluates to a boolean.
+            executor (Executor | None): Where to run the function. Defaults to the default executor of the loop.
+            max_in_flight (int): The maximum number of calls submitted to the executor at the same time.
+
+        Returns:
+        -------
+            Self: A reference to this same object, with the filter registered.
+
+        """
+        self._validate_is_not_closed()
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be a positive number")
+        run_filter = functools.partial(_in_executor, executor, filter_fn)
+        stage = functools.partial(_filter_concurrently, run_filter, max_concurrency=max_in_flight)
+        self._transformations.append((OperationType.EXECUTOR_FILTER, stage))
+        return self
+
+    def prefetch(self, n: int = 1) -> Self:
+        """
+        Read ahead up to <n> elements from the previous stages, in a background task.
+
+        This decouples both sides of the stream, so they run concurrently: while the following stages process an
+        element, the previous ones (e.g. a slow source) are already producing the next ones. When the buffer is full,
+        reading pauses until the consumer catches up.
+
+        Args:
+        ----
+            n (int): The size of the buffer (how many elements can be read ahead).
+
+        Returns:
+        -------
+            Self: A reference to this same object, with the buffer registered.
+
+        """
+        self._validate_is_not_closed()
+        if n < 1:
+            raise ValueError("The size of the buffer must be a positive number")
+        self._transformations.append((OperationType.PREFETCH, functools.partial(_prefetch, n=n)))
+        return self
+
+    def running_top_k(self, k: int, key: KeyFunction | None = None, largest: bool = True) -> Self:
+        """
+        Replace the elements by the ranking of the <k> largest ones (by <key>) read so far, every time it changes.
+
+        This works on unbounded sources: each new value of the stream is a list with the current top <k> elements,
+        largest first (or the smallest ones, smallest first, if not <largest>). Only <k> elements are kept in memory.
+
+        Args:
+        ----
+            k (int): The size of the ranking.
+            key (KeyFunction | None): The function to get the value to compare of each element (the element itself by
+                default).
+            largest (bool): Whether to keep the largest elements (the default), or the smallest ones.
+
+        Returns:
+        -------
+            Self: A reference to this same object, with the ranking registered.
+
+        """
+        self._validate_is_not_closed()
+        if k < 0:
+            raise ValueError("k cannot be a negative number")
+        stage = functools.partial(running_ranking, k=k, key=key, largest=largest)
+        self._transformations.append((OperationType.RUNNING_TOP_K, stage))
+        return self
+
+    def window(
+        self,
+        count: int | None = None,
+        seconds: float | None = None,
+        slide: float | None = None,
+        aggregate: Mapper | Collector | None = None,
+    ) -> Self:
+        """
+        Group the elements into windows (lists) by count, by time, or both, emitting each one as it closes.
+
+        Without <slide>, the windows are tumbling (each element is in one window): a window closes when it has <count>
+        elements, or every <seconds>, whichever happens first. The time windows close even if the source goes quiet,
+        and empty windows are not emitted. With <slide>, the windows are sliding (by count or by time, not both): every
+        <slide> elements (or seconds), the last <count> elements (or the ones from the last <seconds>) are emitted.
+        Whatever is left when the source ends is emitted as a last (partial) window.
+
+        Args:
+        ----
+            count (int | None): The maximum number of elements of a window.
+            seconds (float | None): The duration of a window.
+            slide (float | None): How often a sliding window is emitted (in elements, or in seconds).
+            aggregate (Mapper | Collector | None): A function or a collector to apply to each window, to emit its
+                result instead of the list of elements.
+
+        Returns:
+        -------
+            Self: A reference to this same object, with the windows registered.
+
+        """
+        self._validate_is_not_closed()
+        self._transformations.append((OperationType.WINDOW, windowing(count, seconds, slide)))
+        if isinstance(aggregate, Collector):
+            aggregate = functools.partial(collect, aggregate)
+        if aggregate is not None:
+            self.map(aggregate)
+        return self
+
+    def batch(self, n: int) -> Self:
+        """
+        Group the elements of this stream into lists of <n> elements.
+
+        The last batch can be shorter, if the number of elements is not a multiple of <n>.
+
+        Args:
+        ----
+            n (int): The size of each batch.
+
+        Returns:
+        -------
+            Self: A reference to this same object, with the batching registered.
+
+        """
+        self._validate_is_not_closed()
+        if n < 1:
+            raise ValueError("The size of the batch must be a positive number")
+        self._transformations.append((OperationType.BATCH, functools.partial(batched_async, n=n)))
+        return self
+
+    def unbatch(self) -> Self:
+        """Flatten the elements of this stream (e.g. batches) back into single values."""
+        self._validate_is_not_closed()
+        self._transformations.append((OperationType.UNBATCH, unbatched_async))
+        return self
+
+    def map_batches(self, batch_fn: Mapper, size: int, as_array: bool = False, max_concurrency: int = 1) -> Self:
+        """
+        Transform the elements in batches of <size>, with a function that takes a batch and returns the new values.
+
+        This allows using vectorized functions or bulk APIs, calling Python once per batch, instead of once per
+        element. The values returned by <batch_fn> are flattened back into the stream.
+
+        Args:
+        ----
+            batch_fn (Mapper): A function (sync or async) that takes a batch and returns the transformed values.
+            size (int): The number of elements in each batch.
+            as_array (bool): Pass the batches as numpy arrays instead of lists (this requires numpy).
+            max_concurrency (int): The maximum number of batches being transformed at the same time.
+
+        Returns:
+        -------
+            Self: A reference to this same object, with the transformation registered.
+
+        """
+        self._validate_is_not_closed()
+        if as_array:
+            require_numpy()
+            batch_fn = functools.partial(on_array, batch_fn)
+        return self.batch(size).map_concurrent(batch_fn, max_concurrency=max_concurrency).unbatch()
+
     def skip(self, n: int) -> Self:
         """
         Skip <n> elements from this asynchronous stream iterator.
@@ -81,52 +647,121 @@ class AsyncStream(BaseStream):
 
         """
         self._validate_is_not_closed()
-        self._transformations.append((OperationType.SKIP, lambda i: i < n))
+        if n < 0:
+            raise ValueError("The number of elements to skip cannot be a negative number")
+        self._transformations.append((OperationType.SKIP, n))
         return self
 
-    async def _skip(self, tx_function: Callable[[int], bool], values: AsyncIterator) -> AsyncIterator:
+    def limit(self, n: int) -> Self:
         """
-        Return the <values> from the original iterator with the first N elements skipped.
+        Keep only the first <n> elements from this asynchronous stream iterator.
 
-        This is determined by the applied function <tx_function>.
+        Once the <n> elements went through, nothing else is requested from the async iterator.
 
         Args:
         ----
-            tx_function (callable[[int], bool]): A function to evaluate over
-                every Nth element on the iteration to determine if it needs to be
-                skipped or not.
-            values (AsyncIterator): The original values in the async iterator.
+            n (int): The maximum number of elements to keep.
 
         Returns:
         -------
-            AsyncIterator: The reduced async iterator.
+            Self: A reference to this same object, with the limit registered.
 
         """
-        index = 0
-        async for e in values:
-            if not tx_function(index):
-                yield e
-            index += 1
+        self._validate_is_not_closed()
+        if n < 0:
+            raise ValueError("The limit cannot be a negative number")
+        self._transformations.append((OperationType.LIMIT, functools.partial(limited_async, n=n)))
+        return self
 
-    async def _collect(self) -> AsyncIterator:
+    def instrument(self, hook: StatsHook | None = None) -> Self:
+        """
+        Keep statistics of each stage of the stream.
+
+        For each operation registered, it counts the elements in and out, the time spent in the functions of map and
+        filter stages, and the time spent awaiting the previous stages. The stages are not fused when instrumented.
+
+        Args:
+        ----
+            hook (StatsHook | None): A function called with the statistics once the final operation is done.
+
+        Returns:
+        -------
+            Self: A reference to this same object, with the instrumentation enabled.
+
+        """
+        self._validate_is_not_closed()
+        self._instrumented = True
+        self._stats_hook = hook
+        return self
+
+    @property
+    def stats(self) -> list[StageStats] | None:
+        """Return the statistics of each stage, if the stream is instrumented (they're filled in as it runs)."""
+        return self._stats
+
+    def _collect_instrumented(self) -> AsyncIterator:
+        self._stats = [StageStats(op_type) for op_type, _ in self._transformations]
         values = self._async_iterator
-        for op_type, tx_function in self._transformations:
-            if op_type == OperationType.MAP:
-                values = _map(tx_function, values)
-            elif op_type == OperationType.FILTER:
-                values = _filter(tx_function, values)
+        for stats, (op_type, stage) in zip(self._stats, self._transformations):
+            values = counted_in_async(values, stats)
+            if op_type in INSTRUMENTED_CALLABLES:
+                values = fused_async([(op_type, timed(stage, stats))], values)
             elif op_type == OperationType.SKIP:
-                values = self._skip(tx_function, values)
+                values = fused_async([(op_type, stage)], values)
+            else:
+                values = stage(values)
+            values = counted_out_async(values, stats)
+        return reported_async(values, self._stats, self._stats_hook)
+
+    async def _collect(self) -> AsyncIterator:
+        if self._instrumented:
+            return self._collect_instrumented()
+        values = self._async_iterator
+        for fusible, operations in fuse(self._transformations):
+            if fusible:
+                values = fused_async(operations, values)
+                continue
+            for _, stage in operations:
+                values = stage(values)
         return values
 
-    async def collect[TCollectable](self, collectable_type: type[Collectable] = list) -> Collectable:
-        """Return the result of the chained operations as a list."""
+    async def collect[TCollectable](self, collectable_type: type[Collectable] | Collector = list) -> Collectable:
+        """
+        Return the result of the chained operations into a final collectable (by default a list).
+
+        The elements are gathered one at a time as they arrive, without building an intermediate list for the
+        types that can be built incrementally (e.g. list, set, dict, Counter).
+
+        Args:
+        ----
+            collectable_type (type[Collectable] | Collector): The type of the result, or a Collector (see the
+                collectors module) that defines how to build it.
+
+        Returns:
+        -------
+            Collectable: The result with all the values of the stream.
+
+        """
         self._validate_is_not_closed()
         values = await self._collect()
         self._close()
+        if isinstance(collectable_type, Collector):
+            return await collect_async(collectable_type, values)
+        if collectable_type is list:
+            return [e async for e in values]
+        if (collector := collector_for(collectable_type)) is not None:
+            return await collect_async(collector, values)
         return collectable_type([e async for e in values])
 
-    async def reduce(self, reducer_fn: Reducer, initial: object = _NOT_SET) -> object:
+    async def reduce(
+        self,
+        reducer_fn: Reducer,
+        initial: object = _NOT_SET,
+        associative: bool = False,
+        combiner: Reducer | None = None,
+        chunksize: int = 1024,
+        max_concurrency: int = 8,
+    ) -> object:
         """
         Reduce the stream to a final value based on the provided operation.
 
@@ -144,6 +779,14 @@ class AsyncStream(BaseStream):
                 For example a stream of (x0, x1, x2) with reducer function f,
                 would be computed as: f(f(x0, x1), x2)
             initial: An initial value where to start the reduction from.
+            associative (bool): If the reducer is associative (e.g. sum, max, merging Counters), the values are
+                reduced in chunks concurrently, and the partial results are combined in a balanced tree. In this mode,
+                the reducer (and the combiner) can be coroutine functions.
+            combiner (Reducer | None): Combines two partial results, if they're not of the same type of the elements.
+                Then each chunk is reduced from the <initial> value, which must be an identity of the combiner (and
+                not be mutated by the reducer).
+            chunksize (int): How many elements are reduced together, in associative mode.
+            max_concurrency (int): How many chunks are reduced at the same time, in associative mode.
 
         Returns:
         -------
@@ -151,13 +794,195 @@ class AsyncStream(BaseStream):
 
         """
         self._validate_is_not_closed()
+        if associative:
+            return await self._reduce_associative(reducer_fn, initial, combiner, chunksize, max_concurrency)
         collected = await self._collect()
         value = _NOT_SET if initial is _NOT_SET else initial
         async for element in collected:
             if value is _NOT_SET:
                 value = element
+                continue
             value = reducer_fn(value, element)
         if value is _NOT_SET:
             raise TypeError("Cannot reduce with an empty async iterator and no initial value.")
         self._close()
         return value
+
+    async def _reduce_associative(
+        self, reducer_fn: Reducer, initial: object, combiner: Reducer | None, chunksize: int, max_concurrency: int
+    ) -> object:
+        if combiner is not None and initial is _NOT_SET:
+            raise ValueError("An initial value (an identity of the combiner) is required to reduce with a combiner")
+        if chunksize < 1 or max_concurrency < 1:
+            raise ValueError("chunksize and max_concurrency must be positive numbers")
+        chunk_initial = (initial,) if combiner is not None else ()
+        chunks = batched_async(await self._collect(), chunksize)
+        self._close()
+        reduce_fn = functools.partial(reduce_chunk_async, reducer_fn, chunk_initial)
+        partials = _flattened(_map_concurrently(reduce_fn, chunks, max_concurrency, ordered=True))
+        result = await combine_in_tree_async(partials, combiner or reducer_fn)
+        if initial is _NOT_SET:
+            if not result:
+                raise TypeError("Cannot reduce with an empty async iterator and no initial value.")
+            return result[0]
+        if combiner is not None:
+            return result[0] if result else initial
+        return await _resolve(functools.partial(reducer_fn, initial), result[0]) if result else initial
+
+    async def cache(self, max_in_memory: int | None = None) -> AsyncStreamCache:
+        """
+        Memoize the values of the stream at this point, so they can be replayed by other streams forked from it.
+
+        The values are computed lazily, and only once: call .fork() on the result to get new async streams that replay
+        them. The forks can be consumed one after the other, or concurrently.
+        This action is FINAL for this stream.
+
+        Args:
+        ----
+            max_in_memory (int | None): If given, the values beyond this number are spilled to a temporary file.
+
+        Returns:
+        -------
+            AsyncStreamCache: The cache, from where to fork new streams.
+
+        """
+        self._validate_is_not_closed()
+        if max_in_memory is not None and max_in_memory < 0:
+            raise ValueError("max_in_memory cannot be a negative number")
+        values = await self._collect()
+        self._close()
+        return AsyncStreamCache(values.__aiter__(), type(self), max_in_memory)
+
+    def tee(self, n: int = 2, buffer_size: int = 64) -> tuple[Self, ...]:
+        """
+        Split the stream into <n> new streams, that share a single pass over the values of this one.
+
+        The new streams have to be consumed concurrently (e.g. with asyncio.gather): the ones ahead wait when the
+        slowest one is <buffer_size> elements behind, so the memory used is bounded. Reading them one after the other
+        would wait forever if there are more values than <buffer_size>, unless the ones read first are closed (e.g.
+        after .first(), or a .limit()). This action is FINAL for this stream.
+
+        Args:
+        ----
+            n (int): The number of new streams.
+            buffer_size (int): How many elements the fastest stream can read ahead of the slowest one.
+
+        Returns:
+        -------
+            tuple[Self, ...]: The new streams.
+
+        """
+        self._validate_is_not_closed()
+        if n < 1:
+            raise ValueError("The number of streams must be a positive number")
+        if buffer_size < 1:
+            raise ValueError("The size of the buffer must be a positive number")
+        self._close()
+        return tuple(type(self)(branch) for branch in teed_async(_values_of(self), n, buffer_size))
+
+    async def first(self, default: object = _NOT_SET) -> object:
+        """
+        Return the first element of the stream, or <default> if it's empty.
+
+        Nothing else is requested from the async iterator once the first element arrives.
+        This action is FINAL, meaning the stream returns a value after this call and cannot be further chained upon.
+
+        Args:
+        ----
+            default: The value to return if the stream is empty. If not provided, an empty stream raises ValueError.
+
+        Returns:
+        -------
+            object: The first element of the stream.
+
+        """
+        self._validate_is_not_closed()
+        values = await self._collect()
+        self._close()
+        result = default
+        async for element in values:
+            result = element
+            break
+        await _aclose(values)
+        if result is _NOT_SET:
+            raise ValueError("Cannot get the first element of an empty async stream with no default value.")
+        return result
+
+    async def find(self, filter_fn: Filter, default: object = None) -> object:
+        """
+        Return the first element for which <filter_fn> is true, or <default> if there's none.
+
+        Nothing else is requested from the async iterator once the element is found. This action is FINAL.
+
+        Args:
+        ----
+            filter_fn (Filter): A function that evaluates to a boolean.
+            default: The value to return if no element matches.
+
+        Returns:
+        -------
+            object: The first element matching the filter.
+
+        """
+        self._validate_is_not_closed()
+        values = await self._collect()
+        self._close()
+        result = default
+        async for element in values:
+            if filter_fn(element):
+                result = element
+                break
+        await _aclose(values)
+        return result
+
+    async def any(self, filter_fn: Filter = bool) -> bool:
+        """
+        Return True if <filter_fn> is true for at least one element, stopping at the first one that is.
+
+        This action is FINAL, meaning the stream returns a value after this call and cannot be further chained upon.
+        """
+        return await self.find(filter_fn, default=_NOT_SET) is not _NOT_SET
+
+    async def all(self, filter_fn: Filter = bool) -> bool:
+        """
+        Return True if <filter_fn> is true for every element, stopping at the first one that isn't.
+
+        This action is FINAL, meaning the stream returns a value after this call and cannot be further chained upon.
+        """
+        return await self.find(lambda element: not filter_fn(element), default=_NOT_SET) is _NOT_SET
+
+    async def count(self) -> int:
+        """
+        Return the number of elements in the stream.
+
+        This action is FINAL, meaning the stream returns a value after this call and cannot be further chained upon.
+        """
+        self._validate_is_not_closed()
+        values = await self._collect()
+        self._close()
+        result = 0
+        async for _ in values:
+            result += 1
+        return result
+
+    async def top_k(self, k: int, key: KeyFunction | None = None) -> list:
+        """
+        Return the <k> largest elements (by <key>), largest first.
+
+        It takes a single pass keeping only <k> elements in memory, and elements with equal keys keep their relative
+        order. This action is FINAL.
+        """
+        return await self.collect(collectors.top_k(k, key))
+
+    async def bottom_k(self, k: int, key: KeyFunction | None = None) -> list:
+        """
+        Return the <k> smallest elements (by <key>), smallest first.
+
+        It takes a single pass keeping only <k> elements in memory, and elements with equal keys keep their relative
+        order. This action is FINAL.
+        """
+        return await self.collect(collectors.bottom_k(k, key))
+
+    # Names of the heapq equivalents.
+    nlargest = top_k
+    nsmallest = bottom_k
@@ -56,3 +56,20 @@ class BaseStream(ABC):
             Self: A reference to the same object, with the function registered.
 
         """
+
+    @abstractmethod
+    def limit(self, n: int) -> Self:
+        """
+        Keep only the first <n> values from the stream.
+
+        Once the <n> values went through, nothing else is read from the underlying iterator.
+
+        Args:
+        ----
+            n (int): The maximum number of elements to keep.
+
+        Returns:
+        -------
+            Self: A reference to the same object, with the limit registered.
+
+        """
@@ -0,0 +1,41 @@
+"""Grouping the values of a stream in batches, and flattening them back."""
+
+from itertools import chain, islice
+from typing import AsyncIterator, Callable, Iterable, Iterator
+
+from pystream_collections.compat import require_numpy
+
+
+def batched(values: Iterable, n: int) -> Iterator[list]:
+    """Group the <values> in lists of <n> elements (the last one can be shorter)."""
+    iterator = iter(values)
+    return iter(lambda: list(islice(iterator, n)), [])
+
+
+def unbatched(batches: Iterable[Iterable]) -> Iterator:
+    """Flatten the <batches> back into single values."""
+    return chain.from_iterable(batches)
+
+
+async def batched_async(values: AsyncIterator, n: int) -> AsyncIterator[list]:
+    """Group the <values> of the async iterator in lists of <n> elements (the last one can be shorter)."""
+    batch = []
+    async for element in values:
+        batch.append(element)
+        if len(batch) == n:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def unbatched_async(batches: AsyncIterator[Iterable]) -> AsyncIterator:
+    """Flatten the <batches> of the async iterator back into single values."""
+    async for batch in batches:
+        for element in batch:
+            yield element
+
+
+def on_array(batch_fn: Callable, batch: list) -> object:
+    """Call <batch_fn> with the <batch> converted into a numpy array."""
+    return batch_fn(require_numpy().asarray(batch))
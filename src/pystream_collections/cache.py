@@ -0,0 +1,178 @@
+"""Caches of the values of a stream, to replay them in several streams forked from it."""
+
+import asyncio
+import pickle
+import tempfile
+from typing import IO, AsyncIterator, Callable, Iterator
+
+from pystream_collections.base import BaseStream
+
+_END = object()
+
+
+class _Storage:
+    """
+    The cached values, in memory up to a limit, and in a temporary file (pickled) from then on.
+
+    Each reader keeps the position of the next element to read from the file, since they're read sequentially.
+    """
+
+    def __init__(self, max_in_memory: int | None) -> None:
+        self._max_in_memory = max_in_memory
+        self._memory: list = []
+        self._file: IO[bytes] | None = None
+        self.size = 0
+
+    def append(self, element: object) -> None:
+        if self._max_in_memory is None or len(self._memory) < self._max_in_memory:
+            self._memory.append(element)
+        else:
+            if self._file is None:
+                self._file = tempfile.TemporaryFile()
+            self._file.seek(0, 2)
+            pickle.dump(element, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.size += 1
+
+    def read(self, index: int, position: int) -> tuple[object, int]:
+        """Return the element at <index> and, if it was in the file at <position>, the position of the next one."""
+        if index < len(self._memory) or self._file is None:
+            return self._memory[index], position
+        self._file.seek(position)
+        element = pickle.load(self._file)
+        return element, self._file.tell()
+
+    @property
+    def spilled(self) -> int:
+        return self.size - len(self._memory)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class StreamCache:
+    """
+    The values of a stream at some point, memoized as they're read, so they can be replayed by new streams.
+
+    The upstream operations run only once: the first fork that needs an element reads it (and caches it), and the
+    rest of the forks replay it from the cache. If reading from upstream fails, every fork raises the error when it gets
+    to that point. If <max_in_memory> is set, the elements beyond that number are
+    spilled to a temporary file (so they need to be picklable).
+    """
+
+    def __init__(
+        self, values: Iterator, stream_type: Callable[[Iterator], BaseStream], max_in_memory: int | None
+    ) -> None:
+        """Create the cache over the <values>, to be replayed in streams of <stream_type>."""
+        self._values = values
+        self._stream_type = stream_type
+        self._storage = _Storage(max_in_memory)
+        self._exhausted = False
+        self._error: Exception | None = None
+
+    def _pull(self) -> bool:
+        if self._error is not None:
+            raise self._error
+        if not self._exhausted:
+            try:
+                element = next(self._values, _END)
+            except Exception as e:
+                # The rest of the forks get the same error when they get to this point (instead of ending there).
+                self._error = e
+                raise
+            if element is not _END:
+                self._storage.append(element)
+                return True
+            self._exhausted = True
+        return False
+
+    def _replay(self) -> Iterator:
+        index = position = 0
+        while index < self._storage.size or self._pull():
+            element, position = self._storage.read(index, position)
+            yield element
+            index += 1
+
+    def fork(self) -> BaseStream:
+        """Return a new stream, with the values of the cache (reading the rest of them from upstream as needed)."""
+        return self._stream_type(self._replay())
+
+    @property
+    def size(self) -> int:
+        """Return the number of elements cached so far."""
+        return self._storage.size
+
+    @property
+    def spilled(self) -> int:
+        """Return the number of elements cached in the temporary file."""
+        return self._storage.spilled
+
+    def close(self) -> None:
+        """Release the temporary file, if any. The cache cannot be used afterwards."""
+        self._storage.close()
+
+
+class AsyncStreamCache:
+    """
+    The values of an async stream at some point, memoized as they're read, so they can be replayed by new streams.
+
+    Forks can be consumed concurrently: only one of them reads from upstream at a time, and the others wait for the
+    element to be cached. If <max_in_memory> is set, the elements beyond that number are spilled to a temporary file.
+    """
+
+    def __init__(
+        self, values: AsyncIterator, stream_type: Callable[[AsyncIterator], BaseStream], max_in_memory: int | None
+    ) -> None:
+        """Create the cache over the async <values>, to be replayed in streams of <stream_type>."""
+        self._values = values
+        self._stream_type = stream_type
+        self._storage = _Storage(max_in_memory)
+        self._exhausted = False
+        self._error: Exception | None = None
+        self._lock = asyncio.Lock()
+
+    async def _pull(self) -> bool:
+        if self._error is not None:
+            raise self._error
+        if not self._exhausted:
+            try:
+                element = await self._values.__anext__()
+            except StopAsyncIteration:
+                self._exhausted = True
+                return False
+            except Exception as e:
+                self._error = e
+                raise
+            self._storage.append(element)
+            return True
+        return False
+
+    async def _replay(self) -> AsyncIterator:
+        index = position = 0
+        while True:
+            if index >= self._storage.size:
+                async with self._lock:
+                    if index >= self._storage.size and not await self._pull():
+                        return
+            element, position = self._storage.read(index, position)
+            yield element
+            index += 1
+
+    def fork(self) -> BaseStream:
+        """Return a new async stream, with the values of the cache (reading the rest from upstream as needed)."""
+        return self._stream_type(self._replay())
+
+    @property
+    def size(self) -> int:
+        """Return the number of elements cached so far."""
+        return self._storage.size
+
+    @property
+    def spilled(self) -> int:
+        """Return the number of elements cached in the temporary file."""
+        return self._storage.spilled
+
+    def close(self) -> None:
+        """Release the temporary file, if any. The cache cannot be used afterwards."""
+        self._storage.close()
@@ -0,0 +1,459 @@
+"""
+Collectors: objects that gather the values of a stream into a final result, one element at a time.
+
+A collector is defined by a supplier (creates the initial container), an accumulator (adds one element to the
+container, returning it), and a finisher (turns the container into the final result). Since elements are
+accumulated as they come, the memory needed is the size of the result, and not the size of the input.
+
+Example:
+-------
+    >>> Stream(words).collect(grouping_by(len, counting()))
+    {3: 2, 5: 1}
+
+"""
+
+import array
+import functools
+import math
+from collections import Counter
+from typing import AsyncIterable, Callable, Iterable, NamedTuple
+
+from pystream_collections.columnar import FINISHERS, Backend, Columns
+from pystream_collections.compat import require_numpy, require_pyarrow
+from pystream_collections.ranking import Ranking
+from pystream_collections.typedef import Filter, KeyFunction, Mapper
+
+
+def _identity(value: object) -> object:
+    return value
+
+
+class Collector(NamedTuple):
+    """
+    Definition of how to gather the values of a stream into a final result.
+
+    Attributes
+    ----------
+        supplier (Callable[[], object]): Creates a new (empty) container.
+        accumulator (Callable[[object, object], object]): Takes the container and an element, and returns the
+            container with the element added (it can be the same object, updated in place, or a new one).
+        finisher (Callable[[object], object]): Transforms the container into the final result.
+        combiner (Callable[[object, object], object] | None): Merges two containers into one, if supported.
+
+    """
+
+    supplier: Callable[[], object]
+    accumulator: Callable[[object, object], object]
+    finisher: Callable[[object], object] = _identity
+    combiner: Callable[[object, object], object] | None = None
+
+
+def collect(collector: Collector, values: Iterable) -> object:
+    """Drive the <collector> over all the <values>, and return its final result."""
+    container = collector.supplier()
+    accumulator = collector.accumulator
+    for element in values:
+        container = accumulator(container, element)
+    return collector.finisher(container)
+
+
+async def collect_async(collector: Collector, values: AsyncIterable) -> object:
+    """Drive the <collector> over all the <values> of the async iterable, and return its final result."""
+    container = collector.supplier()
+    accumulator = collector.accumulator
+    async for element in values:
+        container = accumulator(container, element)
+    return collector.finisher(container)
+
+
+def _append(container: list, element: object) -> list:
+    container.append(element)
+    return container
+
+
+def _extend(first: list, second: list) -> list:
+    first.extend(second)
+    return first
+
+
+def _add(container: set, element: object) -> set:
+    container.add(element)
+    return container
+
+
+def _union(first: set, second: set) -> set:
+    first |= second
+    return first
+
+
+def _update(first: dict, second: dict) -> dict:
+    first.update(second)
+    return first
+
+
+def _count_occurrence(container: Counter, element: object) -> Counter:
+    container[element] += 1
+    return container
+
+
+def _update_counter(first: Counter, second: Counter) -> Counter:
+    first.update(second)
+    return first
+
+
+def _increment(count: int, _: object) -> int:
+    return count + 1
+
+
+def _sum(first: object, second: object) -> object:
+    return first + second
+
+
+def to_list() -> Collector:
+    """Gather the elements into a list."""
+    return Collector(list, _append, combiner=_extend)
+
+
+def to_set() -> Collector:
+    """Gather the elements into a set."""
+    return Collector(set, _add, combiner=_union)
+
+
+def to_dict(key_fn: Mapper | None = None, value_fn: Mapper | None = None) -> Collector:
+    """
+    Gather the elements into a dictionary.
+
+    By default, the elements are expected to be (key, value) pairs. Otherwise, the key and the value are obtained by
+    applying <key_fn> and <value_fn> (identity if not provided) to each element. Later keys overwrite earlier ones.
+    """
+    if key_fn is None and value_fn is None:
+
+        def _put_pair(container: dict, element: tuple) -> dict:
+            key, value = element
+            container[key] = value
+            return container
+
+        return Collector(dict, _put_pair, combiner=_update)
+
+    get_key = key_fn or _identity
+    get_value = value_fn or _identity
+
+    def _put(container: dict, element: object) -> dict:
+        container[get_key(element)] = get_value(element)
+        return container
+
+    return Collector(dict, _put, combiner=_update)
+
+
+def to_counter() -> Collector:
+    """Count how many times each element appears, into a collections.Counter."""
+    return Collector(Counter, _count_occurrence, combiner=_update_counter)
+
+
+def counting() -> Collector:
+    """Count the number of elements."""
+    return Collector(int, _increment, combiner=_sum)
+
+
+def summing(mapper_fn: Mapper | None = None) -> Collector:
+    """Sum the elements (or the result of applying <mapper_fn> to each one of them)."""
+    if mapper_fn is None:
+        return Collector(int, _sum, combiner=_sum)
+
+    def _add_mapped(total: object, element: object) -> object:
+        return total + mapper_fn(element)
+
+    return Collector(int, _add_mapped, combiner=_sum)
+
+
+def joining(separator: str = "", prefix: str = "", suffix: str = "") -> Collector:
+    """Concatenate the (string) elements, with the <separator> in between, and the <prefix> and <suffix> around."""
+
+    def _join(parts: list) -> str:
+        return f"{prefix}{separator.join(parts)}{suffix}"
+
+    return Collector(list, _append, _join, combiner=_extend)
+
+
+def _add_exactly(partials: list[float], value: float) -> list[float]:
+    """Add the <value> to the <partials> (non-overlapping floats whose sum is exact), like math.fsum does."""
+    i = 0
+    for partial in partials:
+        if abs(value) < abs(partial):
+            value, partial = partial, value
+        high = value + partial
+        low = partial - (high - value)
+        if low:
+            partials[i] = low
+            i += 1
+        value = high
+    partials[i:] = [value]
+    return partials
+
+
+def _merge_exactly(first: list[float], second: list[float]) -> list[float]:
+    for partial in second:
+        _add_exactly(first, partial)
+    return first
+
+
+def fsumming(mapper_fn: Mapper | None = None) -> Collector:
+    """
+    Sum the elements (or the result of applying <mapper_fn> to them) as floats, without losing precision.
+
+    Like math.fsum, but one element at a time: only a few partial sums are kept, instead of all the values.
+    """
+    if mapper_fn is None:
+        return Collector(list, _add_exactly, math.fsum, combiner=_merge_exactly)  # type: ignore[arg-type]
+
+    def _add_mapped(partials: list[float], element: object) -> list[float]:
+        return _add_exactly(partials, mapper_fn(element))
+
+    return Collector(list, _add_mapped, math.fsum, combiner=_merge_exactly)  # type: ignore[arg-type]
+
+
+class Statistics(NamedTuple):
+    """
+    The summary statistics of a sequence of numbers.
+
+    Attributes
+    ----------
+        count (int): The number of values.
+        mean (float): The arithmetic mean (NaN if there are no values).
+        variance (float): The population variance (NaN if there are no values).
+        minimum (object): The smallest value (None if there are no values).
+        maximum (object): The largest value (None if there are no values).
+
+    """
+
+    count: int
+    mean: float
+    variance: float
+    minimum: object
+    maximum: object
+
+    @property
+    def sample_variance(self) -> float:
+        """Return the sample variance (with Bessel's correction), NaN if there are less than two values."""
+        return self.variance * self.count / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def stdev(self) -> float:
+        """Return the population standard deviation."""
+        return math.sqrt(self.variance)
+
+
+def _new_moments() -> list:
+    # count, mean, sum of squared differences from the mean, minimum, maximum
+    return [0, 0.0, 0.0, None, None]
+
+
+def _update_moments(moments: list, value: float) -> list:
+    """Add the <value> to the <moments>, with Welford's algorithm."""
+    count = moments[0] = moments[0] + 1
+    delta = value - moments[1]
+    moments[1] += delta / count
+    moments[2] += delta * (value - moments[1])
+    if count == 1:
+        moments[3] = moments[4] = value
+    elif value < moments[3]:
+        moments[3] = value
+    elif value > moments[4]:
+        moments[4] = value
+    return moments
+
+
+def _merge_moments(first: list, second: list) -> list:
+    """Merge the <second> moments into the <first> ones, with the pairwise algorithm of Chan et al."""
+    if not second[0]:
+        return first
+    if not first[0]:
+        return second
+    count = first[0] + second[0]
+    delta = second[1] - first[1]
+    first[2] += second[2] + delta * delta * first[0] * second[0] / count
+    first[1] += delta * second[0] / count
+    first[0] = count
+    first[3] = min(first[3], second[3])
+    first[4] = max(first[4], second[4])
+    return first
+
+
+def _statistics(moments: list) -> Statistics:
+    count, mean, squares, minimum, maximum = moments
+    if not count:
+        return Statistics(0, math.nan, math.nan, None, None)
+    return Statistics(count, mean, squares / count, minimum, maximum)
+
+
+def summarizing(mapper_fn: Mapper | None = None) -> Collector:
+    """
+    Compute the Statistics (count, mean, variance, minimum and maximum) of the numeric elements, in a single pass.
+
+    The mean and the variance are updated with Welford's algorithm, which is numerically stable (unlike accumulating
+    the sum of the squares), and partial results are merged with the pairwise algorithm of Chan et al.
+    """
+    if mapper_fn is None:
+        return Collector(_new_moments, _update_moments, _statistics, combiner=_merge_moments)  # type: ignore[arg-type]
+
+    def _update_mapped(moments: list, element: object) -> list:
+        return _update_moments(moments, mapper_fn(element))
+
+    return Collector(_new_moments, _update_mapped, _statistics, combiner=_merge_moments)  # type: ignore[arg-type]
+
+
+def averaging(mapper_fn: Mapper | None = None) -> Collector:
+    """Compute the mean of the numeric elements (NaN if there are none), in a numerically stable way."""
+    collector = summarizing(mapper_fn)
+    return collector._replace(finisher=lambda moments: _statistics(moments).mean)
+
+
+def _extreme(key: KeyFunction | None, keep_first: Callable[[object, object], bool]) -> Collector:
+    def _accumulate(best: list, element: object) -> list:
+        element_key = element if key is None else key(element)
+        if not best or keep_first(element_key, best[0]):
+            best[:] = (element_key, element)
+        return best
+
+    def _combine(first: list, second: list) -> list:
+        if not first or (second and keep_first(second[0], first[0])):
+            return second
+        return first
+
+    def _finish(best: list) -> object:
+        return best[1] if best else None
+
+    return Collector(list, _accumulate, _finish, combiner=_combine)  # type: ignore[arg-type]
+
+
+def minimum(key: KeyFunction | None = None) -> Collector:
+    """Find the smallest element (by <key>), or None if there are no elements. Ties keep the first one."""
+    return _extreme(key, lambda candidate, best: candidate < best)  # type: ignore[operator]
+
+
+def maximum(key: KeyFunction | None = None) -> Collector:
+    """Find the largest element (by <key>), or None if there are no elements. Ties keep the first one."""
+    return _extreme(key, lambda candidate, best: candidate > best)  # type: ignore[operator]
+
+
+def grouping_by(key_fn: Mapper, downstream: Collector | None = None) -> Collector:
+    """
+    Group the elements by the result of <key_fn>, into a dictionary.
+
+    The elements of each group are gathered with the <downstream> collector (into a list by default), for example:
+    grouping_by(len, counting()) maps each length to the number of elements with that length.
+    """
+    downstream = downstream or to_list()
+
+    def _accumulate(groups: dict, element: object) -> dict:
+        key = key_fn(element)
+        container = groups[key] if key in groups else downstream.supplier()
+        groups[key] = downstream.accumulator(container, element)
+        return groups
+
+    def _finish(groups: dict) -> dict:
+        return {key: downstream.finisher(container) for key, container in groups.items()}
+
+    return Collector(dict, _accumulate, _finish, combiner=_combiner_by_key(downstream))
+
+
+def partitioning_by(filter_fn: Filter, downstream: Collector | None = None) -> Collector:
+    """
+    Split the elements in two groups: the ones for which <filter_fn> is true, and the ones for which it isn't.
+
+    Both groups are always present in the result (a dictionary with True and False as keys), gathered with the
+    <downstream> collector (into a list by default).
+    """
+    downstream = downstream or to_list()
+
+    def _supply() -> dict:
+        return {False: downstream.supplier(), True: downstream.supplier()}
+
+    def _accumulate(groups: dict, element: object) -> dict:
+        key = bool(filter_fn(element))
+        groups[key] = downstream.accumulator(groups[key], element)
+        return groups
+
+    def _finish(groups: dict) -> dict:
+        return {key: downstream.finisher(container) for key, container in groups.items()}
+
+    return Collector(_supply, _accumulate, _finish, combiner=_combiner_by_key(downstream))
+
+
+def _rank(ranking: Ranking, element: object) -> Ranking:
+    ranking.add(element)
+    return ranking
+
+
+def _ranking(k: int, key: KeyFunction | None, largest: bool) -> Collector:
+    if k < 0:
+        raise ValueError("k cannot be a negative number")
+    return Collector(functools.partial(Ranking, k, key, largest), _rank, Ranking.result, Ranking.merge)  # type: ignore[arg-type]
+
+
+def top_k(k: int, key: KeyFunction | None = None) -> Collector:
+    """Gather the <k> largest elements (by <key>) into a list, largest first, keeping only <k> of them in memory."""
+    return _ranking(k, key, largest=True)
+
+
+def bottom_k(k: int, key: KeyFunction | None = None) -> Collector:
+    """Gather the <k> smallest elements (by <key>) into a list, smallest first, keeping only <k> of them in memory."""
+    return _ranking(k, key, largest=False)
+
+
+def to_array(typecode: str) -> Collector:
+    """
+    Gather the elements (numbers) into an array.array of <typecode>, that keeps them unboxed (e.g. 8 bytes per float).
+
+    The elements are converted like array.array does (e.g. ints into floats for "d"), or fail if they don't fit.
+    """
+    array.array(typecode)  # fail early with an invalid typecode
+    return Collector(functools.partial(array.array, typecode), _append, combiner=_extend)
+
+
+def to_columns(
+    fields: Iterable[str] | None = None, typecodes: dict[str, str] | None = None, backend: Backend = "array"
+) -> Collector:
+    """
+    Gather records (NamedTuples or dataclasses) into a column per field, as a dict of {field name: column}.
+
+    The columns of numbers and bools are typed arrays (the type is taken from the first record, or given by field name
+    in <typecodes>), and the rest are lists; a column becomes a list if a value is of another type (e.g. None).
+    With the "array" <backend>, the columns are array.array objects (bools are stored as 0 and 1). With "numpy", they
+    are numpy arrays (without copying the typed ones), and with "arrow" the result is a pyarrow.Table (this requires
+    pyarrow, and numpy). Only the given <fields> are collected, if any (they're required for plain tuples).
+    """
+    if backend not in FINISHERS:
+        raise ValueError(f"Unknown backend {backend!r}: it must be one of {', '.join(FINISHERS)}")
+    if backend != "array":
+        require_numpy()
+    if backend == "arrow":
+        require_pyarrow()
+    supplier = functools.partial(Columns, fields, typecodes)
+    return Collector(supplier, Columns.add, FINISHERS[backend], Columns.merge)
+
+
+def _combiner_by_key(downstream: Collector) -> Callable[[dict, dict], dict] | None:
+    if downstream.combiner is None:
+        return None
+    combine = downstream.combiner
+
+    def _combine(first: dict, second: dict) -> dict:
+        for key, container in second.items():
+            first[key] = combine(first[key], container) if key in first else container
+        return first
+
+    return _combine
+
+
+_COLLECTORS_BY_TYPE: dict[type, Callable[[], Collector]] = {
+    set: to_set,
+    dict: to_dict,
+    Counter: to_counter,
+}
+
+
+def collector_for(collectable_type: type) -> Collector | None:
+    """Return the collector that builds a <collectable_type> one element at a time, if there's one."""
+    factory = _COLLECTORS_BY_TYPE.get(collectable_type)
+    return factory() if factory is not None else None
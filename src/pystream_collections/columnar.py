@@ -0,0 +1,177 @@
+"""Collection of records into columns: a typed array per field, instead of an object (and boxed fields) per record."""
+
+import array
+import dataclasses
+import operator
+from typing import Callable, Iterable, Literal, Sequence
+
+from pystream_collections.compat import require_numpy, require_pyarrow
+
+Backend = Literal["array", "numpy", "arrow"]
+
+# The typecodes of the columns whose type is inferred from their first value (the rest are kept in lists).
+_TYPECODES: dict[type, str] = {int: "q", float: "d", bool: "B"}
+# How many records are kept before splitting them into the columns, which is done in bulk.
+_CHUNK_SIZE = 4096
+
+
+def _layout(record: object, fields: tuple[str, ...] | None) -> tuple[tuple[str, ...], Callable[[object], Sequence]]:
+    """Return the names of the fields of the <record>, and the function to get their values."""
+    is_named_tuple = isinstance(record, tuple) and hasattr(record, "_fields")
+    if fields is None:
+        if is_named_tuple:
+            return record._fields, tuple  # type: ignore[attr-defined]
+        if dataclasses.is_dataclass(record) and not isinstance(record, type):
+            fields = tuple(field.name for field in dataclasses.fields(record))
+        else:
+            raise TypeError("The records must be NamedTuples or dataclasses (or tuples, if the fields are given)")
+    elif isinstance(record, tuple) and not is_named_tuple:
+        return fields, tuple
+    if len(fields) == 1:
+        getter = operator.attrgetter(fields[0])
+        return fields, lambda record: (getter(record),)
+    return fields, operator.attrgetter(*fields)
+
+
+class Columns:
+    """
+    The values of the records gathered so far, one column per field.
+
+    The columns of numbers (and bools) are array.array objects, with the type of the first value (or the one in
+    <typecodes>, by field name), and the rest are lists. If a value is not of the type of the first one (e.g. a None, a
+    float or a bool in a column of ints, or an int in a column of floats), the column becomes a list, so the values are
+    kept as they are. With a typecode given, only the values that don't fit in its array do that. The records are added
+    to the columns in chunks, so each column is extended once per chunk, instead of once per record.
+    """
+
+    def __init__(self, fields: Iterable[str] | None = None, typecodes: dict[str, str] | None = None) -> None:
+        """Create the columns, whose fields are taken from the first record unless <fields> are given."""
+        self._fields = tuple(fields) if fields is not None else None
+        self._typecodes = typecodes or {}
+        self.names: tuple[str, ...] = ()
+        self.columns: list[array.array | list] = []
+        self.bools: set[int] = set()
+        # The type of the values of the columns whose typecode was taken from the first one.
+        self._types: dict[int, type] = {}
+        self._values: Callable[[object], Sequence] | None = None
+        self._pending: list = []
+
+    def _start(self, record: object) -> None:
+        self.names, self._values = _layout(record, self._fields)
+        if unknown := set(self._typecodes) - set(self.names):
+            raise ValueError(f"There are typecodes for fields that the records don't have: {sorted(unknown)}")
+        for index, (name, value) in enumerate(zip(self.names, self._values(record))):
+            typecode = self._typecodes.get(name) or _TYPECODES.get(type(value))
+            if name not in self._typecodes and typecode:
+                self._types[index] = type(value)
+                if type(value) is bool:
+                    self.bools.add(index)
+            self.columns.append(array.array(typecode) if typecode else [])
+
+    def _as_list(self, index: int) -> list:
+        column = self.columns[index]
+        # The bools are stored as 0 and 1 in the array.
+        column = self.columns[index] = list(map(bool, column) if index in self.bools else column)
+        self.bools.discard(index)
+        self._types.pop(index, None)
+        return column
+
+    def _extend(self, index: int, values: tuple) -> None:
+        column = self.columns[index]
+        if index in self._types and set(map(type, values)) != {self._types[index]}:
+            self._as_list(index).extend(values)
+            return
+        size = len(column)
+        try:
+            column.extend(values)
+        except (TypeError, OverflowError):
+            del column[size:]
+            self._as_list(index).extend(values)
+
+    def flush(self) -> "Columns":
+        """Split the pending records into the columns."""
+        if not self._pending:
+            return self
+        rows = self._pending if self._values is tuple else map(self._values, self._pending)  # type: ignore[arg-type]
+        try:
+            values_by_field = list(zip(*rows, strict=True))
+        except ValueError:
+            raise ValueError("All the records must have the same fields") from None
+        if len(values_by_field) != len(self.columns):
+            raise ValueError("All the records must have the same fields")
+        for index, values in enumerate(values_by_field):
+            self._extend(index, values)
+        self._pending = []
+        return self
+
+    def add(self, record: object) -> "Columns":
+        """Add the <record> (its values are appended to the columns in bulk, with the rest of its chunk)."""
+        if self._values is None:
+            self._start(record)
+        self._pending.append(record)
+        if len(self._pending) == _CHUNK_SIZE:
+            self.flush()
+        return self
+
+    def merge(self, other: "Columns") -> "Columns":
+        """Append the columns of the <other> (with the records that came after the ones in this one)."""
+        self.flush()
+        other.flush()
+        if not other.columns:
+            return self
+        if not self.columns:
+            return other
+        if other.names != self.names:
+            raise ValueError("All the records must have the same fields")
+        for index, column in enumerate(other.columns):
+            mine = self.columns[index]
+            same_type = (
+                isinstance(mine, array.array)
+                and isinstance(column, array.array)
+                and mine.typecode == column.typecode
+                and (index in self.bools) == (index in other.bools)
+            )
+            if not same_type:
+                mine = mine if isinstance(mine, list) else self._as_list(index)
+                column = column if isinstance(column, list) else other._as_list(index)
+            mine.extend(column)  # type: ignore[arg-type]
+        return self
+
+
+def _as_arrays(columns: Columns) -> dict[str, array.array | list]:
+    columns.flush()
+    return dict(zip(columns.names, columns.columns))
+
+
+def _typed_view(columns: Columns, index: int) -> object:
+    """Return a numpy array over the array.array of the column at <index> (without copying it), that keeps it alive."""
+    column = columns.columns[index]
+    return require_numpy().frombuffer(column, dtype=bool if index in columns.bools else column.typecode)
+
+
+def _untyped_array(column: list) -> object:
+    """Return a numpy array with the values of the list, as objects if they're of several types (not to coerce them)."""
+    mixed = len(set(map(type, column))) > 1
+    return require_numpy().array(column, dtype=object if mixed else None)
+
+
+def _as_numpy(columns: Columns) -> dict[str, object]:
+    columns.flush()
+    return {
+        name: _typed_view(columns, index) if isinstance(column, array.array) else _untyped_array(column)
+        for index, (name, column) in enumerate(zip(columns.names, columns.columns))
+    }
+
+
+def _as_arrow(columns: Columns) -> object:
+    pa = require_pyarrow()
+    columns.flush()
+    return pa.table(
+        {
+            name: pa.array(_typed_view(columns, index) if isinstance(column, array.array) else column)
+            for index, (name, column) in enumerate(zip(columns.names, columns.columns))
+        }
+    )
+
+
+FINISHERS: dict[str, Callable[[Columns], object]] = {"array": _as_arrays, "numpy": _as_numpy, "arrow": _as_arrow}
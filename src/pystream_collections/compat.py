@@ -0,0 +1,27 @@
+"""Optional dependencies, that are only needed for some features."""
+
+from types import ModuleType
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+
+def require_numpy() -> ModuleType:
+    """Return the numpy module, or fail with an explanation if it's not installed."""
+    if numpy is None:
+        raise ImportError("This feature requires numpy, which is not installed (pip install numpy)")
+    return numpy
+
+
+def require_pyarrow() -> ModuleType:
+    """Return the pyarrow module, or fail with an explanation if it's not installed."""
+    if pyarrow is None:
+        raise ImportError("This feature requires pyarrow, which is not installed (pip install pyarrow)")
+    return pyarrow
@@ -0,0 +1,233 @@
+"""Adaptive concurrency limits and rate limits, for async mappers that call other services."""
+
+import asyncio
+import inspect
+import time
+from collections import deque
+from typing import Callable, NamedTuple
+
+from pystream_collections.typedef import Mapper
+
+_LATENCY_SAMPLES = 1000
+# How often (in calls) the lowest latency is taken again from the recent samples only, to follow slower conditions.
+_BASELINE_PERIOD = 100
+
+
+def _percentile(ordered: list[float], q: float) -> float | None:
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class ConcurrencyInfo(NamedTuple):
+    """
+    The statistics of an adaptive concurrency limit.
+
+    Attributes
+    ----------
+        limit (int): The number of calls currently allowed in flight.
+        calls (int): How many calls completed (successfully or not).
+        overloads (int): How many calls failed with an error that signals overload (and were retried, if allowed).
+        p50 (float | None): The median latency of the recent calls, in seconds (None if there are none yet).
+        p90 (float | None): The 90th percentile of the latency of the recent calls.
+        p99 (float | None): The 99th percentile of the latency of the recent calls.
+
+    """
+
+    limit: int
+    calls: int
+    overloads: int
+    p50: float | None
+    p90: float | None
+    p99: float | None
+
+
+class AdaptiveLimiter:
+    """
+    A concurrency limit that adapts to the latency of the calls, with additive increase and multiplicative decrease.
+
+    The calls wait for a slot (see .acquire()) while the limit is reached. The limit grows while the latency of the
+    calls stays within <latency_tolerance> times the lowest recent one (the latency without queueing): by one per call
+    at first (doubling it each round trip), and by one per round trip after the first decrease. When the latency goes
+    beyond that, or a call fails because of overload, the limit is multiplied by <backoff>, at most once per round trip
+    (the calls that started before a decrease don't count again).
+    """
+
+    def __init__(
+        self,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        latency_tolerance: float = 2.0,
+        backoff: float = 0.5,
+    ) -> None:
+        """Create a limiter, starting at <min_limit>."""
+        if min_limit < 1:
+            raise ValueError("min_limit must be a positive number")
+        if max_limit < min_limit:
+            raise ValueError("max_limit cannot be lower than min_limit")
+        if latency_tolerance <= 1:
+            raise ValueError("latency_tolerance must be greater than 1")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._latency_tolerance = latency_tolerance
+        self._backoff = backoff
+        self._limit = float(min_limit)
+        self._slow_start = True
+        self._last_decrease = -float("inf")
+        self._latencies: deque[float] = deque(maxlen=_LATENCY_SAMPLES)
+        self._baseline = float("inf")
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self.calls = 0
+        self.overloads = 0
+
+    @property
+    def limit(self) -> int:
+        """Return the number of calls currently allowed in flight."""
+        return int(self._limit)
+
+    def _wake_up(self) -> None:
+        free = self.limit - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    async def acquire(self) -> None:
+        """Wait until there are less calls in flight than the limit, and take a slot for one more."""
+        while self._in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # The slot this waiter was woken up for (if any) goes to the next one.
+                self._wake_up()
+                raise
+        self._in_flight += 1
+
+    def release(self) -> None:
+        """Free the slot of a call that completed."""
+        self._in_flight -= 1
+        self._wake_up()
+
+    def _decrease(self, started: float) -> None:
+        if started < self._last_decrease:
+            return
+        self._slow_start = False
+        self._limit = max(self._min_limit, self._limit * self._backoff)
+        self._last_decrease = time.monotonic()
+
+    def on_success(self, started: float) -> None:
+        """Adjust the limit after a call that started at <started> (time.monotonic) completed successfully."""
+        latency = time.monotonic() - started
+        self.calls += 1
+        self._latencies.append(latency)
+        if self.calls % _BASELINE_PERIOD == 0:
+            self._baseline = min(self._latencies)
+        self._baseline = min(self._baseline, latency)
+        if latency > self._baseline * self._latency_tolerance:
+            self._decrease(started)
+            return
+        increase = 1 if self._slow_start else 1 / self._limit
+        self._limit = min(self._max_limit, self._limit + increase)
+
+    def on_error(self, started: float, overload: bool) -> None:
+        """Adjust the limit after a call that started at <started> failed (because of <overload>, or not)."""
+        self.calls += 1
+        if overload:
+            self.overloads += 1
+            self._decrease(started)
+
+    def info(self) -> ConcurrencyInfo:
+        """Return the current limit, and the latency percentiles of the recent calls."""
+        ordered = sorted(self._latencies)
+        return ConcurrencyInfo(
+            self.limit,
+            self.calls,
+            self.overloads,
+            _percentile(ordered, 0.5),
+            _percentile(ordered, 0.9),
+            _percentile(ordered, 0.99),
+        )
+
+
+class TokenBucket:
+    """
+    A rate limit of <rate> calls per second on average, allowing bursts of up to <burst> calls.
+
+    The callers that have to wait are served in the order they arrived.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """Create a full bucket."""
+        if rate <= 0:
+            raise ValueError("rate must be a positive number")
+        if burst < 1:
+            raise ValueError("burst must be a positive number")
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated: float | None = None
+        self._lock: asyncio.Lock | None = None
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if self._updated is not None:
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a call is allowed, and take its token."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._refill()
+            self._tokens -= 1
+
+
+def limited_calls(
+    mapper_fn: Mapper,
+    limiter: AdaptiveLimiter,
+    rate_limit: TokenBucket | None,
+    retry_on: tuple[type[Exception], ...],
+    max_retries: int,
+) -> Callable:
+    """
+    Wrap the async <mapper_fn> to run within the <limiter> (and the <rate_limit>), reporting the outcome of each call.
+
+    The calls that fail with one of the <retry_on> errors (signals of overload, like a timeout or an HTTP 429) are
+    retried up to <max_retries> times, and then the error is raised.
+    """
+
+    async def _call(element: object) -> object:
+        retries = 0
+        while True:
+            await limiter.acquire()
+            try:
+                if rate_limit is not None:
+                    await rate_limit.acquire()
+                started = time.monotonic()
+                try:
+                    result = mapper_fn(element)
+                    if inspect.isawaitable(result):
+                        result = await result
+                except Exception as e:
+                    overload = isinstance(e, retry_on)
+                    limiter.on_error(started, overload)
+                    if not overload or retries == max_retries:
+                        raise
+                    retries += 1
+                    continue
+                limiter.on_success(started)
+                return result
+            finally:
+                limiter.release()
+
+    return _call
@@ -10,3 +10,15 @@ class OperationType(Enum):
     FILTER = "filter"
     REDUCE = "reduce"
     SKIP = "skip"
+    LIMIT = "limit"
+    CONCURRENT_MAP = "concurrent_map"
+    EXECUTOR_MAP = "executor_map"
+    EXECUTOR_FILTER = "executor_filter"
+    PREFETCH = "prefetch"
+    BATCH = "batch"
+    UNBATCH = "unbatch"
+    SORT = "sort"
+    GROUP_BY = "group_by"
+    DISTINCT = "distinct"
+    RUNNING_TOP_K = "running_top_k"
+    WINDOW = "window"
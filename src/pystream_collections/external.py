@@ -0,0 +1,111 @@
+"""Sorting, grouping, and de-duplication of streams that may not fit in memory."""
+
+import heapq
+import pickle
+import tempfile
+from itertools import chain, groupby, islice
+from operator import itemgetter
+from typing import IO, Iterable, Iterator
+
+from pystream_collections.typedef import KeyFunction
+
+
+def _identity(element: object) -> object:
+    return element
+
+
+def _write_run(run: list) -> IO[bytes]:
+    """Write a sorted run of elements to a temporary file, to be read back in order with _read_run."""
+    file = tempfile.TemporaryFile()
+    pickler = pickle.Pickler(file, protocol=pickle.HIGHEST_PROTOCOL)
+    for element in run:
+        pickler.dump(element)
+    file.seek(0)
+    return file
+
+
+def _read_run(file: IO[bytes]) -> Iterator:
+    unpickler = pickle.Unpickler(file)
+    while True:
+        try:
+            yield unpickler.load()
+        except EOFError:
+            return
+
+
+def sorted_external(
+    values: Iterable, key: KeyFunction | None = None, reverse: bool = False, max_in_memory: int | None = None
+) -> Iterator:
+    """
+    Sort the <values> (stably), keeping at most <max_in_memory> of them in memory at once.
+
+    If there are more values than that, they're sorted in runs of <max_in_memory> elements that are spilled to
+    temporary files (so they need to be picklable), and merged lazily as the result is read.
+    """
+    iterator = iter(values)
+    run = list(islice(iterator, max_in_memory))
+    run.sort(key=key, reverse=reverse)
+    if max_in_memory is None or len(run) < max_in_memory:
+        yield from run
+        return
+
+    files = []
+    try:
+        while run:
+            files.append(_write_run(run))
+            run = list(islice(iterator, max_in_memory))
+            run.sort(key=key, reverse=reverse)
+        yield from heapq.merge(*map(_read_run, files), key=key, reverse=reverse)
+    finally:
+        for file in files:
+            file.close()
+
+
+def grouped_external(values: Iterable, key: KeyFunction, max_in_memory: int | None = None) -> Iterator[tuple]:
+    """Yield a (key, list of elements) pair for each key, sorted by key (the elements keep their relative order)."""
+    for group_key, group in groupby(sorted_external(values, key, max_in_memory=max_in_memory), key):
+        yield group_key, list(group)
+
+
+def _first_of_each_key(tagged: Iterable[tuple], max_in_memory: int | None) -> Iterator[tuple]:
+    """
+    Yield the first occurrence of each key of the <tagged> (key, index, is_new, element) tuples, if it's new.
+
+    The tuples are sorted by key, then by index, so the first one of each key is its earliest occurrence.
+    """
+    by_key = sorted_external(tagged, itemgetter(0, 1), max_in_memory=max_in_memory)
+    for _, occurrences in groupby(by_key, itemgetter(0)):
+        first = next(occurrences)
+        if first[2]:
+            yield first
+
+
+def distinct_external(values: Iterable, key: KeyFunction | None = None, max_in_memory: int | None = None) -> Iterator:
+    """
+    Yield the first occurrence of each distinct element (or <key> of it), in the order of the input.
+
+    The keys seen are kept in a set while there are at most <max_in_memory> of them. Beyond that, the rest of the
+    elements are de-duplicated externally (against the keys already seen): they're sorted by key to find the first
+    occurrence of each one, and then sorted back into their original order. This requires the keys to be orderable.
+    """
+    key_fn = key or _identity
+    iterator = iter(values)
+    seen: set = set()
+    for element in iterator:
+        element_key = key_fn(element)
+        if element_key in seen:
+            continue
+        if max_in_memory is not None and len(seen) >= max_in_memory:
+            iterator = chain((element,), iterator)
+            break
+        seen.add(element_key)
+        yield element
+    else:
+        return
+
+    already_seen = ((seen_key, -1, False, None) for seen_key in seen)
+    new = ((key_fn(element), index, True, element) for index, element in enumerate(iterator))
+    firsts = _first_of_each_key(chain(already_seen, new), max_in_memory)
+    del seen
+    for *_, element in sorted_external(firsts, itemgetter(1), max_in_memory=max_in_memory):
+        yield element
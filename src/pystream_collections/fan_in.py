@@ -0,0 +1,104 @@
+"""Reading several async sources at the same time, into a single stream."""
+
+import asyncio
+from typing import AsyncIterable, AsyncIterator
+
+_END = object()
+
+
+class _FanIn:
+    """
+    Read each source in a task of its own, into a bounded buffer per source.
+
+    The sources are read concurrently, and each one pauses when its buffer is full, until the consumer catches up.
+    The errors of a source are raised to the consumer, when it reads from it.
+    """
+
+    def __init__(self, sources: tuple[AsyncIterable, ...], buffer_size: int, notify_ready: bool = False) -> None:
+        self._buffers = [asyncio.Queue(maxsize=buffer_size) for _ in sources]
+        # The indexes of the sources, each time one of them adds an element to its buffer (only if notify_ready).
+        self._ready: asyncio.Queue[int] = asyncio.Queue()
+        self._notify_ready = notify_ready
+        self._tasks = [asyncio.ensure_future(self._produce(i, source)) for i, source in enumerate(sources)]
+
+    async def _produce(self, index: int, source: AsyncIterable) -> None:
+        buffer = self._buffers[index]
+        error = None
+        try:
+            async for element in source:
+                await self._put(index, buffer, (element, None))
+        except Exception as e:  # it's raised to the consumer
+            error = e
+        await self._put(index, buffer, (_END, error))
+
+    async def _put(self, index: int, buffer: asyncio.Queue, item: tuple) -> None:
+        await buffer.put(item)
+        if self._notify_ready:
+            self._ready.put_nowait(index)
+
+    async def next_from(self, index: int) -> object:
+        """Return the next element of the source at <index>, or _END if it's exhausted."""
+        element, error = await self._buffers[index].get()
+        if error is not None:
+            raise error
+        return element
+
+    async def next_ready(self) -> tuple[int, object]:
+        """Return the index of the next source with an element in its buffer, and the element (or _END)."""
+        index = await self._ready.get()
+        return index, await self.next_from(index)
+
+    async def close(self) -> None:
+        """Stop reading the sources."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+async def merged(sources: tuple[AsyncIterable, ...], buffer_size: int) -> AsyncIterator:
+    """Yield the elements of all the <sources> as they arrive, until all of them are exhausted."""
+    fan_in = _FanIn(sources, buffer_size, notify_ready=True)
+    active = len(sources)
+    try:
+        while active:
+            _, element = await fan_in.next_ready()
+            if element is _END:
+                active -= 1
+                continue
+            yield element
+    finally:
+        await fan_in.close()
+
+
+async def zipped(sources: tuple[AsyncIterable, ...], buffer_size: int) -> AsyncIterator[tuple]:
+    """Yield tuples with the next element of each one of the <sources>, until the shortest one is exhausted."""
+    if not sources:
+        return
+    fan_in = _FanIn(sources, buffer_size)
+    try:
+        while True:
+            elements = []
+            for index in range(len(sources)):
+                element = await fan_in.next_from(index)
+                if element is _END:
+                    return
+                elements.append(element)
+            yield tuple(elements)
+    finally:
+        await fan_in.close()
+
+
+async def interleaved(sources: tuple[AsyncIterable, ...], buffer_size: int) -> AsyncIterator:
+    """Yield the next element of each one of the <sources> in turns, skipping the ones that are exhausted."""
+    fan_in = _FanIn(sources, buffer_size)
+    active = list(range(len(sources)))
+    try:
+        while active:
+            for index in tuple(active):
+                element = await fan_in.next_from(index)
+                if element is _END:
+                    active.remove(index)
+                    continue
+                yield element
+    finally:
+        await fan_in.close()
@@ -0,0 +1,113 @@
+"""Opt-in statistics of each stage of a stream, to find out which one is slow."""
+
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Iterable, Iterator
+
+from pystream_collections.enums import OperationType
+
+INSTRUMENTED_CALLABLES = frozenset({OperationType.MAP, OperationType.FILTER})
+
+
+@dataclass
+class StageStats:
+    """
+    The statistics of a stage of a stream (one per registered operation, in the same order).
+
+    Attributes
+    ----------
+        operation (OperationType): The type of operation of the stage.
+        elements_in (int): How many elements were passed to the stage.
+        elements_out (int): How many elements came out of the stage.
+        callable_time (float): Cumulative seconds spent in the function of the stage (only for map and filter).
+        upstream_wait (float): Cumulative seconds the stage spent awaiting its input (only for async streams).
+
+    """
+
+    operation: OperationType
+    elements_in: int = 0
+    elements_out: int = 0
+    callable_time: float = 0.0
+    upstream_wait: float = 0.0
+
+
+StatsHook = Callable[[list[StageStats]], None]
+
+
+def timed(fn: Callable, stats: StageStats) -> Callable:
+    """Wrap the function, so the time spent on its calls is added to the <stats>."""
+
+    def _timed(element: object) -> object:
+        start = time.perf_counter()
+        try:
+            return fn(element)
+        finally:
+            stats.callable_time += time.perf_counter() - start
+
+    return _timed
+
+
+def counted_in(values: Iterable, stats: StageStats) -> Iterator:
+    """Count the elements that go into a stage."""
+    for element in values:
+        stats.elements_in += 1
+        yield element
+
+
+def counted_out(values: Iterable, stats: StageStats) -> Iterator:
+    """Count the elements that come out of a stage."""
+    for element in values:
+        stats.elements_out += 1
+        yield element
+
+
+def reported(values: Iterable, stages: list[StageStats], hook: StatsHook | None) -> Iterator:
+    """Call the <hook> with the statistics once the <values> are exhausted, or no longer read."""
+    try:
+        yield from values
+    finally:
+        if hook is not None:
+            hook(stages)
+
+
+async def counted_in_async(values: AsyncIterator, stats: StageStats) -> AsyncIterator:
+    """Count the elements that go into a stage, and the time spent waiting for them."""
+    iterator = values.__aiter__()
+    while True:
+        start = time.perf_counter()
+        try:
+            element = await iterator.__anext__()
+        except StopAsyncIteration:
+            return
+        finally:
+            stats.upstream_wait += time.perf_counter() - start
+        stats.elements_in += 1
+        yield element
+
+
+async def _aclose(values: AsyncIterator) -> None:
+    aclose = getattr(values, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+async def counted_out_async(values: AsyncIterator, stats: StageStats) -> AsyncIterator:
+    """Count the elements that come out of a stage (closing the stage, if this is closed before it ends)."""
+    try:
+        async for element in values:
+            stats.elements_out += 1
+            yield element
+    finally:
+        await _aclose(values)
+
+
+async def reported_async(values: AsyncIterator, stages: list[StageStats], hook: StatsHook | None) -> AsyncIterator:
+    """Call the <hook> with the statistics once the <values> are exhausted, or closed."""
+    try:
+        async for element in values:
+            yield element
+    finally:
+        # The stages in between are closed too, so they release what they hold (e.g. the tasks of concurrent maps).
+        await _aclose(values)
+        if hook is not None:
+            hook(stages)
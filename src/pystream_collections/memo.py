@@ -0,0 +1,146 @@
+"""Memoization of the mapper functions, for streams with many repeated values."""
+
+import asyncio
+import inspect
+import time
+from collections import OrderedDict
+from typing import Hashable, NamedTuple
+
+from pystream_collections.typedef import KeyFunction, Mapper
+
+_MISSING = object()
+
+
+def _identity(element: object) -> Hashable:
+    return element  # type: ignore[return-value]
+
+
+class CacheInfo(NamedTuple):
+    """
+    The statistics of the cache of a memoized mapper (like the ones of functools.lru_cache).
+
+    Attributes
+    ----------
+        hits (int): How many elements were mapped without calling the function.
+        misses (int): How many times the function was called.
+        maxsize (int | None): The maximum number of results kept (None if unbounded).
+        currsize (int): The number of results currently kept.
+
+    """
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+class MemoCache:
+    """
+    The results of a mapper function by key, evicting the least recently used ones beyond <maxsize>.
+
+    If <ttl> is set, results older than that number of seconds are considered missing (and computed again).
+    """
+
+    def __init__(self, maxsize: int | None = 1024, ttl: float | None = None) -> None:
+        """Create an empty cache."""
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("maxsize must be a positive number")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be a positive number of seconds")
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._results: OrderedDict[Hashable, tuple[object, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> object:
+        """Return the result for the <key>, or _MISSING if it's not there (or expired)."""
+        entry = self._results.get(key)
+        if entry is None:
+            return _MISSING
+        result, expires_at = entry
+        if self._ttl is not None and time.monotonic() >= expires_at:
+            del self._results[key]
+            return _MISSING
+        self._results.move_to_end(key)
+        return result
+
+    def put(self, key: Hashable, result: object) -> None:
+        """Keep the result for the <key>, evicting the least recently used one if the cache is full."""
+        expires_at = time.monotonic() + self._ttl if self._ttl is not None else 0.0
+        self._results[key] = (result, expires_at)
+        self._results.move_to_end(key)
+        if self._maxsize is not None and len(self._results) > self._maxsize:
+            self._results.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        """Return the statistics of the cache."""
+        return CacheInfo(self.hits, self.misses, self._maxsize, len(self._results))
+
+
+def memoized(mapper_fn: Mapper, cache: MemoCache, key: KeyFunction | None = None) -> Mapper:
+    """Wrap the <mapper_fn>, so it's called only for the elements whose <key> isn't in the <cache>."""
+    key_fn = key or _identity
+
+    def _memoized(element: object) -> object:
+        element_key = key_fn(element)
+        result = cache.get(element_key)
+        if result is _MISSING:
+            cache.misses += 1
+            result = mapper_fn(element)
+            cache.put(element_key, result)
+        else:
+            cache.hits += 1
+        return result
+
+    return _memoized
+
+
+def memoized_async(mapper_fn: Mapper, cache: MemoCache, key: KeyFunction | None = None) -> Mapper:
+    """
+    Wrap the (sync or async) <mapper_fn> into a coroutine function that memoizes its results in the <cache>.
+
+    Concurrent calls for the same key share the call in flight, instead of calling the function again. The call is
+    cancelled only if all of the callers waiting for it are cancelled. Errors are propagated to all of them, and not
+    cached.
+    """
+    key_fn = key or _identity
+    in_flight: dict[Hashable, list] = {}
+
+    async def _call(element: object) -> object:
+        result = mapper_fn(element)
+        if inspect.isawaitable(result):
+            return await result
+        return result
+
+    def _settled(element_key: Hashable, future: asyncio.Future) -> None:
+        del in_flight[element_key]
+        if not future.cancelled() and future.exception() is None:
+            cache.put(element_key, future.result())
+
+    async def _memoized(element: object) -> object:
+        element_key = key_fn(element)
+        result = cache.get(element_key)
+        if result is not _MISSING:
+            cache.hits += 1
+            return result
+        call = in_flight.get(element_key)
+        if call is None:
+            cache.misses += 1
+            future = asyncio.ensure_future(_call(element))
+            call = in_flight[element_key] = [future, 0]
+            future.add_done_callback(lambda done: _settled(element_key, done))
+        else:
+            cache.hits += 1
+        future = call[0]
+        call[1] += 1
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if call[1] == 1 and not future.done():
+                future.cancel()
+            raise
+        finally:
+            call[1] -= 1
+
+    return _memoized
@@ -0,0 +1,119 @@
+"""Run the element-wise transformations (and reductions) of a stream over chunks, in a pool of processes."""
+
+import multiprocessing
+import pickle
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, Iterator, NamedTuple
+
+from pystream_collections.enums import OperationType
+from pystream_collections.reduction import reduce_chunk
+from pystream_collections.typedef import Reducer, Transformation
+
+PARALLEL_OPERATIONS = frozenset({OperationType.MAP, OperationType.FILTER})
+
+# Forking a process that is running other threads is unsafe, so the workers start from a clean process instead.
+_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+class ParallelOptions(NamedTuple):
+    """Settings for running the stream in parallel."""
+
+    workers: int
+    chunksize: int
+
+
+def _apply(operations: list[Transformation], values: Iterable) -> list:
+    for op_type, fn in operations:
+        values = map(fn, values) if op_type is OperationType.MAP else filter(fn, values)
+    return list(values)
+
+
+def _reduce(operations: list[Transformation], reducer_fn: Reducer, initial: tuple, values: Iterable) -> tuple:
+    return reduce_chunk(reducer_fn, initial, _apply(operations, values))
+
+
+def _call_pickled(function: Callable, arguments: bytes, chunk: bytes) -> object:
+    return function(*pickle.loads(arguments), pickle.loads(chunk))
+
+
+def _pickle(value: object) -> bytes | None:
+    try:
+        return pickle.dumps(value)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+
+
+def _done(result: list) -> Future:
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+def _in_processes(function: Callable, arguments: tuple, values: Iterable, options: ParallelOptions) -> Iterator:
+    """
+    Yield the result of function(*arguments, chunk) for each chunk of the <values>, computed in a pool of processes.
+
+    The values are read lazily, keeping at most two chunks per worker in flight, and the results are yielded in the
+    same order of the input. If the arguments can't be pickled (e.g. lambdas), everything runs in this process, and
+    so does any chunk whose values can't be pickled.
+    """
+    iterator = iter(values)
+    chunks = iter(lambda: list(islice(iterator, options.chunksize)), [])
+    pickled_arguments = _pickle(arguments)
+    if pickled_arguments is None:
+        for chunk in chunks:
+            yield function(*arguments, chunk)
+        return
+
+    executor = ProcessPoolExecutor(options.workers, mp_context=multiprocessing.get_context(_START_METHOD))
+    pending: deque[Future] = deque()
+    try:
+        for chunk in chunks:
+            pickled_chunk = _pickle(chunk)
+            if pickled_chunk is None:
+                pending.append(_done(function(*arguments, chunk)))
+            else:
+                pending.append(executor.submit(_call_pickled, function, pickled_arguments, pickled_chunk))
+            if len(pending) >= 2 * options.workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def apply_in_processes(operations: list[Transformation], values: Iterable, options: ParallelOptions) -> Iterator:
+    """
+    Apply the map and filter <operations> to <values>, splitting them in chunks that run in a pool of processes.
+
+    The results are yielded in the same order of the input (see _in_processes for the details of the chunks).
+
+    Args:
+    ----
+        operations (list[Transformation]): A run of map and filter operations.
+        values (Iterable): The values to transform.
+        options (ParallelOptions): The number of workers and the size of each chunk.
+
+    Returns:
+    -------
+        Iterator: The transformed values.
+
+    """
+    for results in _in_processes(_apply, (operations,), values, options):
+        yield from results
+
+
+def reduce_in_processes(
+    operations: list[Transformation], values: Iterable, reducer_fn: Reducer, initial: tuple, options: ParallelOptions
+) -> Iterator:
+    """
+    Apply the map and filter <operations> and reduce each chunk of <values> in a pool of processes.
+
+    Only the partial result of each chunk is sent back (in the order of the input), to be combined by the caller.
+    Each chunk starts from the value in <initial> if there's one (so it must be an identity), and the chunks left
+    empty by the filters have no partial result.
+    """
+    for partial in _in_processes(_reduce, (operations, reducer_fn, initial), values, options):
+        yield from partial
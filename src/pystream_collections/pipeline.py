@@ -0,0 +1,115 @@
+"""Reusable chains of transformations, defined once and applied to many sources."""
+
+import functools
+from itertools import islice
+from typing import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, Self
+
+from pystream_collections.async_stream import AsyncStream
+from pystream_collections.base import BaseStream
+from pystream_collections.collectors import Collector, collect
+from pystream_collections.enums import OperationType
+from pystream_collections.plan import fuse, fused_async, limited_async
+from pystream_collections.typedef import Collectable, Filter, Mapper, Transformation
+
+
+def _skipped(values: Iterable, n: int) -> Iterator:
+    return islice(values, n, None)
+
+
+def _limited(values: Iterable, n: int) -> Iterator:
+    return islice(values, n)
+
+
+_SYNC_STAGES: dict[OperationType, Callable] = {
+    OperationType.MAP: lambda fn: functools.partial(map, fn),
+    OperationType.FILTER: lambda fn: functools.partial(filter, fn),
+    OperationType.SKIP: lambda n: functools.partial(_skipped, n=n),
+    OperationType.LIMIT: lambda n: functools.partial(_limited, n=n),
+}
+
+
+class Pipeline(BaseStream):
+    """
+    A chain of transformations that can be applied to any number of sources, synchronous or asynchronous.
+
+    Unlike a stream, a pipeline is not bound to a source, and it's not closed after being used. Each operation
+    returns a new pipeline (so a pipeline can be shared, and extended safely), and the plan to run it is compiled
+    the first time it's used, and reused afterwards.
+
+    Example:
+    -------
+        >>> normalize = Pipeline().map(str.strip).filter(bool).map(str.lower)
+        >>> normalize.collect([" A ", "", "b"])
+        ['a', 'b']
+
+    """
+
+    def __init__(self) -> None:
+        """Create an empty pipeline (with no transformations)."""
+        self._transformations: tuple[Transformation, ...] = ()
+
+    def _extended(self, op_type: OperationType, arg: Callable | int) -> Self:
+        pipeline = type(self)()
+        pipeline._transformations = (*self._transformations, (op_type, arg))
+        return pipeline
+
+    def map(self, mapper_fn: Mapper) -> Self:
+        """Return a new pipeline with the mapper function added at the end."""
+        return self._extended(OperationType.MAP, mapper_fn)
+
+    def filter(self, filter_fn: Filter) -> Self:
+        """Return a new pipeline with the filter function added at the end."""
+        return self._extended(OperationType.FILTER, filter_fn)
+
+    def skip(self, n: int) -> Self:
+        """Return a new pipeline that skips <n> elements at the end of the current one."""
+        if n < 0:
+            raise ValueError("The number of elements to skip cannot be a negative number")
+        return self._extended(OperationType.SKIP, n)
+
+    def limit(self, n: int) -> Self:
+        """Return a new pipeline that keeps only the first <n> elements at the end of the current one."""
+        if n < 0:
+            raise ValueError("The limit cannot be a negative number")
+        return self._extended(OperationType.LIMIT, n)
+
+    @functools.cached_property
+    def _sync_stages(self) -> tuple[Callable[[Iterable], Iterable], ...]:
+        return tuple(_SYNC_STAGES[op_type](arg) for op_type, arg in self._transformations)
+
+    @functools.cached_property
+    def _async_stages(self) -> tuple[Callable[[AsyncIterator], AsyncIterator], ...]:
+        stages = []
+        for fusible, operations in fuse(self._transformations):
+            if fusible:
+                stages.append(functools.partial(fused_async, operations))
+                continue
+            stages.extend(functools.partial(limited_async, n=n) for _, n in operations)
+        return tuple(stages)
+
+    def __call__(self, source: Iterable) -> Iterator:
+        """Apply the pipeline to the (synchronous) <source>, returning a lazy iterator with the results."""
+        values = iter(source)
+        for stage in self._sync_stages:
+            values = stage(values)
+        return values
+
+    def apply_async(self, source: AsyncIterable) -> AsyncIterator:
+        """Apply the pipeline to the asynchronous <source>, returning a lazy async iterator with the results."""
+        values = source.__aiter__()
+        for stage in self._async_stages:
+            values = stage(values)
+        return values
+
+    def collect(self, source: Iterable, collectable_type: type[Collectable] | Collector = list) -> Collectable:
+        """Apply the pipeline to the <source>, and return the results into a collectable (by default a list)."""
+        values = self(source)
+        if isinstance(collectable_type, Collector):
+            return collect(collectable_type, values)
+        return collectable_type(values)
+
+    async def collect_async(
+        self, source: AsyncIterable, collectable_type: type[Collectable] | Collector = list
+    ) -> Collectable:
+        """Apply the pipeline to the asynchronous <source>, and return the results into a collectable."""
+        return await AsyncStream(self.apply_async(source)).collect(collectable_type)
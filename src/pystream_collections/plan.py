@@ -0,0 +1,131 @@
+"""Planning of the transformations registered on a stream, before running them."""
+
+from itertools import groupby
+from typing import AsyncIterator, Collection, Iterable, Iterator
+
+from pystream_collections.enums import OperationType
+from pystream_collections.typedef import Transformation
+
+FUSIBLE_OPERATIONS = frozenset({OperationType.MAP, OperationType.FILTER, OperationType.SKIP})
+
+# Sources that are kept as they are (instead of an iterator over them), because they can be sliced and measured.
+SLICEABLE_TYPES = (list, tuple, range)
+
+
+def fuse(
+    transformations: Iterable[Transformation], fusible_operations: frozenset[OperationType] = FUSIBLE_OPERATIONS
+) -> Iterator[tuple[bool, list[Transformation]]]:
+    """
+    Split the <transformations> into consecutive groups, flagging the ones that can be fused into a single loop.
+
+    Consecutive map, filter, and skip operations are all applied element by element, so they can run in the same
+    loop instead of each one wrapping the previous iterator.
+
+    Args:
+    ----
+        transformations (Iterable[Transformation]): The (operation type, function) pairs, in the order registered.
+        fusible_operations (frozenset[OperationType]): The operation types that can be grouped together.
+
+    Returns:
+    -------
+        Iterator[tuple[bool, list[Transformation]]]: Pairs of (fusible, transformations) for each group.
+
+    """
+    for fusible, group in groupby(transformations, key=lambda transformation: transformation[0] in fusible_operations):
+        yield fusible, list(group)
+
+
+def _rewritten(transformations: Iterable[Transformation], hoistable: Collection[int]) -> list[Transformation]:
+    """Merge consecutive skips (and limits), and move the <hoistable> filters ahead of the maps right before them."""
+    skip, limit = OperationType.SKIP, OperationType.LIMIT
+    result: list[Transformation] = []
+    for index, (op_type, arg) in enumerate(transformations):
+        previous_type, previous_arg = result[-1] if result else (None, None)
+        if op_type in (skip, limit) and op_type is previous_type and arg >= 0 and previous_arg >= 0:
+            result[-1] = (op_type, previous_arg + arg if op_type is skip else min(previous_arg, arg))
+            continue
+        position = len(result)
+        if op_type is OperationType.FILTER and index in hoistable:
+            while position and result[position - 1][0] is OperationType.MAP:
+                position -= 1
+        result.insert(position, (op_type, arg))
+    return result
+
+
+def optimize(
+    source: Iterable, transformations: Iterable[Transformation], hoistable: Collection[int] = ()
+) -> tuple[Iterable, list[Transformation]]:
+    """
+    Rewrite the <transformations> of a stream into an equivalent plan that does less work over the <source>.
+
+    Consecutive skips are added up, and consecutive limits keep the smallest one. The filters in <hoistable> (by
+    their index) give the same result before the maps registered right before them, so they're moved ahead of those,
+    and the maps are not called for the values they exclude. If the source can be sliced (see SLICEABLE_TYPES), the
+    skips and limits at the start are applied by slicing it, instead of reading the values one by one.
+
+    Args:
+    ----
+        source (Iterable): The values of the stream.
+        transformations (Iterable[Transformation]): The (operation type, argument) pairs, in the order registered.
+        hoistable (Collection[int]): The indexes of the filters that can run before the maps that precede them.
+
+    Returns:
+    -------
+        tuple[Iterable, list[Transformation]]: The (possibly sliced) source, and the transformations left to apply.
+
+    """
+    plan = _rewritten(transformations, hoistable)
+    if not isinstance(source, SLICEABLE_TYPES):
+        return source, plan
+    start = 0
+    while start < len(plan) and plan[start][0] in (OperationType.SKIP, OperationType.LIMIT) and plan[start][1] >= 0:
+        op_type, n = plan[start]
+        source = source[n:] if op_type is OperationType.SKIP else source[:n]
+        start += 1
+    return source, plan[start:]
+
+
+def _prepare(operations: list[Transformation]) -> tuple[tuple[OperationType, object], ...]:
+    # The skips keep a mutable counter, so every run starts with its own state.
+    return tuple((op_type, [arg] if op_type is OperationType.SKIP else arg) for op_type, arg in operations)
+
+
+async def fused_async(operations: list[Transformation], values: AsyncIterator) -> AsyncIterator:
+    """
+    Apply a group of fusible <operations> to <values> in a single loop.
+
+    Args:
+    ----
+        operations (list[Transformation]): A run of map, filter, and skip operations.
+        values (AsyncIterator): The async iterator with the values to transform.
+
+    Returns:
+    -------
+        AsyncIterator: The transformed values.
+
+    """
+    steps = _prepare(operations)
+    map_op, filter_op = OperationType.MAP, OperationType.FILTER
+    async for element in values:
+        for op_type, arg in steps:
+            if op_type is map_op:
+                element = arg(element)
+            elif op_type is filter_op:
+                if not arg(element):
+                    break
+            elif arg[0] > 0:
+                arg[0] -= 1
+                break
+        else:
+            yield element
+
+
+async def limited_async(values: AsyncIterator, n: int) -> AsyncIterator:
+    """Yield the first <n> <values>, without requesting any further one from the async iterator."""
+    if n <= 0:
+        return
+    async for element in values:
+        yield element
+        n -= 1
+        if n == 0:
+            return
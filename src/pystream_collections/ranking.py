@@ -0,0 +1,80 @@
+"""The k largest (or smallest) elements of a stream, kept in a bounded heap in a single pass."""
+
+import heapq
+import operator
+from itertools import count
+from typing import AsyncIterator
+
+from pystream_collections.typedef import KeyFunction
+
+
+class _Reversed:
+    """A key whose order is the opposite of the wrapped one, to keep the smallest elements in a min-heap."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: object) -> None:
+        self.value = value
+
+    def __lt__(self, other: "_Reversed") -> bool:
+        return other.value < self.value  # type: ignore[operator]
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Reversed) and self.value == other.value
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class Ranking:
+    """
+    The <k> largest elements seen so far (or smallest, if not <largest>), by <key>.
+
+    It takes O(log k) time per element, and O(k) memory. Like heapq.nlargest and heapq.nsmallest, among elements with
+    equal keys the ones seen first are kept (and come first in the result).
+    """
+
+    def __init__(self, k: int, key: KeyFunction | None = None, largest: bool = True) -> None:
+        """Create an empty ranking."""
+        if k < 0:
+            raise ValueError("k cannot be a negative number")
+        self._k = k
+        self._key = key
+        self._largest = largest
+        self._heap: list[tuple] = []
+        self._counter = count()
+
+    def add(self, element: object) -> bool:
+        """Consider the <element> for the ranking, and return whether it was included in it."""
+        if not self._k:
+            return False
+        sort_key = element if self._key is None else self._key(element)
+        if not self._largest:
+            sort_key = _Reversed(sort_key)
+        return self._push(sort_key, element)
+
+    def _push(self, sort_key: object, element: object) -> bool:
+        # Among equal keys, the most recent element is the first to go.
+        entry = (sort_key, -next(self._counter), element)
+        if len(self._heap) < self._k:
+            heapq.heappush(self._heap, entry)
+            return True
+        return heapq.heappushpop(self._heap, entry) is not entry
+
+    def merge(self, other: "Ranking") -> "Ranking":
+        """Add the elements of the <other> ranking (of the same kind, with elements seen after these) to this one."""
+        # In the order they were seen (not the order of the heap), so the ties are resolved in the same way.
+        for sort_key, _, element in sorted(other._heap, key=operator.itemgetter(1), reverse=True):
+            self._push(sort_key, element)
+        return self
+
+    def result(self) -> list:
+        """Return the elements of the ranking, in order (largest first, or smallest first)."""
+        return [element for *_, element in sorted(self._heap, reverse=True)]
+
+
+async def running_ranking(values: AsyncIterator, k: int, key: KeyFunction | None, largest: bool) -> AsyncIterator:
+    """Yield the current ranking of the <values> read so far, every time it changes."""
+    ranking = Ranking(k, key, largest)
+    async for element in values:
+        if ranking.add(element):
+            yield ranking.result()
@@ -0,0 +1,81 @@
+"""Associative reductions: chunks reduced independently, and their partial results combined in a balanced tree."""
+
+import functools
+import inspect
+from typing import AsyncIterable, Callable, Iterable
+
+
+def _push(stack: list[tuple[int, object]], partial: object, combiner: Callable) -> None:
+    """
+    Add the <partial> result to the <stack> of (level, result) pairs, combining results of the same level.
+
+    This works like a binary counter: each result at a level combines two of the level below, so the results are
+    combined in a balanced tree (in order, left with right), keeping O(log n) of them at once.
+    """
+    level = 0
+    while stack and stack[-1][0] == level:
+        _, left = stack.pop()
+        partial = combiner(left, partial)
+        level += 1
+    stack.append((level, partial))
+
+
+def _fold(stack: list[tuple[int, object]], combiner: Callable) -> tuple:
+    if not stack:
+        return ()
+    _, result = stack.pop()
+    while stack:
+        _, left = stack.pop()
+        result = combiner(left, result)
+    return (result,)
+
+
+def combine_in_tree(partials: Iterable, combiner: Callable) -> tuple:
+    """Combine the <partials>, returning a tuple with the result (or an empty one if there were no partials)."""
+    stack: list[tuple[int, object]] = []
+    for partial in partials:
+        _push(stack, partial, combiner)
+    return _fold(stack, combiner)
+
+
+def reduce_chunk(reducer_fn: Callable, initial: tuple, chunk: list) -> tuple:
+    """Reduce the <chunk> (from the value in <initial>, if any), returning a tuple with the result (if there's one)."""
+    if not initial and not chunk:
+        return ()
+    return (functools.reduce(reducer_fn, chunk, *initial),)
+
+
+async def _resolved(value: object) -> object:
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+async def combine_in_tree_async(partials: AsyncIterable, combiner: Callable) -> tuple:
+    """Combine the async <partials> in a tree, with a <combiner> that can be a coroutine function."""
+    stack: list[tuple[int, object]] = []
+    async for partial in partials:
+        level = 0
+        while stack and stack[-1][0] == level:
+            _, left = stack.pop()
+            partial = await _resolved(combiner(left, partial))
+            level += 1
+        stack.append((level, partial))
+    if not stack:
+        return ()
+    _, result = stack.pop()
+    while stack:
+        _, left = stack.pop()
+        result = await _resolved(combiner(left, result))
+    return (result,)
+
+
+async def reduce_chunk_async(reducer_fn: Callable, initial: tuple, chunk: list) -> tuple:
+    """Reduce the <chunk> with a <reducer_fn> that can be a coroutine function (from the value in <initial>, if any)."""
+    if not initial and not chunk:
+        return ()
+    values = iter(chunk)
+    result = initial[0] if initial else next(values)
+    for element in values:
+        result = await _resolved(reducer_fn(result, element))
+    return (result,)
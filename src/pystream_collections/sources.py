@@ -0,0 +1,165 @@
+"""Sources of values read from files and byte streams, in bulk, without going through the text layer."""
+
+import mmap
+import os
+import struct
+from typing import AsyncIterator, Iterator, Literal, Protocol
+
+FileMode = Literal["lines", "records", "chunks"]
+Framing = Literal["lines", "length-prefixed", "fixed"]
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+DEFAULT_READ_SIZE = 1 << 16
+
+
+class AsyncReader(Protocol):
+    """Anything that reads bytes asynchronously, like asyncio.StreamReader (an empty result means the end)."""
+
+    async def read(self, n: int = -1) -> bytes:
+        """Read up to <n> bytes."""
+        ...
+
+
+def read_chunks(path: str | os.PathLike, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Read the file in blocks of (up to) <chunk_size> bytes."""
+    with open(path, "rb") as file:
+        while chunk := file.read(chunk_size):
+            yield chunk
+
+
+def read_lines(
+    path: str | os.PathLike, delimiter: bytes = b"\n", chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Split the file on the <delimiter>, yielding each line as bytes (without the delimiter).
+
+    The file is read in large blocks, which are split all at once, instead of line by line. The last line is yielded
+    even if it doesn't end with the delimiter.
+    """
+    rest = b""
+    for chunk in read_chunks(path, chunk_size):
+        lines = (rest + chunk).split(delimiter)
+        rest = lines.pop()
+        yield from lines
+    if rest:
+        yield rest
+
+
+def read_records(path: str | os.PathLike, record_size: int) -> Iterator[memoryview]:
+    """
+    Map the file into memory, and yield a memoryview of each record of <record_size> bytes, without copying them.
+
+    The views are valid while the memory map is open, so the records that need to be kept after the stream is done
+    must be copied (e.g. with bytes()). Raise ValueError if the size of the file is not a multiple of <record_size>.
+    """
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size % record_size:
+            raise ValueError(f"the size of the file ({size}) is not a multiple of the record size ({record_size})")
+        if not size:
+            return
+        memory = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(memory)
+    try:
+        for start in range(0, size, record_size):
+            yield view[start : start + record_size]
+    finally:
+        view.release()
+        try:
+            memory.close()
+        except BufferError:
+            # Some records are still referenced: the map is released once they're garbage collected.
+            pass
+
+
+def read_file(
+    path: str | os.PathLike,
+    mode: FileMode = "lines",
+    delimiter: bytes = b"\n",
+    record_size: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[bytes] | Iterator[memoryview]:
+    """Return the iterator that reads the file in the given <mode> (see Stream.from_file)."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive number")
+    if mode == "lines":
+        if not delimiter:
+            raise ValueError("delimiter cannot be empty")
+        return read_lines(path, delimiter, chunk_size)
+    if mode == "records":
+        if record_size is None or record_size < 1:
+            raise ValueError("record_size must be a positive number to read records")
+        return read_records(path, record_size)
+    if mode == "chunks":
+        return read_chunks(path, chunk_size)
+    raise ValueError(f"unknown mode {mode!r}, expected one of 'lines', 'records', 'chunks'")
+
+
+async def _read_chunks_async(reader: AsyncReader, read_size: int) -> AsyncIterator[bytes]:
+    while chunk := await reader.read(read_size):
+        yield chunk
+
+
+async def _split_lines_async(chunks: AsyncIterator[bytes], delimiter: bytes) -> AsyncIterator[bytes]:
+    rest = b""
+    async for chunk in chunks:
+        lines = (rest + chunk).split(delimiter)
+        rest = lines.pop()
+        for line in lines:
+            yield line
+    if rest:
+        yield rest
+
+
+async def _split_fixed_async(chunks: AsyncIterator[bytes], record_size: int) -> AsyncIterator[bytes]:
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer += chunk
+        end = len(buffer) - len(buffer) % record_size
+        for start in range(0, end, record_size):
+            yield bytes(buffer[start : start + record_size])
+        del buffer[:end]
+    if buffer:
+        raise ValueError(f"the stream ended with an incomplete record of {len(buffer)} bytes")
+
+
+async def _split_length_prefixed_async(chunks: AsyncIterator[bytes], header: struct.Struct) -> AsyncIterator[bytes]:
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer += chunk
+        start = 0
+        while len(buffer) - start >= header.size:
+            (length,) = header.unpack_from(buffer, start)
+            end = start + header.size + length
+            if end > len(buffer):
+                break
+            yield bytes(buffer[start + header.size : end])
+            start = end
+        del buffer[:start]
+    if buffer:
+        raise ValueError(f"the stream ended with an incomplete frame of {len(buffer)} bytes")
+
+
+def read_frames_async(
+    reader: AsyncReader,
+    framing: Framing = "lines",
+    delimiter: bytes = b"\n",
+    record_size: int | None = None,
+    length_format: str = "!I",
+    read_size: int = DEFAULT_READ_SIZE,
+) -> AsyncIterator[bytes]:
+    """Return the async iterator that reads the frames of the <reader> (see AsyncStream.from_reader)."""
+    if read_size < 1:
+        raise ValueError("read_size must be a positive number")
+    chunks = _read_chunks_async(reader, read_size)
+    if framing == "lines":
+        if not delimiter:
+            raise ValueError("delimiter cannot be empty")
+        return _split_lines_async(chunks, delimiter)
+    if framing == "fixed":
+        if record_size is None or record_size < 1:
+            raise ValueError("record_size must be a positive number for fixed-size framing")
+        return _split_fixed_async(chunks, record_size)
+    if framing == "length-prefixed":
+        return _split_length_prefixed_async(chunks, struct.Struct(length_format))
+    raise ValueError(f"unknown framing {framing!r}, expected one of 'lines', 'length-prefixed', 'fixed'")
@@ -1,14 +1,42 @@
 """Definitions for the abstractions of Stream over regular iterators."""
 
 import functools
+import heapq
+import os
 from itertools import islice
 from typing import Callable, Iterable, Self
 
 from pystream_collections.base import BaseStream
+from pystream_collections.batching import batched, on_array, unbatched
+from pystream_collections.cache import StreamCache
+from pystream_collections.collectors import Collector, collect
+from pystream_collections.compat import require_numpy
 from pystream_collections.enums import OperationType
-from pystream_collections.typedef import Collectable, Filter, Mapper, Reducer
+from pystream_collections.external import distinct_external, grouped_external, sorted_external
+from pystream_collections.instrumentation import (
+    INSTRUMENTED_CALLABLES,
+    StageStats,
+    StatsHook,
+    counted_in,
+    counted_out,
+    reported,
+    timed,
+)
+from pystream_collections.memo import CacheInfo, MemoCache, memoized
+from pystream_collections.parallel import (
+    PARALLEL_OPERATIONS,
+    ParallelOptions,
+    apply_in_processes,
+    reduce_in_processes,
+)
+from pystream_collections.plan import SLICEABLE_TYPES, fuse, optimize
+from pystream_collections.reduction import combine_in_tree, reduce_chunk
+from pystream_collections.sources import DEFAULT_CHUNK_SIZE, FileMode, read_file
+from pystream_collections.tee import teed
+from pystream_collections.typedef import Collectable, Filter, KeyFunction, Mapper, Reducer, Transformation
 
 _NOT_SET = object()
+_REDUCE_CHUNKSIZE = 1024
 
 
 def _is_iterable(value: Iterable) -> bool:
@@ -22,6 +50,8 @@ def _is_iterable(value: Iterable) -> bool:
 def _parse_stream_parameters(*values) -> Iterable:
     if len(values) == 1:
         (sole_parameter,) = values
+        if isinstance(sole_parameter, SLICEABLE_TYPES):
+            return sole_parameter
         if _is_iterable(sole_parameter):
             return iter(sole_parameter)
         return (sole_parameter,)
@@ -34,9 +64,34 @@ class Stream(BaseStream):
     def __init__(self, *values) -> None:
         """Initialize with a sequence of values."""
         self._wrapped = _parse_stream_parameters(*values)
-        self._transformations = []
+        self._transformations: list[Transformation] = []
+        self._independent_filters: set[int] = set()
+        self._parallel: ParallelOptions | None = None
+        self._instrumented = False
+        self._stats: list[StageStats] | None = None
+        self._stats_hook: StatsHook | None = None
+        self._memo_caches: list[MemoCache] = []
         self._is_closed = False
 
+    @classmethod
+    def from_file(
+        cls,
+        path: str | os.PathLike,
+        mode: FileMode = "lines",
+        delimiter: bytes = b"\n",
+        record_size: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Self:
+        """
+        Create a stream with the contents of a (binary) file, read in bulk.
+
+        In "lines" mode the values are the bytes between each <delimiter> (they can be decoded later, by a mapper that
+        needs the text). In "records" mode, the file is mapped into memory and the values are memoryviews of each
+        record of <record_size> bytes, without copying them. In "chunks" mode, the values are blocks of <chunk_size>
+        bytes. The file is read lazily, as the stream is consumed.
+        """
+        return cls(read_file(path, mode, delimiter, record_size, chunk_size))
+
     def _validate_is_not_closed(self) -> None:
         if self._is_closed:
             raise ValueError("Stream is closed and cannot be further chained")
@@ -54,64 +109,398 @@ class Stream(BaseStream):
         self._transformations.append((OperationType.MAP, mapper_fn))
         return self
 
-    def filter(self, filter_fn: Filter) -> Self:
+    def filter(self, filter_fn: Filter, independent: bool = False) -> Self:
         """
 
         Pass a filtering function to exclude values from this step of the stream onwards.
 
-        The function should evaluate to a boolean value.
+        The function should evaluate to a boolean value. If it's <independent> of the maps registered right before it
+        (it gives the same result on the values they take, e.g. it checks a field that they don't change), it's applied
+        ahead of them, so they're not called for the values it excludes.
         """
         self._validate_is_not_closed()
+        if independent:
+            self._independent_filters.add(len(self._transformations))
         self._transformations.append((OperationType.FILTER, filter_fn))
         return self
 
-    def reduce(self, reducer_fn: Reducer, initial: object = _NOT_SET) -> object:
+    def map_cached(
+        self, mapper_fn: Mapper, key: KeyFunction | None = None, maxsize: int | None = 1024, ttl: float | None = None
+    ) -> Self:
+        """
+        Add a mapper function whose results are memoized, so it's not called again for repeated values.
+
+        The results are kept by <key> (the value itself by default, so it must be hashable), up to <maxsize> of them,
+        evicting the least recently used ones (unbounded if None). If <ttl> is given, results older than that number of
+        seconds are computed again. The hits and misses are reported by .cache_info().
+        """
+        self._validate_is_not_closed()
+        cache = MemoCache(maxsize, ttl)
+        self._memo_caches.append(cache)
+        self._transformations.append((OperationType.MAP, memoized(mapper_fn, cache, key)))
+        return self
+
+    def cache_info(self) -> list[CacheInfo]:
+        """Return the statistics of the cache of each .map_cached() stage, in the order they were registered."""
+        return [cache.info() for cache in self._memo_caches]
+
+    def parallel(self, workers: int | None = None, chunksize: int = 1024) -> Self:
+        """
+        Run the map and filter operations of this stream in a pool of processes.
+
+        The values are sent to the workers in chunks, read lazily from the source, and the results keep the order of
+        the input. The functions (and the values) must be picklable for this to take effect (e.g. lambdas aren't),
+        otherwise they're processed serially in the current process. The rest of the operations (e.g. skip, reduce,
+        collect) keep running in the current process, with the same semantics.
+
+        Args:
+        ----
+            workers (int | None): The number of processes to use. Defaults to the number of CPUs.
+            chunksize (int): How many values are sent to a worker at once.
+
+        Returns:
+        -------
+            Self: A reference to this same object, set to run in parallel.
+
+        """
+        self._validate_is_not_closed()
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be a positive number")
+        if chunksize < 1:
+            raise ValueError("chunksize must be a positive number")
+        self._parallel = ParallelOptions(workers or os.cpu_count() or 1, chunksize)
+        return self
+
+    def instrument(self, hook: StatsHook | None = None) -> Self:
+        """
+        Keep statistics of each stage of the stream: elements in and out, and time spent in the functions.
+
+        The statistics are available in the .stats attribute (one entry per operation, in the order they were
+        registered) and, if a <hook> is given, it's called with them once the final operation is done reading the
+        stream. An instrumented stream runs all of its operations in the current process (even if it's parallel).
+        """
+        self._validate_is_not_closed()
+        self._instrumented = True
+        self._stats_hook = hook
+        return self
+
+    @property
+    def stats(self) -> list[StageStats] | None:
+        """Return the statistics of each stage, if the stream is instrumented (they're filled in as it runs)."""
+        return self._stats
+
+    def reduce(
+        self,
+        reducer_fn: Reducer,
+        initial: object = _NOT_SET,
+        associative: bool = False,
+        combiner: Reducer | None = None,
+    ) -> object:
         """
         Reduce the stream to a final value based on the provided operation.
 
         The reducer function takes two arguments and resolves into a single value. This function is used to apply
         the reduction over the values the stream has so far.
 
+        If the reducer is <associative> (e.g. sum, max, merging Counters), the values are reduced in chunks
+        independently (in the pool of processes, along with the map and filter operations at the end of the stream,
+        if it's parallel), and the partial results are combined in a balanced tree. A <combiner> of partial results
+        can be given if they're not of the same type of the elements: then each chunk is reduced from the <initial>
+        value, which must be an identity of the <combiner> (and not be mutated by the reducer).
+
         This action is FINAL, meaning the stream returns a value after this call and cannot be further chained upon.
         """
         self._validate_is_not_closed()
+        if associative:
+            return self._reduce_associative(reducer_fn, initial, combiner)
         transformations = self._apply_transformations()
         self._close()
         if initial is _NOT_SET:
             return functools.reduce(reducer_fn, transformations)
         return functools.reduce(reducer_fn, transformations, initial)
 
+    def _reduce_associative(self, reducer_fn: Reducer, initial: object, combiner: Reducer | None) -> object:
+        if combiner is not None and initial is _NOT_SET:
+            raise ValueError("An initial value (an identity of the combiner) is required to reduce with a combiner")
+        chunk_initial = (initial,) if combiner is not None else ()
+        if self._parallel is None or self._instrumented:
+            chunks = batched(self._apply_transformations(), _REDUCE_CHUNKSIZE)
+            partials = (partial for chunk in chunks for partial in reduce_chunk(reducer_fn, chunk_initial, chunk))
+        else:
+            end = len(self._transformations)
+            while end and self._transformations[end - 1][0] in PARALLEL_OPERATIONS:
+                end -= 1
+            values = self._apply_transformations(self._transformations[:end])
+            operations = self._transformations[end:]
+            partials = reduce_in_processes(operations, values, reducer_fn, chunk_initial, self._parallel)
+        self._close()
+        result = combine_in_tree(partials, combiner or reducer_fn)
+        if initial is _NOT_SET:
+            if not result:
+                raise TypeError("reduce() of empty iterable with no initial value")
+            return result[0]
+        if combiner is not None:
+            return result[0] if result else initial
+        return reducer_fn(initial, result[0]) if result else initial
+
     def skip(self, n: int) -> Self:
         """Skip <n> elements from the current stream."""
         self._validate_is_not_closed()
+        self._transformations.append((OperationType.SKIP, n))
+        return self
+
+    def limit(self, n: int) -> Self:
+        """Keep only the first <n> elements of the current stream, without reading any further."""
+        self._validate_is_not_closed()
+        if n < 0:
+            raise ValueError("The limit cannot be a negative number")
+        self._transformations.append((OperationType.LIMIT, n))
+        return self
+
+    def batch(self, n: int) -> Self:
+        """Group the elements of the current stream into lists of <n> elements (the last one can be shorter)."""
+        self._validate_is_not_closed()
+        if n < 1:
+            raise ValueError("The size of the batch must be a positive number")
+        self._transformations.append((OperationType.BATCH, functools.partial(batched, n=n)))
+        return self
+
+    def unbatch(self) -> Self:
+        """Flatten the elements of the current stream (e.g. batches) back into single values."""
+        self._validate_is_not_closed()
+        self._transformations.append((OperationType.UNBATCH, unbatched))
+        return self
+
+    def map_batches(self, batch_fn: Mapper, size: int, as_array: bool = False) -> Self:
+        """
+        Transform the elements in batches of <size>, with a function that takes a batch and returns the new values.
+
+        This allows using vectorized functions or bulk APIs, calling Python once per batch, instead of once per element.
+        The batches are lists, or numpy arrays if <as_array> is set (this requires numpy). The values returned by
+        <batch_fn> are flattened back into the stream.
+        """
+        self._validate_is_not_closed()
+        if as_array:
+            require_numpy()
+            batch_fn = functools.partial(on_array, batch_fn)
+        return self.batch(size).map(batch_fn).unbatch()
 
-        def fn(list_of_values: Iterable) -> Iterable:
-            return islice(list_of_values, n, None)
+    @staticmethod
+    def _validate_memory_budget(max_in_memory: int | None) -> None:
+        if max_in_memory is not None and max_in_memory < 1:
+            raise ValueError("max_in_memory must be a positive number")
 
-        self._transformations.append((OperationType.SKIP, fn))
+    def sorted(self, key: KeyFunction | None = None, reverse: bool = False, max_in_memory: int | None = None) -> Self:
+        """
+        Sort the elements of the current stream (stably, like the builtin sorted).
+
+        If <max_in_memory> is given, at most that number of elements are kept in memory: the rest are sorted in runs
+        that are spilled to temporary files (so the elements need to be picklable), and merged lazily afterwards.
+        """
+        self._validate_is_not_closed()
+        self._validate_memory_budget(max_in_memory)
+        stage = functools.partial(sorted_external, key=key, reverse=reverse, max_in_memory=max_in_memory)
+        self._transformations.append((OperationType.SORT, stage))
         return self
 
-    def _reducer(self, values: Iterable, operation_type: OperationType, transformation: Callable) -> Iterable:
+    def group_by(self, key: KeyFunction, max_in_memory: int | None = None) -> Self:
+        """
+        Group the elements of the current stream by <key>, into (key, list of elements) pairs, sorted by key.
+
+        The keys must be orderable. The grouping is done by sorting the stream with .sorted(), so <max_in_memory>
+        bounds the memory in the same way (except for the elements of the group being yielded).
+        """
+        self._validate_is_not_closed()
+        self._validate_memory_budget(max_in_memory)
+        stage = functools.partial(grouped_external, key=key, max_in_memory=max_in_memory)
+        self._transformations.append((OperationType.GROUP_BY, stage))
+        return self
+
+    def distinct(self, key: KeyFunction | None = None, max_in_memory: int | None = None) -> Self:
+        """
+        Keep only the first occurrence of each element (or of each <key> of them), preserving their order.
+
+        If there are more than <max_in_memory> distinct keys, the rest of the stream is de-duplicated with external
+        sorts, which requires the keys to be orderable (and the elements picklable).
+        """
+        self._validate_is_not_closed()
+        self._validate_memory_budget(max_in_memory)
+        stage = functools.partial(distinct_external, key=key, max_in_memory=max_in_memory)
+        self._transformations.append((OperationType.DISTINCT, stage))
+        return self
+
+    def _reducer(self, values: Iterable, operation_type: OperationType, transformation: Callable | int) -> Iterable:
         match operation_type:
             case OperationType.MAP:
                 return map(transformation, values)
             case OperationType.FILTER:
                 return filter(transformation, values)
             case OperationType.SKIP:
+                return islice(values, transformation, None)
+            case OperationType.LIMIT:
+                return islice(values, transformation)
+            case (
+                OperationType.BATCH
+                | OperationType.UNBATCH
+                | OperationType.SORT
+                | OperationType.GROUP_BY
+                | OperationType.DISTINCT
+            ):
                 return transformation(values)
             case _:
                 raise ValueError("Operation not supported")
 
-    def _apply_transformations(self) -> Iterable:
+    def _apply_instrumented(self) -> Iterable:
+        self._stats = [StageStats(op_type) for op_type, _ in self._transformations]
         result = self._wrapped
-        for op_type, tx in self._transformations:
-            result = self._reducer(result, op_type, tx)
+        for stats, (op_type, tx) in zip(self._stats, self._transformations):
+            if op_type in INSTRUMENTED_CALLABLES:
+                tx = timed(tx, stats)
+            result = counted_out(self._reducer(counted_in(result, stats), op_type, tx), stats)
+        return reported(result, self._stats, self._stats_hook)
+
+    def _apply_transformations(self, transformations: list[Transformation] | None = None) -> Iterable:
+        if self._instrumented:
+            return self._apply_instrumented()
+        if transformations is None:
+            transformations = self._transformations
+        result, transformations = optimize(self._wrapped, transformations, self._independent_filters)
+        if self._parallel is None:
+            for op_type, tx in transformations:
+                result = self._reducer(result, op_type, tx)
+            return result
+
+        for parallel, operations in fuse(transformations, PARALLEL_OPERATIONS):
+            if parallel:
+                result = apply_in_processes(operations, result, self._parallel)
+                continue
+            for op_type, tx in operations:
+                result = self._reducer(result, op_type, tx)
         return result
 
-    def collect[TCollectable](self, collectable_type: type[Collectable] = list) -> Collectable:
-        """Return the all processed values (based on previous operation) into a final collectable (by default list)."""
+    def collect[TCollectable](self, collectable_type: type[Collectable] | Collector = list) -> Collectable:
+        """
+        Return the all processed values (based on previous operation) into a final collectable (by default list).
+
+        Instead of a type, a Collector (see the collectors module) can be given, to build the result element by element.
+        """
         self._validate_is_not_closed()
         result = self._apply_transformations()
-        result = collectable_type(result)
+        if isinstance(collectable_type, Collector):
+            result = collect(collectable_type, result)
+        elif collectable_type is not list or type(result) is not list or result is self._wrapped:
+            # (a slice of the source is already a new list)
+            result = collectable_type(result)
+        self._close()
+        return result
+
+    def cache(self, max_in_memory: int | None = None) -> StreamCache:
+        """
+        Memoize the values of the stream at this point, so they can be replayed by other streams forked from it.
+
+        The values are computed lazily, and only once: call .fork() on the result to get new streams that replay them
+        (e.g. to compute several aggregates from the same source). If <max_in_memory> is given, the values beyond that
+        number are spilled to a temporary file. This action is FINAL for this stream.
+        """
+        self._validate_is_not_closed()
+        if max_in_memory is not None and max_in_memory < 0:
+            raise ValueError("max_in_memory cannot be a negative number")
+        result = StreamCache(iter(self._apply_transformations()), type(self), max_in_memory)
+        self._close()
+        return result
+
+    def tee(self, n: int = 2, max_buffered: int | None = None) -> tuple[Self, ...]:
+        """
+        Split the stream into <n> new streams, that share a single pass over the values of this one.
+
+        The values read by some of the new streams but not by all of them yet are kept in a buffer, so they have to be
+        read at a similar pace (e.g. in lockstep, or alternating them), or the buffer grows up to the whole stream. If
+        <max_buffered> is given, reading a value when the buffer has that many elements raises ValueError.
+        This action is FINAL for this stream.
+        """
+        self._validate_is_not_closed()
+        if n < 1:
+            raise ValueError("The number of streams must be a positive number")
+        if max_buffered is not None and max_buffered < 1:
+            raise ValueError("max_buffered must be a positive number")
+        branches = teed(self._apply_transformations(), n, max_buffered)
+        self._close()
+        return tuple(type(self)(branch) for branch in branches)
+
+    def first(self, default: object = _NOT_SET) -> object:
+        """
+        Return the first element of the stream, or <default> if it's empty.
+
+        If the stream is empty and there's no default value, a ValueError is raised. This action is FINAL.
+        """
+        self._validate_is_not_closed()
+        result = next(iter(self._apply_transformations()), default)
+        self._close()
+        if result is _NOT_SET:
+            raise ValueError("Cannot get the first element of an empty stream with no default value.")
+        return result
+
+    def find(self, filter_fn: Filter, default: object = None) -> object:
+        """
+        Return the first element for which <filter_fn> is true, or <default> if there's none.
+
+        Nothing else is read from the stream once the element is found. This action is FINAL.
+        """
+        self._validate_is_not_closed()
+        result = next(filter(filter_fn, self._apply_transformations()), default)
+        self._close()
+        return result
+
+    def any(self, filter_fn: Filter = bool) -> bool:
+        """Return True if <filter_fn> is true for at least one element (stopping at it). This action is FINAL."""
+        self._validate_is_not_closed()
+        result = any(map(filter_fn, self._apply_transformations()))
+        self._close()
+        return result
+
+    def all(self, filter_fn: Filter = bool) -> bool:
+        """Return True if <filter_fn> is true for every element (stopping at the first false). This action is FINAL."""
+        self._validate_is_not_closed()
+        result = all(map(filter_fn, self._apply_transformations()))
+        self._close()
+        return result
+
+    def count(self) -> int:
+        """Return the number of elements in the stream. This action is FINAL."""
+        self._validate_is_not_closed()
+        values = self._apply_transformations()
+        result = len(values) if isinstance(values, SLICEABLE_TYPES) else sum(1 for _ in values)
         self._close()
         return result
+
+    def top_k(self, k: int, key: KeyFunction | None = None) -> list:
+        """
+        Return the <k> largest elements (by <key>), largest first.
+
+        It takes a single pass keeping only <k> elements in memory, and elements with equal keys keep their relative
+        order. This action is FINAL.
+        """
+        self._validate_is_not_closed()
+        if k < 0:
+            raise ValueError("k cannot be a negative number")
+        result = heapq.nlargest(k, self._apply_transformations(), key=key)
+        self._close()
+        return result
+
+    def bottom_k(self, k: int, key: KeyFunction | None = None) -> list:
+        """
+        Return the <k> smallest elements (by <key>), smallest first.
+
+        It takes a single pass keeping only <k> elements in memory, and elements with equal keys keep their relative
+        order. This action is FINAL.
+        """
+        self._validate_is_not_closed()
+        if k < 0:
+            raise ValueError("k cannot be a negative number")
+        result = heapq.nsmallest(k, self._apply_transformations(), key=key)
+        self._close()
+        return result
+
+    # Names of the heapq equivalents.
+    nlargest = top_k
+    nsmallest = bottom_k
@@ -0,0 +1,169 @@
+"""Fan-out of one stream to several consumers, sharing a single pass over the source."""
+
+import asyncio
+import math
+from collections import deque
+from typing import AsyncIterator, Iterable, Iterator
+
+_END = object()
+
+
+class _SharedBuffer:
+    """
+    The elements read from the source that some of the <n> consumers didn't read yet.
+
+    Each consumer keeps its (absolute) position, and the elements are dropped once all of them have read them. The
+    consumers that stop reading (their iterator is closed) no longer hold elements in the buffer.
+    """
+
+    def __init__(self, n: int, max_buffered: int | None) -> None:
+        self._buffer: deque = deque()
+        self._offset = 0
+        self._positions: list[float] = [0] * n
+        self._max_buffered = max_buffered
+        self._exhausted = False
+        self._error: BaseException | None = None
+
+    def _take(self, consumer: int) -> object:
+        """Return the next element for the <consumer> if it's buffered, or _END if it has to be read."""
+        index = int(self._positions[consumer]) - self._offset
+        if index >= len(self._buffer):
+            return _END
+        self._positions[consumer] += 1
+        element = self._buffer[index]
+        self._trim()
+        return element
+
+    def _trim(self) -> None:
+        """Drop the elements that all the consumers have read."""
+        while self._buffer and min(self._positions) > self._offset:
+            self._buffer.popleft()
+            self._offset += 1
+
+    def _full(self) -> bool:
+        return self._max_buffered is not None and len(self._buffer) >= self._max_buffered
+
+    def _end(self) -> object:
+        if self._error is not None:
+            raise self._error
+        return _END
+
+    def release(self, consumer: int) -> None:
+        """Stop keeping elements for the <consumer>."""
+        self._positions[consumer] = math.inf
+        self._trim()
+
+
+class _Tee(_SharedBuffer):
+    def __init__(self, values: Iterable, n: int, max_buffered: int | None) -> None:
+        super().__init__(n, max_buffered)
+        self._values = iter(values)
+
+    def read(self, consumer: int) -> object:
+        element = self._take(consumer)
+        if element is not _END:
+            return element
+        if self._exhausted:
+            return self._end()
+        if self._full():
+            raise ValueError(
+                f"The buffer of the tee is full ({self._max_buffered} elements): the streams have to be read at a "
+                "similar pace (e.g. alternating them), or the buffer has to be larger"
+            )
+        try:
+            self._buffer.append(next(self._values))
+        except StopIteration:
+            self._exhausted = True
+            return _END
+        except Exception as e:
+            self._exhausted, self._error = True, e
+            raise
+        return self._take(consumer)
+
+
+def _consume(tee: _Tee, consumer: int) -> Iterator:
+    try:
+        while (element := tee.read(consumer)) is not _END:
+            yield element
+    finally:
+        tee.release(consumer)
+
+
+def teed(values: Iterable, n: int, max_buffered: int | None) -> tuple[Iterator, ...]:
+    """
+    Split the <values> into <n> iterators that read them once, buffering the ones not read by all of them yet.
+
+    If more than <max_buffered> elements have to be kept, the iterator that needs to read one more raises ValueError.
+    """
+    tee = _Tee(values, n, max_buffered)
+    return tuple(_consume(tee, consumer) for consumer in range(n))
+
+
+class _AsyncTee(_SharedBuffer):
+    def __init__(self, values: AsyncIterator, n: int, buffer_size: int) -> None:
+        super().__init__(n, buffer_size)
+        self._values = values
+        self._iterator: AsyncIterator | None = None
+        self._reading = False
+        self._changed = asyncio.Condition()
+
+    async def _read_one(self) -> None:
+        if self._iterator is None:
+            self._iterator = self._values.__aiter__()
+        try:
+            self._buffer.append(await self._iterator.__anext__())
+        except StopAsyncIteration:
+            self._exhausted = True
+        except Exception as e:
+            self._exhausted, self._error = True, e
+
+    async def read(self, consumer: int) -> object:
+        """
+        Return the next element for the <consumer>, reading it from the source if needed.
+
+        Only one consumer reads from the source at a time, while the others wait. If the buffer is full, the consumer
+        waits until the slowest one reads an element.
+        """
+        async with self._changed:
+            while True:
+                element = self._take(consumer)
+                if element is not _END:
+                    self._changed.notify_all()
+                    return element
+                if self._exhausted:
+                    return self._end()
+                if not self._reading and not self._full():
+                    break
+                await self._changed.wait()
+            self._reading = True
+        try:
+            await self._read_one()
+        finally:
+            async with self._changed:
+                self._reading = False
+                self._changed.notify_all()
+        return await self.read(consumer)
+
+    async def release_async(self, consumer: int) -> None:
+        """Stop keeping elements for the <consumer>, and wake up the ones waiting for room in the buffer."""
+        async with self._changed:
+            self.release(consumer)
+            self._changed.notify_all()
+
+
+async def _consume_async(tee: _AsyncTee, consumer: int) -> AsyncIterator:
+    try:
+        while (element := await tee.read(consumer)) is not _END:
+            yield element
+    finally:
+        await tee.release_async(consumer)
+
+
+def teed_async(values: AsyncIterator, n: int, buffer_size: int) -> tuple[AsyncIterator, ...]:
+    """
+    Split the async <values> into <n> async iterators that read them once, at the pace of the slowest one.
+
+    At most <buffer_size> elements are kept for the consumers behind: the ones ahead wait for them to catch up.
+    """
+    tee = _AsyncTee(values, n, buffer_size)
+    return tuple(_consume_async(tee, consumer) for consumer in range(n))
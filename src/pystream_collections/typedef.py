@@ -2,12 +2,17 @@
 
 from typing import Callable, TypeAlias, TypeVar
 
+from pystream_collections.enums import OperationType
+
 T = TypeVar("T")
 ReducedType = TypeVar("ReducedType")
 
 Mapper: TypeAlias = Callable[[T], T]
 Filter: TypeAlias = Callable[[T], bool]
 Reducer: TypeAlias = Callable[[T, T], ReducedType]
+KeyFunction: TypeAlias = Callable[[T], object]
 
 Collectable: TypeAlias = list | tuple | dict
 TCollectable = type[Collectable]
+
+Transformation: TypeAlias = tuple[OperationType, Callable | int]
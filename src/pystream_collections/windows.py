@@ -0,0 +1,117 @@
+"""Count and time based windows over async streams."""
+
+import asyncio
+import functools
+from collections import deque
+from typing import AsyncIterator, Callable
+
+_TICK = object()
+
+
+async def _ticking(values: AsyncIterator, period: float) -> AsyncIterator:
+    """
+    Yield the elements of the <values>, and _TICK every <period> seconds, even while the source is quiet.
+
+    The source is awaited as a task of its own, so the ticks are not delayed by a slow source. If the consumer falls
+    behind, the missed ticks are collapsed into one.
+    """
+    loop = asyncio.get_running_loop()
+    iterator = values.__aiter__()
+    deadline = loop.time() + period
+    next_value: asyncio.Future | None = None
+    try:
+        while True:
+            if loop.time() >= deadline:
+                while loop.time() >= deadline:
+                    deadline += period
+                yield _TICK
+            if next_value is None:
+                next_value = asyncio.ensure_future(iterator.__anext__())
+            done, _ = await asyncio.wait({next_value}, timeout=max(0.0, deadline - loop.time()))
+            if not done:
+                continue
+            arrived, next_value = next_value, None
+            try:
+                element = arrived.result()
+            except StopAsyncIteration:
+                return
+            yield element
+    finally:
+        if next_value is not None:
+            next_value.cancel()
+            await asyncio.gather(next_value, return_exceptions=True)
+
+
+async def _tumbling(values: AsyncIterator, count: int | None) -> AsyncIterator[list]:
+    window: list = []
+    async for element in values:
+        if element is _TICK:
+            if window:
+                yield window
+                window = []
+            continue
+        window.append(element)
+        if count is not None and len(window) == count:
+            yield window
+            window = []
+    if window:
+        yield window
+
+
+async def _sliding_by_count(values: AsyncIterator, count: int, slide: int) -> AsyncIterator[list]:
+    window: deque = deque(maxlen=count)
+    unreported = 0
+    emitted = False
+    async for element in values:
+        window.append(element)
+        unreported += 1
+        if len(window) == count and (not emitted or unreported >= slide):
+            yield list(window)
+            unreported = 0
+            emitted = True
+    if unreported:
+        yield list(window)
+
+
+async def _sliding_by_time(values: AsyncIterator, seconds: float) -> AsyncIterator[list]:
+    loop = asyncio.get_running_loop()
+    window: deque[tuple[float, object]] = deque()
+    unreported = False
+    async for element in values:
+        if element is not _TICK:
+            window.append((loop.time(), element))
+            unreported = True
+            continue
+        oldest = loop.time() - seconds
+        while window and window[0][0] < oldest:
+            window.popleft()
+        if window:
+            yield [element for _, element in window]
+            unreported = False
+    if unreported:
+        yield [element for _, element in window]
+
+
+def windowing(
+    count: int | None = None, seconds: float | None = None, slide: float | None = None
+) -> Callable[[AsyncIterator], AsyncIterator[list]]:
+    """Return the function that groups the values into lists, one per window, as it closes (see AsyncStream.window)."""
+    if count is None and seconds is None:
+        raise ValueError("a window needs a count, a duration in seconds, or both")
+    if count is not None and count < 1:
+        raise ValueError("count must be a positive number")
+    if seconds is not None and seconds <= 0:
+        raise ValueError("seconds must be a positive number")
+    if slide is None:
+        if seconds is None:
+            return functools.partial(_tumbling, count=count)
+        return lambda values: _tumbling(_ticking(values, seconds), count)
+    if slide <= 0:
+        raise ValueError("slide must be a positive number")
+    if seconds is None and count is not None:
+        if slide != int(slide):
+            raise ValueError("the slide of a count window must be a whole number of elements")
+        return functools.partial(_sliding_by_count, count=count, slide=int(slide))
+    if count is None and seconds is not None:
+        return lambda values: _sliding_by_time(_ticking(values, slide), seconds)
+    raise ValueError("a sliding window is either by count or by time, not both")
@@ -1 +1,19 @@
 """Tests package."""
+
+import asyncio
+from typing import AsyncGenerator, Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+async def async_values(values: Iterable[T], read: list | None = None) -> AsyncGenerator[T, None]:
+    """
+    Yield the <values> from an async generator, giving control to the event loop before each one.
+
+    If a <read> list is given, each value is appended to it as it's read from the source.
+    """
+    for value in values:
+        await asyncio.sleep(0)
+        if read is not None:
+            read.append(value)
+        yield value
@@ -0,0 +1,92 @@
+"""Tests for array_stream.py."""
+
+import operator
+
+import pytest
+
+from pystream_collections import ArrayStream, Stream
+from pystream_collections.collectors import counting, grouping_by
+
+np = pytest.importorskip("numpy")
+
+
+def test_vectorized_map_filter_collect() -> None:
+    """Functions that work on arrays are applied to whole blocks, and the result is an array."""
+    calls = []
+
+    def _square(values: object) -> object:
+        calls.append(values)
+        return values * values
+
+    result = ArrayStream(np.arange(10), block_size=4).map(_square).filter(lambda x: x % 2 == 0).collect()
+    assert isinstance(result, np.ndarray)
+    assert result.tolist() == [0, 4, 16, 36, 64]
+    assert len(calls) == 3, "Expected one call per block"
+
+
+def test_ufuncs() -> None:
+    """Ufuncs are called on whole blocks."""
+    result = ArrayStream(np.linspace(0, 1, 5), block_size=2).map(np.sqrt).collect()
+    np.testing.assert_allclose(result, np.sqrt(np.linspace(0, 1, 5)))
+
+
+def test_non_vectorizable_fallback() -> None:
+    """Functions that don't work on arrays are applied element by element."""
+    stream = (
+        ArrayStream(np.arange(10), block_size=3)
+        .map(lambda x: x if x > 4 else 0)
+        .filter(lambda x: bool(x % 3))
+        .map(lambda x: x * 10)
+    )
+    assert stream.collect().tolist() == [50, 70, 80]
+
+
+def test_skip_limit() -> None:
+    """Skipping and limiting slice the blocks."""
+    assert ArrayStream(np.arange(20), block_size=3).skip(4).limit(5).collect().tolist() == [4, 5, 6, 7, 8]
+    assert ArrayStream(np.arange(20), block_size=3).limit(0).collect().tolist() == []
+    assert ArrayStream(np.arange(5), block_size=3).skip(10).collect().tolist() == []
+    with pytest.raises(ValueError):
+        ArrayStream(np.arange(6), block_size=3).skip(-1)
+
+
+def test_reduce() -> None:
+    """Associative ufuncs reduce whole blocks, other functions go element by element."""
+    assert ArrayStream(np.arange(1, 101), block_size=7).reduce(np.add) == 5050
+    assert ArrayStream(np.arange(6), block_size=2).reduce(np.subtract) == Stream(range(6)).reduce(operator.sub) == -15
+    assert ArrayStream(np.arange(1, 6), block_size=2).reduce(np.subtract, initial=20) == 5
+    assert ArrayStream(np.arange(1, 101), block_size=7).reduce(np.maximum) == 100
+    assert ArrayStream(np.arange(1, 6), block_size=2).reduce(operator.mul, initial=2) == 240
+    assert ArrayStream(np.arange(0)).reduce(np.add, initial=0) == 0
+    with pytest.raises(TypeError):
+        ArrayStream(np.arange(0)).reduce(np.add)
+
+
+def test_collect_other_types() -> None:
+    """Collecting into other types converts the values into Python objects."""
+    assert ArrayStream(np.arange(3)).collect(list) == [0, 1, 2]
+    assert ArrayStream(np.array([[1, 10], [2, 20]])).collect(dict) == {1: 10, 2: 20}
+    assert ArrayStream(np.arange(6)).collect(grouping_by(lambda x: x % 2, counting())) == {0: 3, 1: 3}
+    assert ArrayStream(np.arange(5)).filter(lambda x: x > 2).count() == 2
+
+
+def test_rows() -> None:
+    """Multidimensional arrays are streamed by rows, and the functions are applied to each row, like in Stream."""
+    matrix = np.arange(12).reshape(4, 3)
+    result = ArrayStream(matrix, block_size=3).filter(lambda row: row[0] > 2).map(lambda row: row.sum())
+    assert result.collect().tolist() == [12, 21, 30]
+    # These functions also work on whole blocks (with other results), so they must not be called with them.
+    square = np.arange(9).reshape(3, 3)
+    assert ArrayStream(square, block_size=3).map(lambda row: row[0]).collect().tolist() == [0, 3, 6]
+    assert ArrayStream(square, block_size=3).filter(lambda row: row[0] > 0).collect().tolist() == [[3, 4, 5], [6, 7, 8]]
+    assert ArrayStream(square, block_size=2).map(np.negative).collect().tolist() == (-square).tolist()
+
+
+def test_closed() -> None:
+    """After a final operation, the stream can't be used anymore."""
+    stream = ArrayStream(np.arange(3))
+    stream.collect()
+    with pytest.raises(ValueError):
+        stream.map(np.sqrt)
+    with pytest.raises(ValueError):
+        stream.count()
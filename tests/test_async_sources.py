@@ -0,0 +1,109 @@
+"""Tests for the async streams created from byte streams."""
+
+import asyncio
+import struct
+import sys
+
+import pytest
+
+from pystream_collections import AsyncStream
+
+
+def _reader(*chunks: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    for chunk in chunks:
+        reader.feed_data(chunk)
+    reader.feed_eof()
+    return reader
+
+
+def _length_prefixed(*frames: bytes) -> bytes:
+    return b"".join(struct.pack("!I", len(frame)) + frame for frame in frames)
+
+
+class TestFromReader:
+    """Test splitting the frames of a reader."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("read_size", (1, 4, 1024))
+    async def test_lines(self, read_size: int) -> None:
+        """Lines are split regardless of how the data arrives."""
+        reader = _reader(b"GET /a\nGET ", b"/b\n", b"\nGET /c")
+        result = await AsyncStream.from_reader(reader, read_size=read_size).collect()
+        assert result == [b"GET /a", b"GET /b", b"", b"GET /c"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("read_size", (1, 3, 1024))
+    async def test_length_prefixed(self, read_size: int) -> None:
+        """Each frame is read according to its length."""
+        data = _length_prefixed(b"first", b"", b"x" * 300)
+        reader = _reader(data[:7], data[7:])
+        result = await AsyncStream.from_reader(reader, "length-prefixed", read_size=read_size).collect()
+        assert result == [b"first", b"", b"x" * 300]
+
+    @pytest.mark.asyncio
+    async def test_length_format(self) -> None:
+        """The length can be packed in another format."""
+        reader = _reader(struct.pack("<H", 2) + b"ok" + struct.pack("<H", 3) + b"bye")
+        assert await AsyncStream.from_reader(reader, "length-prefixed", length_format="<H").collect() == [b"ok", b"bye"]
+
+    @pytest.mark.asyncio
+    async def test_fixed(self) -> None:
+        """Fixed-size frames can be split across reads."""
+        reader = _reader(b"aabb", b"c", b"cdd")
+        result = await AsyncStream.from_reader(reader, "fixed", record_size=2, read_size=3).map(bytes.upper).collect()
+        assert result == [b"AA", b"BB", b"CC", b"DD"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("framing", "data"), (("fixed", b"aab"), ("length-prefixed", _length_prefixed(b"abc")[:-1]))
+    )
+    async def test_incomplete_frame(self, framing: str, data: bytes) -> None:
+        """The reader cannot end in the middle of a frame."""
+        stream = AsyncStream.from_reader(_reader(data), framing, record_size=2)  # type: ignore[arg-type]
+        with pytest.raises(ValueError):
+            await stream.collect()
+
+    def test_invalid_parameters(self) -> None:
+        """The framing and sizes must be valid."""
+        with pytest.raises(ValueError):
+            AsyncStream.from_reader(_reader(), "words")  # type: ignore[arg-type]
+        with pytest.raises(ValueError):
+            AsyncStream.from_reader(_reader(), "fixed")
+        with pytest.raises(ValueError):
+            AsyncStream.from_reader(_reader(), read_size=0)
+
+
+class TestFromReaderSources:
+    """Test reading from actual connections and pipes."""
+
+    @pytest.mark.asyncio
+    async def test_server(self) -> None:
+        """Read the frames sent by a client to a local server."""
+        received: asyncio.Future = asyncio.get_running_loop().create_future()
+
+        async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            received.set_result(await AsyncStream.from_reader(reader, "length-prefixed").map(bytes.decode).collect())
+            writer.close()
+
+        server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            for i in range(100):
+                writer.write(_length_prefixed(f"message {i}".encode()))
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+            assert await asyncio.wait_for(received, timeout=5) == [f"message {i}" for i in range(100)]
+
+    @pytest.mark.asyncio
+    async def test_subprocess_pipe(self) -> None:
+        """Read the lines of the output of a subprocess."""
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-c", "print('\\n'.join(map(str, range(1000))))", stdout=asyncio.subprocess.PIPE
+        )
+        assert process.stdout is not None
+        total = await AsyncStream.from_reader(process.stdout).map(int).reduce(lambda a, b: a + b)
+        await process.wait()
+        assert total == sum(range(1000))
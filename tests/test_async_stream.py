@@ -1,7 +1,10 @@
 """Test the asynchronous implementation."""
 
+import asyncio
 import operator
+import time
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import AsyncGenerator, NamedTuple
 
 import pytest
@@ -104,6 +107,12 @@ async def test_skip() -> None:
     assert await astream_4.collect() == [0, 1], "No skipping should work"
 
 
+def test_negative_skip() -> None:
+    """The number of elements to skip cannot be negative."""
+    with pytest.raises(ValueError):
+        AsyncStream(_async_generator(5)).skip(-1)
+
+
 @pytest.mark.asyncio
 async def test_skip_map() -> None:
     """First skip, then map."""
@@ -144,6 +153,7 @@ async def test_reduce() -> None:
     assert await AsyncStream(_async_generator(11)).reduce(operator.add) == 55, "sum(0..10) == 55"
     assert await AsyncStream(_async_generator(10)).reduce(operator.mul) == 0
     assert await AsyncStream(_async_generator(5, start=1)).reduce(operator.mul) == 24, "4! == 24"
+    assert await AsyncStream(_async_generator(4, start=2)).reduce(operator.add) == 5, "Each element counted once"
 
 
 @pytest.mark.asyncio
@@ -231,3 +241,301 @@ class TestAsyncStreamClosed:
             stream.filter(lambda _: True)
         with pytest.raises(ValueError):
             stream.map(str)
+
+
+class TestMapConcurrent:
+    """Test the map stage that runs the mapper with several calls in flight."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_concurrency", (1, 3, 10))
+    async def test_respects_max_concurrency(self, max_concurrency: int) -> None:
+        """There are never more than <max_concurrency> calls running, and the order is kept."""
+        running = 0
+        peak = 0
+
+        async def _mapper(x: int) -> int:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001 * (x % 3))
+            running -= 1
+            return x * 10
+
+        stream = AsyncStream(_async_generator(20)).map_concurrent(_mapper, max_concurrency=max_concurrency)
+        assert await stream.collect() == [x * 10 for x in range(20)]
+        assert peak <= max_concurrency
+        if max_concurrency > 1:
+            assert peak > 1, "Expected calls to overlap"
+
+    @pytest.mark.asyncio
+    async def test_unordered(self) -> None:
+        """In unordered mode, the results are yielded as they complete."""
+        released = [asyncio.Event() for _ in range(5)]
+
+        async def _mapper(x: int) -> int:
+            await released[x].wait()
+            return x
+
+        def _release_previous(x: int) -> int:
+            # Each call completes only after the one of the next element was yielded: 4, then 3, and so on.
+            if x:
+                released[x - 1].set()
+            return x
+
+        stream = (
+            AsyncStream(_async_generator(5))
+            .map_concurrent(_mapper, max_concurrency=5, ordered=False)
+            .map(_release_previous)
+        )
+        released[4].set()
+        assert await asyncio.wait_for(stream.collect(), timeout=5) == [4, 3, 2, 1, 0]
+
+    @pytest.mark.asyncio
+    async def test_sync_mapper_and_chaining(self) -> None:
+        """A regular function can be used as well, and the stage composes with the rest of them."""
+        stream = AsyncStream(_async_generator(10)).filter(lambda x: x % 2).map_concurrent(str).skip(1)
+        assert await stream.reduce(operator.add) == "3579"
+
+    @pytest.mark.asyncio
+    async def test_mapper_error_cancels_pending_calls(self) -> None:
+        """An error on the mapper is propagated and the rest of the calls in flight are cancelled."""
+        cancelled = []
+
+        async def _mapper(x: int) -> int:
+            if x == 0:
+                await asyncio.sleep(0.01)
+                raise RuntimeError("failed")
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(x)
+                raise
+            return x
+
+        with pytest.raises(RuntimeError):
+            await AsyncStream(_async_generator(10)).map_concurrent(_mapper, max_concurrency=4).collect()
+        assert cancelled == [1, 2, 3]
+
+    def test_invalid_max_concurrency(self) -> None:
+        """The concurrency has to be at least one."""
+        with pytest.raises(ValueError):
+            AsyncStream(_async_generator(1)).map_concurrent(str, max_concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_fused_operations_keep_their_own_state() -> None:
+    """Several skips within the same fused loop count the elements that reach each one of them."""
+    stream = (
+        AsyncStream(_async_generator(20))
+        .skip(2)
+        .filter(lambda x: x % 2 == 0)
+        .skip(3)
+        .map(lambda x: x * 10)
+        .filter(lambda x: x != 160)
+        .skip(1)
+    )
+    assert await stream.collect() == [100, 120, 140, 180]
+
+
+class TestInExecutor:
+    """Test the map and filter stages that run blocking functions in an executor."""
+
+    @staticmethod
+    def _blocking_double(x: int) -> int:
+        time.sleep(0.02)
+        return x * 2
+
+    @pytest.mark.asyncio
+    async def test_map_keeps_order_and_the_loop_responsive(self) -> None:
+        """The blocking calls run in threads, while the event loop keeps running other tasks."""
+        ticks = 0
+
+        async def _ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        ticker = asyncio.create_task(_ticker())
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            start = time.perf_counter()
+            stream = AsyncStream(_async_generator(16)).map_in_executor(self._blocking_double, executor, max_in_flight=4)
+            result = await stream.collect()
+            elapsed = time.perf_counter() - start
+        ticker.cancel()
+
+        assert result == [x * 2 for x in range(16)]
+        assert elapsed < 16 * 0.02, "Expected the calls to run in parallel"
+        assert ticks > 10, "Expected the event loop not to be blocked"
+
+    @pytest.mark.asyncio
+    async def test_filter(self) -> None:
+        """Filter with a blocking function, in the default executor of the loop."""
+
+        def _blocking_is_odd(x: int) -> bool:
+            time.sleep(0.001 * (x % 3))
+            return bool(x % 2)
+
+        stream = AsyncStream(_async_generator(10)).filter_in_executor(_blocking_is_odd).map(str)
+        assert await stream.collect() == ["1", "3", "5", "7", "9"]
+
+    def test_invalid_max_in_flight(self) -> None:
+        """The number of calls in flight has to be at least one."""
+        with pytest.raises(ValueError):
+            AsyncStream(_async_generator(1)).map_in_executor(str, max_in_flight=0)
+        with pytest.raises(ValueError):
+            AsyncStream(_async_generator(1)).filter_in_executor(bool, max_in_flight=0)
+
+
+class TestShortCircuit:
+    """Test the limit and the final operations that stop requesting values as soon as they can."""
+
+    @staticmethod
+    def _counting_source(n: int, read: list[int]) -> AsyncGenerator[int, None]:
+        async def _source() -> AsyncGenerator[int, None]:
+            for i in range(n):
+                read.append(i)
+                yield i
+
+        return _source()
+
+    @pytest.mark.asyncio
+    async def test_limit(self) -> None:
+        """Only the first values are kept, and nothing else is requested."""
+        read: list[int] = []
+        stream = AsyncStream(self._counting_source(100, read)).filter(lambda x: x % 2 == 0).limit(3).map(str)
+        assert await stream.collect() == ["0", "2", "4"]
+        assert read == [0, 1, 2, 3, 4]
+        assert await AsyncStream(_async_generator(10)).skip(8).limit(5).collect() == [8, 9]
+        assert await AsyncStream(_async_generator(10)).limit(0).collect() == []
+        with pytest.raises(ValueError):
+            AsyncStream(_async_generator(10)).limit(-1)
+
+    @pytest.mark.asyncio
+    async def test_first(self) -> None:
+        """Return the first element, or a default value."""
+        read: list[int] = []
+        assert await AsyncStream(self._counting_source(100, read)).map(lambda x: x * 10).skip(2).first() == 20
+        assert read == [0, 1, 2]
+        assert await AsyncStream(_async_generator(0)).first(default=None) is None
+        with pytest.raises(ValueError):
+            await AsyncStream(_async_generator(0)).first()
+
+    @pytest.mark.asyncio
+    async def test_find(self) -> None:
+        """Return the first element that matches, or a default value."""
+        read: list[int] = []
+        assert await AsyncStream(self._counting_source(100, read)).find(lambda x: x > 4) == 5
+        assert read == [0, 1, 2, 3, 4, 5]
+        assert await AsyncStream(_async_generator(3)).find(lambda x: x > 4) is None
+        assert await AsyncStream(_async_generator(3)).find(lambda x: x > 4, default=-1) == -1
+
+    @pytest.mark.asyncio
+    async def test_any_all(self) -> None:
+        """Stop requesting values as soon as the answer is known."""
+        read: list[int] = []
+        assert await AsyncStream(self._counting_source(100, read)).any(lambda x: x == 3)
+        assert read == [0, 1, 2, 3]
+        read.clear()
+        assert not await AsyncStream(self._counting_source(100, read)).all(lambda x: x < 3)
+        assert read == [0, 1, 2, 3]
+        assert await AsyncStream(_async_generator(3, start=1)).all()
+        assert not await AsyncStream(_async_generator(1)).any()
+        assert await AsyncStream(_async_generator(0)).all()
+
+    @pytest.mark.asyncio
+    async def test_count(self) -> None:
+        """Count the elements in the stream."""
+        assert await AsyncStream(_async_generator(10)).filter(lambda x: x % 2 == 0).count() == 5
+        assert await AsyncStream(_async_generator(0)).count() == 0
+
+    @pytest.mark.asyncio
+    async def test_closes_the_stream(self) -> None:
+        """These are final operations too."""
+        stream = AsyncStream(_async_generator(3))
+        await stream.first()
+        with pytest.raises(ValueError):
+            await stream.count()
+        with pytest.raises(ValueError):
+            stream.limit(1)
+
+
+class TestPrefetch:
+    """Test the stage that reads ahead from the previous ones in a background task."""
+
+    @pytest.mark.asyncio
+    async def test_overlaps_producer_and_consumer(self) -> None:
+        """A slow source and a slow consumer run at the same time."""
+
+        async def _slow_source() -> AsyncGenerator[int, None]:
+            for i in range(10):
+                await asyncio.sleep(0.02)
+                yield i
+
+        async def _slow_consumer(x: int) -> str:
+            await asyncio.sleep(0.02)
+            return str(x)
+
+        start = time.perf_counter()
+        stream = AsyncStream(_slow_source()).prefetch(2).map_concurrent(_slow_consumer, max_concurrency=1)
+        result = await stream.collect()
+        elapsed = time.perf_counter() - start
+
+        assert result == [str(i) for i in range(10)]
+        assert elapsed < 10 * 0.02 * 2 * 0.8, "Expected producer and consumer to overlap"
+
+    @pytest.mark.asyncio
+    async def test_backpressure(self) -> None:
+        """The source is not read further than the size of the buffer (plus the elements in transit)."""
+        produced = []
+        lags = []
+
+        async def _source() -> AsyncGenerator[int, None]:
+            for i in range(20):
+                produced.append(i)
+                yield i
+
+        async def _slow_consumer(x: int) -> int:
+            await asyncio.sleep(0.002)
+            lags.append(len(produced) - x)
+            return x
+
+        stream = AsyncStream(_source()).prefetch(3).map_concurrent(_slow_consumer, max_concurrency=1)
+        assert await stream.collect() == list(range(20))
+        assert max(lags) <= 1 + 3 + 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_propagated(self) -> None:
+        """An error on the source is raised in the consumer, after the values that came before it."""
+        result = []
+
+        async def _failing_source() -> AsyncGenerator[int, None]:
+            yield 1
+            yield 2
+            raise RuntimeError("source failed")
+
+        with pytest.raises(RuntimeError, match="source failed"):
+            await AsyncStream(_failing_source()).prefetch(5).map(result.append).collect()
+        assert result == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_stopping_early_cancels_the_source(self) -> None:
+        """Once the consumer is done, the background task stops reading the source."""
+        finished = asyncio.Event()
+
+        async def _endless_source() -> AsyncGenerator[int, None]:
+            i = 0
+            try:
+                while True:
+                    yield i
+                    i += 1
+            finally:
+                finished.set()
+
+        assert await AsyncStream(_endless_source()).prefetch(4).filter(lambda x: x > 2).first() == 3
+        await asyncio.wait_for(finished.wait(), timeout=1)
+
+    def test_invalid_size(self) -> None:
+        """The buffer has to hold at least one element."""
+        with pytest.raises(ValueError):
+            AsyncStream(_async_generator(1)).prefetch(0)
@@ -0,0 +1,93 @@
+"""Tests for the batching stages (batching.py)."""
+
+import pytest
+
+from pystream_collections import AsyncStream, Stream
+from pystream_collections.compat import numpy
+from tests import async_values
+
+
+def _double_all(batch: list) -> list:
+    return [x * 2 for x in batch]
+
+
+@pytest.mark.parametrize(
+    "n, expected",
+    ((3, [[0, 1, 2], [3, 4, 5], [6]]), (7, [list(range(7))]), (10, [list(range(7))])),
+)
+def test_batch(n: int, expected: list) -> None:
+    """Group the values in lists, with the last one being shorter if needed."""
+    assert Stream(range(7)).batch(n).collect() == expected
+    assert Stream().batch(n).collect() == []
+
+
+def test_unbatch() -> None:
+    """Flatten the batches back."""
+    assert Stream(range(7)).batch(3).unbatch().collect() == list(range(7))
+    assert Stream([1, 2], [], [3]).unbatch().collect() == [1, 2, 3]
+
+
+def test_map_batches() -> None:
+    """Each call to the function transforms a whole batch."""
+    sizes = []
+
+    def _double(batch: list) -> list:
+        sizes.append(len(batch))
+        return _double_all(batch)
+
+    assert Stream(range(10)).map_batches(_double, size=4).skip(1).collect() == list(range(2, 20, 2))
+    assert sizes == [4, 4, 2]
+
+
+def test_map_batches_parallel() -> None:
+    """The batches can be transformed in other processes, when running in parallel."""
+    assert Stream(range(100)).parallel(workers=2, chunksize=3).map_batches(_double_all, 8).collect() == list(
+        range(0, 200, 2)
+    )
+
+
+def test_invalid_size() -> None:
+    """Batches need at least one element."""
+    with pytest.raises(ValueError):
+        Stream(range(3)).batch(0)
+    with pytest.raises(ValueError):
+        AsyncStream(async_values(range(3))).batch(0)
+
+
+@pytest.mark.asyncio
+async def test_async_batch_unbatch() -> None:
+    """Group the values of an async stream in lists, and flatten them back."""
+    assert await AsyncStream(async_values(range(7))).batch(3).collect() == [[0, 1, 2], [3, 4, 5], [6]]
+    assert await AsyncStream(async_values(range(0))).batch(3).collect() == []
+    assert await AsyncStream(async_values(range(7))).batch(2).unbatch().collect() == list(range(7))
+
+
+@pytest.mark.asyncio
+async def test_async_map_batches() -> None:
+    """The batch function of an async stream can be a coroutine, e.g. calling a bulk API."""
+    calls = []
+
+    async def _bulk_lookup(batch: list) -> list:
+        calls.append(batch)
+        return [str(x) for x in batch]
+
+    stream = AsyncStream(async_values(range(5))).map_batches(_bulk_lookup, size=2, max_concurrency=2)
+    assert await stream.collect() == ["0", "1", "2", "3", "4"]
+    assert calls == [[0, 1], [2, 3], [4]]
+
+
+@pytest.mark.skipif(numpy is None, reason="numpy is not installed")
+class TestNumpyBatches:
+    """Test the batches passed as numpy arrays."""
+
+    def test_stream(self) -> None:
+        """The function receives an array, and the results are flattened back."""
+        assert Stream(range(10)).map_batches(lambda arr: arr * arr, size=4, as_array=True).collect() == [
+            x * x for x in range(10)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_async_stream(self) -> None:
+        """The function receives an array, and the results are flattened back."""
+        stream = AsyncStream(async_values(range(10))).map_batches(lambda arr: arr + 1, size=3, as_array=True)
+        assert await stream.collect() == list(range(1, 11))
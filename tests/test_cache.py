@@ -0,0 +1,122 @@
+"""Tests for cache.py."""
+
+import asyncio
+import operator
+from typing import AsyncGenerator, Iterator
+
+import pytest
+
+from pystream_collections import AsyncStream, Stream
+from pystream_collections.collectors import counting
+from tests import async_values
+
+
+class TestStreamCache:
+    """Test caching the values of a synchronous stream."""
+
+    def test_upstream_runs_once(self) -> None:
+        """The values are computed once, and replayed for each fork."""
+        calls = []
+
+        def _expensive(x: int) -> int:
+            calls.append(x)
+            return x * 10
+
+        cached = Stream(iter(range(5))).map(_expensive).cache()
+        assert cached.fork().reduce(operator.add) == 100
+        assert cached.fork().filter(lambda x: x > 20).collect() == [30, 40]
+        assert cached.fork().collect(counting()) == 5
+        assert calls == [0, 1, 2, 3, 4]
+
+    def test_lazy(self) -> None:
+        """Values are only read from upstream when some fork needs them."""
+        calls = []
+        cached = Stream(range(100)).map(lambda x: calls.append(x) or x).cache()
+        assert calls == []
+        assert cached.fork().limit(3).collect() == [0, 1, 2]
+        assert cached.size == 3
+        assert cached.fork().limit(5).collect() == [0, 1, 2, 3, 4]
+        assert calls == [0, 1, 2, 3, 4]
+
+    def test_interleaved_forks(self) -> None:
+        """Forks can be read at the same time."""
+        cached = Stream(range(4)).cache()
+        left, right = cached.fork(), cached.fork()
+        assert list(zip(left.collect(tuple), right.map(str).collect())) == [(0, "0"), (1, "1"), (2, "2"), (3, "3")]
+
+    @pytest.mark.parametrize("max_in_memory", (0, 3, 100))
+    def test_spill_to_file(self, max_in_memory: int) -> None:
+        """The values beyond the limit are kept in a temporary file, and replayed from there."""
+        cached = Stream(range(10)).map(lambda x: {"value": x}).cache(max_in_memory=max_in_memory)
+        expected = [{"value": x} for x in range(10)]
+        assert cached.fork().collect() == expected
+        assert cached.fork().skip(4).collect() == expected[4:]
+        assert cached.spilled == max(0, 10 - max_in_memory)
+        cached.close()
+
+    def test_upstream_error(self) -> None:
+        """If the source fails, every fork raises the error when it gets there, instead of ending early."""
+
+        def _failing() -> Iterator[int]:
+            yield 1
+            yield 2
+            raise ConnectionError
+
+        cached = Stream(_failing()).cache()
+        first, second = cached.fork(), cached.fork()
+        with pytest.raises(ConnectionError):
+            first.collect()
+        with pytest.raises(ConnectionError):
+            second.collect()
+        assert cached.fork().limit(2).collect() == [1, 2]
+
+    def test_closes_the_stream(self) -> None:
+        """The original stream cannot be used after caching it."""
+        stream = Stream(1, 2)
+        stream.cache()
+        with pytest.raises(ValueError):
+            stream.collect()
+        with pytest.raises(ValueError):
+            Stream(1).cache(max_in_memory=-1)
+
+
+class TestAsyncStreamCache:
+    """Test caching the values of an asynchronous stream."""
+
+    @pytest.mark.asyncio
+    async def test_upstream_runs_once(self) -> None:
+        """The values are computed once, and replayed for each fork."""
+        read: list[int] = []
+        cached = await AsyncStream(async_values(range(5), read)).map(lambda x: x * 10).cache()
+        assert await cached.fork().reduce(operator.add) == 100
+        assert await cached.fork().filter(lambda x: x > 20).collect() == [30, 40]
+        assert read == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_forks(self) -> None:
+        """Several forks can be consumed concurrently, and the source is read only once."""
+        read: list[int] = []
+        cached = await AsyncStream(async_values(range(50), read)).cache(max_in_memory=10)
+        results = await asyncio.gather(
+            cached.fork().collect(), cached.fork().map(str).collect(), cached.fork().limit(5).collect()
+        )
+        assert results == [list(range(50)), [str(i) for i in range(50)], list(range(5))]
+        assert read == list(range(50))
+        assert cached.spilled == 40
+        cached.close()
+
+    @pytest.mark.asyncio
+    async def test_upstream_error(self) -> None:
+        """If the source fails, every fork raises the error when it gets there, instead of ending early."""
+
+        async def _failing() -> AsyncGenerator[int, None]:
+            yield 1
+            yield 2
+            raise ConnectionError
+
+        cached = await AsyncStream(_failing()).cache()
+        results = await asyncio.gather(cached.fork().collect(), cached.fork().collect(), return_exceptions=True)
+        assert [type(result) for result in results] == [ConnectionError, ConnectionError]
+        with pytest.raises(ConnectionError):
+            await cached.fork().collect()
+        assert await cached.fork().limit(2).collect() == [1, 2]
@@ -0,0 +1,310 @@
+"""Tests for collectors.py."""
+
+import array
+import dataclasses
+import math
+import random
+import statistics
+from collections import Counter
+from typing import AsyncGenerator, NamedTuple
+
+import pytest
+
+from pystream_collections import AsyncStream, Collector, Stream
+from pystream_collections.collectors import (
+    averaging,
+    counting,
+    fsumming,
+    grouping_by,
+    joining,
+    maximum,
+    minimum,
+    partitioning_by,
+    summarizing,
+    summing,
+    to_array,
+    to_columns,
+    to_counter,
+    to_dict,
+    to_list,
+    to_set,
+)
+from tests import async_values
+
+WORDS = ("one", "two", "three", "four", "five", "six")
+
+
+@pytest.mark.parametrize(
+    "collector, expected",
+    (
+        (to_list(), list(WORDS)),
+        (to_set(), set(WORDS)),
+        (to_dict(len), {3: "six", 5: "three", 4: "five"}),
+        (to_dict(value_fn=len), {word: len(word) for word in WORDS}),
+        (to_counter(), Counter(WORDS)),
+        (counting(), 6),
+        (summing(len), 22),
+        (joining(", ", "[", "]"), "[one, two, three, four, five, six]"),
+        (grouping_by(len), {3: ["one", "two", "six"], 5: ["three"], 4: ["four", "five"]}),
+        (grouping_by(len, counting()), {3: 3, 5: 1, 4: 2}),
+        (grouping_by(lambda w: w[0], joining("-")), {"o": "one", "t": "two-three", "f": "four-five", "s": "six"}),
+        (partitioning_by(lambda w: "o" in w), {True: ["one", "two", "four"], False: ["three", "five", "six"]}),
+        (partitioning_by(lambda w: len(w) > 10, counting()), {True: 0, False: 6}),
+    ),
+)
+class TestBuiltinCollectors:
+    """The built-in collectors work the same on both types of streams."""
+
+    def test_stream(self, collector: Collector, expected: object) -> None:
+        """Collect a synchronous stream."""
+        assert Stream(WORDS).collect(collector) == expected
+
+    @pytest.mark.asyncio
+    async def test_async_stream(self, collector: Collector, expected: object) -> None:
+        """Collect an asynchronous stream."""
+        assert await AsyncStream(async_values(WORDS)).collect(collector) == expected
+
+
+def test_custom_collector() -> None:
+    """A collector can be defined from its functions, and the accumulator can return a new container."""
+    longest = Collector(str, lambda current, word: word if len(word) > len(current) else current, str.upper)
+    assert Stream(WORDS).collect(longest) == "THREE"
+    assert Stream().collect(longest) == ""
+
+
+def test_summing_identity() -> None:
+    """Sum the elements themselves if there's no mapper."""
+    assert Stream(range(5)).collect(summing()) == 10
+
+
+def test_combiner() -> None:
+    """The collectors built from others can combine their partial results."""
+    collector = grouping_by(len, counting())
+    first = collector.accumulator(collector.accumulator(collector.supplier(), "one"), "three")
+    second = collector.accumulator(collector.supplier(), "six")
+    assert collector.combiner is not None
+    assert collector.finisher(collector.combiner(first, second)) == {3: 2, 5: 1}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("collectable_type", (list, set, frozenset, tuple, Counter))
+async def test_async_collect_types(collectable_type: type) -> None:
+    """The types are built incrementally when possible, with the same result."""
+    assert await AsyncStream(async_values(WORDS)).collect(collectable_type) == collectable_type(WORDS)
+
+
+@pytest.mark.asyncio
+async def test_async_collect_dict() -> None:
+    """A dictionary is built from (key, value) pairs."""
+    assert await AsyncStream(async_values(WORDS)).map(lambda w: (w, len(w))).collect(dict) == Stream(WORDS).map(
+        lambda w: (w, len(w))
+    ).collect(dict)
+
+
+class TestStableAggregates:
+    """Test the numerically stable aggregates."""
+
+    def test_fsumming(self) -> None:
+        """The sum is exact, like math.fsum."""
+        values = [1e100, 1.0, -1e100, 0.1, 0.1, 0.1]
+        assert Stream(values).collect(fsumming()) == math.fsum(values)
+        assert Stream(values).collect(summing()) != math.fsum(values)
+        assert Stream("a", "bb").collect(fsumming(len)) == 3.0
+
+    def test_fsumming_combined(self) -> None:
+        """Partial sums can be combined without losing precision."""
+        collector = fsumming()
+        first = collect_partial(collector, [1e100, 0.1])
+        second = collect_partial(collector, [-1e100, 0.2])
+        assert collector.finisher(collector.combiner(first, second)) == math.fsum([0.1, 0.2])  # type: ignore[misc]
+
+    def test_summarizing(self) -> None:
+        """The statistics match the ones of the statistics module, even with a large offset."""
+        values = [1e9 + x for x in (4.0, 7.0, 13.0, 16.0)]
+        result = Stream(values).collect(summarizing())
+        assert result.count == 4
+        assert result.mean == statistics.fmean(values)
+        assert result.variance == pytest.approx(statistics.pvariance(values))
+        assert result.sample_variance == pytest.approx(statistics.variance(values))
+        assert result.stdev == pytest.approx(statistics.pstdev(values))
+        assert (result.minimum, result.maximum) == (1e9 + 4, 1e9 + 16)
+
+    def test_summarizing_combined(self) -> None:
+        """Partial statistics are merged with the same result."""
+        collector = summarizing()
+        values = [random.uniform(-10, 10) for _ in range(100)]
+        merged = collector.combiner(  # type: ignore[misc]
+            collect_partial(collector, values[:37]), collect_partial(collector, values[37:])
+        )
+        result = collector.finisher(merged)
+        assert result.mean == pytest.approx(statistics.fmean(values))
+        assert result.variance == pytest.approx(statistics.pvariance(values))
+        assert (result.minimum, result.maximum) == (min(values), max(values))
+
+    def test_summarizing_empty(self) -> None:
+        """The statistics of no values are NaN, or None."""
+        result = Stream([]).collect(summarizing())
+        assert result.count == 0
+        assert math.isnan(result.mean)
+        assert result.minimum is None
+        assert math.isnan(Stream(5).collect(summarizing()).sample_variance)
+
+    def test_averaging(self) -> None:
+        """The mean, of the elements or the result of a function."""
+        assert Stream(1, 2, 3, 4).collect(averaging()) == 2.5
+        assert Stream("a", "bbb").collect(averaging(len)) == 2.0
+
+    def test_minimum_maximum(self) -> None:
+        """The extremes by key keep the first one of ties, and are None for empty streams."""
+        words = ["pear", "fig", "kiwi", "nut"]
+        assert Stream(words).collect(minimum(len)) == "fig"
+        assert Stream(words).collect(maximum(len)) == "pear"
+        assert Stream([]).collect(maximum()) is None
+        collector = maximum()
+        combined = collector.combiner(collect_partial(collector, [3, 9]), collect_partial(collector, []))  # type: ignore[misc]
+        assert collector.finisher(combined) == 9
+
+    @pytest.mark.asyncio
+    async def test_async(self) -> None:
+        """The aggregates work on async streams."""
+
+        async def _values() -> AsyncGenerator[float, None]:
+            yield 2.0
+            yield 4.0
+
+        result = await AsyncStream(_values()).collect(summarizing())
+        assert (result.mean, result.variance) == (3.0, 1.0)
+
+
+def collect_partial(collector: Collector, values: list) -> object:
+    """Accumulate the values, without finishing (to test the combiners)."""
+    container = collector.supplier()
+    for value in values:
+        container = collector.accumulator(container, value)
+    return container
+
+
+class _Reading(NamedTuple):
+    sensor: str
+    value: float
+    count: int
+    valid: bool
+
+
+@dataclasses.dataclass
+class _Sample:
+    name: str
+    weight: float
+
+
+READINGS = [_Reading(f"s{i % 3}", i / 2, i, i % 2 == 0) for i in range(10_000)]
+
+
+class TestColumnar:
+    """Test the collection into arrays and columns."""
+
+    def test_to_array(self) -> None:
+        """Numbers are kept in an array of the given type."""
+        result = Stream(range(5)).map(float).collect(to_array("d"))
+        assert result == array.array("d", [0.0, 1.0, 2.0, 3.0, 4.0])
+        with pytest.raises(TypeError):
+            Stream("abc").collect(to_array("q"))
+        with pytest.raises(ValueError):
+            to_array("x")
+
+    def test_named_tuples(self) -> None:
+        """Each field goes into a column, typed after the first record."""
+        columns = Stream(READINGS).collect(to_columns())
+        assert list(columns) == ["sensor", "value", "count", "valid"]
+        assert columns["sensor"] == [r.sensor for r in READINGS]
+        assert columns["value"] == array.array("d", (r.value for r in READINGS))
+        assert columns["count"] == array.array("q", range(10_000))
+        assert columns["valid"] == array.array("B", (r.valid for r in READINGS))
+        assert list(zip(*columns.values())) == READINGS
+
+    def test_dataclasses_and_fields(self) -> None:
+        """Dataclasses are split by their fields, and only some of them can be collected."""
+        samples = [_Sample("a", 1.5), _Sample("b", 2.5)]
+        assert Stream(samples).collect(to_columns()) == {"name": ["a", "b"], "weight": array.array("d", [1.5, 2.5])}
+        assert Stream(samples).collect(to_columns(fields=["weight"])) == {"weight": array.array("d", [1.5, 2.5])}
+        assert Stream([(1, "x"), (2, "y")]).collect(to_columns(fields=("n", "s"))) == {
+            "n": array.array("q", [1, 2]),
+            "s": ["x", "y"],
+        }
+        assert Stream([]).collect(to_columns()) == {}
+
+    def test_values_that_dont_fit(self) -> None:
+        """A column becomes a list when a value doesn't fit in its array, and the typecodes can be given."""
+        records = [_Sample("a", 1.0), _Sample("b", None), _Sample("c", 2**70)]  # type: ignore[arg-type]
+        assert Stream(records).collect(to_columns())["weight"] == [1.0, None, 2**70]
+        ints = [_Sample("a", 1), _Sample("b", 2)]  # type: ignore[arg-type]
+        assert Stream(ints).collect(to_columns(typecodes={"weight": "f"}))["weight"] == array.array("f", [1.0, 2.0])
+        with pytest.raises(ValueError):
+            Stream(ints).collect(to_columns(typecodes={"height": "f"}))
+
+    def test_bools_mixed_with_other_values(self) -> None:
+        """A column of bools with other values becomes a list that keeps them, wherever the chunks end."""
+        flags = [_Sample("a", True), _Sample("b", 5)]  # type: ignore[arg-type]
+        assert Stream(flags).collect(to_columns())["weight"] == [True, 5]
+        pytest.importorskip("numpy")
+        assert [type(v) for v in Stream(flags).collect(to_columns(backend="numpy"))["weight"]] == [bool, int]
+        for size in (3, 4096, 5000):
+            records = [_Sample("a", True)] * size + [_Sample("b", None)]  # type: ignore[arg-type]
+            column = Stream(records).collect(to_columns())["weight"]
+            assert column == [True] * size + [None]
+            assert all(type(value) is bool for value in column[:-1])
+        collector = to_columns()
+        first, second = collect_partial(collector, flags[:1]), collect_partial(collector, flags[1:])
+        assert collector.finisher(collector.combiner(first, second))["weight"] == [True, 5]  # type: ignore[misc]
+
+    def test_same_result_when_merged(self) -> None:
+        """Values of another type are kept as they are, whether they come in the same part or in another one."""
+        collector = to_columns()
+        for values in ([1, True], [True, 1], [1.5, 2], [2, 2.5], [3, 4]):
+            records = [_Sample("a", value) for value in values]
+            sequential = Stream(records).collect(collector)["weight"]
+            first, second = collect_partial(collector, records[:1]), collect_partial(collector, records[1:])
+            merged = collector.finisher(collector.combiner(first, second))["weight"]  # type: ignore[misc]
+            assert list(sequential) == list(merged) == values
+            assert [type(value) for value in sequential] == [type(value) for value in merged] == list(map(type, values))
+
+    def test_invalid_records(self) -> None:
+        """The records must have fields, and the same ones."""
+        with pytest.raises(TypeError):
+            Stream([1, 2]).collect(to_columns())
+        with pytest.raises(ValueError):
+            Stream([(1, 2), (3,)]).collect(to_columns(fields=("a", "b")))
+        with pytest.raises(ValueError):
+            to_columns(backend="csv")  # type: ignore[arg-type]
+
+    def test_combiner(self) -> None:
+        """Partial columns are merged in order."""
+        collector = to_columns()
+        first, second = collect_partial(collector, READINGS[:10]), collect_partial(collector, READINGS[10:])
+        combined = collector.finisher(collector.combiner(first, second))  # type: ignore[misc]
+        assert combined == Stream(READINGS).collect(to_columns())
+
+    def test_numpy(self) -> None:
+        """With numpy, the typed columns are arrays of the same type (bools included)."""
+        np = pytest.importorskip("numpy")
+        columns = Stream(READINGS).collect(to_columns(backend="numpy"))
+        assert columns["valid"].dtype == np.bool_ and columns["valid"].tolist() == [r.valid for r in READINGS]
+        assert columns["count"].dtype == np.int64 and columns["value"].dtype == np.float64
+        assert columns["sensor"].tolist() == [r.sensor for r in READINGS]
+
+    def test_arrow(self) -> None:
+        """With pyarrow, the result is a table."""
+        pytest.importorskip("pyarrow")
+        table = Stream(READINGS).collect(to_columns(backend="arrow"))
+        assert table.num_rows == len(READINGS)
+        assert table.column("valid").to_pylist() == [r.valid for r in READINGS]
+
+    @pytest.mark.asyncio
+    async def test_async(self) -> None:
+        """The columns can be collected from async streams."""
+
+        async def _readings() -> AsyncGenerator[_Reading, None]:
+            for reading in READINGS:
+                yield reading
+
+        assert await AsyncStream(_readings()).collect(to_columns()) == Stream(READINGS).collect(to_columns())
@@ -0,0 +1,144 @@
+"""Tests for the adaptive concurrency of async mappers, against a simulated service."""
+
+import asyncio
+import time
+
+import pytest
+
+from pystream_collections import AsyncStream
+from pystream_collections.concurrency import AdaptiveLimiter, TokenBucket
+from tests import async_values
+
+
+class _OverloadedError(Exception):
+    """The simulated service has too many requests in flight."""
+
+
+class _Service:
+    """
+    A simulated service that handles <capacity> requests at once in <latency> seconds.
+
+    Beyond its capacity, the requests queue up (taking longer), or are rejected if <rejects> is set.
+    """
+
+    def __init__(self, capacity: int, latency: float = 0.002, rejects: bool = False) -> None:
+        self._capacity = capacity
+        self._latency = latency
+        self._rejects = rejects
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, value: int) -> int:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self._rejects and self.in_flight > self._capacity:
+                raise _OverloadedError
+            await asyncio.sleep(self._latency * max(1, self.in_flight / self._capacity))
+            return value * 2
+        finally:
+            self.in_flight -= 1
+
+
+class TestAdaptiveLimiter:
+    """Test the adjustments of the limit."""
+
+    def test_grows_while_latency_is_stable(self) -> None:
+        """The limit doubles at first, and grows slowly after the first decrease."""
+        limiter = AdaptiveLimiter(min_limit=1, max_limit=100)
+        for _ in range(10):
+            limiter.on_success(time.monotonic() - 0.01)
+        assert limiter.limit == 11
+        limiter.on_error(time.monotonic(), overload=True)
+        assert limiter.limit == 5
+        for _ in range(5):
+            limiter.on_success(time.monotonic() - 0.01)
+        assert limiter.limit == 6
+
+    def test_decreases_when_latency_grows(self) -> None:
+        """Calls much slower than the fastest ones mean the requests are queueing."""
+        limiter = AdaptiveLimiter(min_limit=1, max_limit=100)
+        for _ in range(10):
+            limiter.on_success(time.monotonic() - 0.01)
+        limiter.on_success(time.monotonic() - 0.015)
+        assert limiter.limit == 12
+        limiter.on_success(time.monotonic() - 0.05)
+        assert limiter.limit == 6
+
+    def test_decreases_once_per_round_trip(self) -> None:
+        """The calls that started before a decrease don't decrease the limit again."""
+        limiter = AdaptiveLimiter(min_limit=2, max_limit=100)
+        started = time.monotonic()
+        for _ in range(30):
+            limiter.on_success(time.monotonic() - 0.01)
+        for _ in range(5):
+            limiter.on_error(started, overload=True)
+        assert limiter.limit == 16
+        limiter.on_error(time.monotonic(), overload=False)
+        assert limiter.info()[:3] == (16, 36, 5)
+
+    def test_invalid_parameters(self) -> None:
+        """The limits, tolerance and backoff must make sense."""
+        for kwargs in ({"min_limit": 0}, {"max_limit": 0}, {"latency_tolerance": 1}, {"backoff": 1}):
+            with pytest.raises(ValueError):
+                AdaptiveLimiter(**kwargs)
+
+
+class TestMapAdaptive:
+    """Test .map_adaptive() against the simulated service."""
+
+    @pytest.mark.asyncio
+    async def test_follows_the_capacity(self) -> None:
+        """The concurrency settles around what the service can take without queueing too much."""
+        service = _Service(capacity=8)
+        stream = AsyncStream(async_values(range(400))).map_adaptive(service, max_concurrency=64)
+        assert await stream.collect() == [i * 2 for i in range(400)]
+        (info,) = stream.concurrency_info()
+        assert 2 <= info.limit <= 32
+        assert service.max_in_flight < 64
+        assert info.calls == 400
+        assert info.p50 is not None and info.p50 <= info.p90 <= info.p99  # type: ignore[operator]
+
+    @pytest.mark.asyncio
+    async def test_retries_overload_errors(self) -> None:
+        """Rejected calls lower the limit and are retried, other errors are raised."""
+        service = _Service(capacity=4, rejects=True)
+        stream = AsyncStream(async_values(range(200))).map_adaptive(
+            service, retry_on=(_OverloadedError,), max_retries=100
+        )
+        assert await stream.collect() == [i * 2 for i in range(200)]
+        (info,) = stream.concurrency_info()
+        assert info.limit <= 8
+        assert info.calls == 200 + info.overloads
+
+        failing = AsyncStream(async_values(range(200))).map_adaptive(
+            _Service(capacity=1, rejects=True), min_concurrency=4
+        )
+        with pytest.raises(_OverloadedError):
+            await failing.collect()
+
+    @pytest.mark.asyncio
+    async def test_rate_limit(self) -> None:
+        """No more than <rate> calls start per second, after the initial burst."""
+        started = time.monotonic()
+        stream = AsyncStream(async_values(range(30))).map_adaptive(lambda x: x, rate=500, burst=5)
+        assert await stream.collect() == list(range(30))
+        assert time.monotonic() - started >= 25 / 500
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_burst(self) -> None:
+        """A full bucket lets <burst> calls through at once."""
+        bucket = TokenBucket(rate=1, burst=3)
+        started = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        assert time.monotonic() - started < 0.5
+
+    def test_invalid_parameters(self) -> None:
+        """The parameters are validated when the stage is added."""
+        with pytest.raises(ValueError):
+            AsyncStream(async_values(range(1))).map_adaptive(str, max_retries=-1)
+        with pytest.raises(ValueError):
+            AsyncStream(async_values(range(1))).map_adaptive(str, rate=0)
+        with pytest.raises(ValueError):
+            AsyncStream(async_values(range(1))).map_adaptive(str, min_concurrency=10, max_concurrency=5)
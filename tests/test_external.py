@@ -0,0 +1,113 @@
+"""Tests for sorting, grouping, and de-duplicating streams beyond a memory budget."""
+
+import random
+import tempfile
+from typing import Iterator
+
+import pytest
+
+from pystream_collections import Stream
+from pystream_collections.external import distinct_external, sorted_external
+
+BUDGETS = (None, 1, 3, 1000)
+
+
+@pytest.fixture
+def spilled_runs(monkeypatch: pytest.MonkeyPatch) -> list:
+    """Record the temporary files created to spill the runs."""
+    created = []
+    original = tempfile.TemporaryFile
+
+    def _temporary_file(*args: object, **kwargs: object) -> object:
+        created.append(original(*args, **kwargs))  # type: ignore[call-overload]
+        return created[-1]
+
+    monkeypatch.setattr(tempfile, "TemporaryFile", _temporary_file)
+    return created
+
+
+class TestSorted:
+    """Test the sorted stage."""
+
+    @pytest.mark.parametrize("max_in_memory", BUDGETS)
+    @pytest.mark.parametrize("reverse", (False, True))
+    def test_same_as_builtin(self, max_in_memory: int | None, reverse: bool) -> None:
+        """The result is the same as sorting in memory, stable, for any budget."""
+        values = [(random.randrange(10), i) for i in range(200)]
+        result = Stream(values).sorted(key=lambda v: v[0], reverse=reverse, max_in_memory=max_in_memory).collect()
+        assert result == sorted(values, key=lambda v: v[0], reverse=reverse)
+
+    def test_spills_runs(self, spilled_runs: list) -> None:
+        """Beyond the budget, the runs are written to temporary files, which are closed at the end."""
+        assert Stream(range(10, 0, -1)).sorted(max_in_memory=4).collect() == list(range(1, 11))
+        assert len(spilled_runs) == 3
+        assert all(file.closed for file in spilled_runs)
+
+    def test_in_memory_within_budget(self, spilled_runs: list) -> None:
+        """Nothing is spilled if the values fit in the budget."""
+        assert Stream(3, 1, 2).sorted(max_in_memory=4).collect() == [1, 2, 3]
+        assert spilled_runs == []
+
+    def test_lazy_merge(self, spilled_runs: list) -> None:
+        """The merged result is read lazily, and the files are closed even if it isn't read to the end."""
+        result = sorted_external(iter(range(100, 0, -1)), max_in_memory=10)
+        assert next(result) == 1
+        assert len(spilled_runs) == 10
+        result.close()
+        assert all(file.closed for file in spilled_runs)
+
+    def test_invalid_budget(self) -> None:
+        """The memory budget must be positive."""
+        with pytest.raises(ValueError):
+            Stream(1).sorted(max_in_memory=0)
+
+
+class TestGroupBy:
+    """Test the group_by stage."""
+
+    @pytest.mark.parametrize("max_in_memory", BUDGETS)
+    def test_group_by(self, max_in_memory: int | None) -> None:
+        """Elements are grouped by key, in order of key, keeping their relative order."""
+        words = ["pear", "fig", "apple", "kiwi", "plum", "banana", "lime"]
+        result = Stream(words).group_by(len, max_in_memory=max_in_memory).collect()
+        assert result == [(3, ["fig"]), (4, ["pear", "kiwi", "plum", "lime"]), (5, ["apple"]), (6, ["banana"])]
+
+    def test_group_by_then_aggregate(self) -> None:
+        """The groups can be processed by the next stages."""
+        result = Stream(range(10)).group_by(lambda x: x % 3, max_in_memory=2).map(lambda g: (g[0], sum(g[1])))
+        assert result.collect(dict) == {0: 18, 1: 12, 2: 15}
+
+
+class TestDistinct:
+    """Test the distinct stage."""
+
+    @pytest.mark.parametrize("max_in_memory", BUDGETS)
+    def test_keeps_first_occurrences_in_order(self, max_in_memory: int | None) -> None:
+        """The first occurrence of each element is kept, in the order of the input."""
+        values = [random.randrange(30) for _ in range(300)]
+        expected = list(dict.fromkeys(values))
+        assert Stream(values).distinct(max_in_memory=max_in_memory).collect() == expected
+
+    @pytest.mark.parametrize("max_in_memory", BUDGETS)
+    def test_key(self, max_in_memory: int | None) -> None:
+        """The elements can be compared by a key."""
+        words = ["Apple", "banana", "apple", "Cherry", "BANANA", "date", "cherry"]
+        result = Stream(words).distinct(key=str.lower, max_in_memory=max_in_memory).collect()
+        assert result == ["Apple", "banana", "Cherry", "date"]
+
+    def test_lazy_within_budget(self) -> None:
+        """While the keys fit in memory, the elements are yielded as they're read."""
+
+        def _endless() -> Iterator[int]:
+            n = 0
+            while True:
+                yield n % 5
+                n += 1
+
+        assert Stream(_endless()).distinct(max_in_memory=10).limit(5).collect() == [0, 1, 2, 3, 4]
+
+    def test_spills_beyond_budget(self, spilled_runs: list) -> None:
+        """Beyond the budget of distinct keys, the rest is de-duplicated with external sorts."""
+        values = list(range(20)) + list(range(10, 30))
+        assert list(distinct_external(values, max_in_memory=5)) == list(range(30))
+        assert spilled_runs
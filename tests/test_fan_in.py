@@ -0,0 +1,136 @@
+"""Tests for reading several async sources into a single stream."""
+
+import asyncio
+from typing import AsyncGenerator
+
+import pytest
+
+from pystream_collections import AsyncStream
+
+
+async def _delayed(values: list, delay: float = 0, log: list | None = None) -> AsyncGenerator:
+    """Yield the values, waiting <delay> seconds before each one, and logging if it's cancelled."""
+    try:
+        for value in values:
+            await asyncio.sleep(delay)
+            yield value
+    except asyncio.CancelledError:
+        if log is not None:
+            log.append("cancelled")
+        raise
+
+
+async def _failing(after: list) -> AsyncGenerator:
+    for value in after:
+        yield value
+    raise ConnectionError("shard unavailable")
+
+
+class TestMerge:
+    """Test merging sources in the order their values arrive."""
+
+    @pytest.mark.asyncio
+    async def test_all_values(self) -> None:
+        """The values of all the sources are in the result, each source in its own order."""
+        result = await AsyncStream.merge(_delayed([1, 2, 3]), _delayed(["a", "b"]), _delayed([])).collect()
+        assert sorted(map(str, result)) == ["1", "2", "3", "a", "b"]
+        assert [x for x in result if isinstance(x, int)] == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_concurrent(self) -> None:
+        """The sources are read at the same time, so it takes as long as the slowest one."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        sources = [_delayed([i] * 5, delay=0.02) for i in range(5)]
+        result = await AsyncStream.merge(*sources).collect()
+        assert len(result) == 25
+        assert loop.time() - start < 0.4
+
+    @pytest.mark.asyncio
+    async def test_completion_order(self) -> None:
+        """Faster sources come first."""
+        result = await AsyncStream.merge(_delayed(["slow"], delay=0.1), _delayed(["fast"], delay=0.01)).collect()
+        assert result == ["fast", "slow"]
+
+    @pytest.mark.asyncio
+    async def test_streams_as_sources(self) -> None:
+        """Async streams can be merged, with their operations, and they're closed."""
+        first = AsyncStream(_delayed([1, 2, 3])).map(lambda x: x * 10)
+        merged = AsyncStream.merge(first, _delayed([4])).filter(lambda x: x > 3)
+        assert sorted(await merged.collect()) == [4, 10, 20, 30]
+        with pytest.raises(ValueError):
+            first.map(str)
+
+    @pytest.mark.asyncio
+    async def test_error_cancels_the_rest(self) -> None:
+        """An error in a source is raised, and the other sources are cancelled."""
+        log: list = []
+        stream = AsyncStream.merge(_failing([1]), _delayed(range(100), delay=0.01, log=log))
+        with pytest.raises(ConnectionError):
+            await stream.collect()
+        assert log == ["cancelled"]
+
+    @pytest.mark.asyncio
+    async def test_early_termination_cancels_sources(self) -> None:
+        """If the stream isn't read to the end, the sources are cancelled."""
+        log: list = []
+        result = await AsyncStream.merge(_delayed(range(100), delay=0.01, log=log)).first()
+        assert result == 0
+        assert log == ["cancelled"]
+
+    @pytest.mark.asyncio
+    async def test_bounded_buffers(self) -> None:
+        """A source reads ahead at most <buffer_size> elements."""
+        produced: list = []
+
+        async def _counting() -> AsyncGenerator[int, None]:
+            for i in range(100):
+                produced.append(i)
+                yield i
+
+        stream = AsyncStream.merge(_counting(), buffer_size=5).map(lambda x: (x, len(produced)))
+        for consumed, produced_count in await stream.collect():
+            assert produced_count - consumed <= 7
+
+    def test_invalid_buffer(self) -> None:
+        """The buffers must have room for at least one element."""
+        with pytest.raises(ValueError):
+            AsyncStream.merge(_delayed([]), buffer_size=0)
+
+
+class TestZip:
+    """Test zipping the values of the sources."""
+
+    @pytest.mark.asyncio
+    async def test_zip(self) -> None:
+        """Tuples with a value of each source, until the shortest one ends."""
+        result = await AsyncStream.zip(_delayed([1, 2, 3], delay=0.01), _delayed("ab"), _delayed([True] * 10)).collect()
+        assert result == [(1, "a", True), (2, "b", True)]
+        assert await AsyncStream.zip().collect() == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_and_cancelled(self) -> None:
+        """The sources are read at the same time, and the longer ones are cancelled."""
+        log: list = []
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        stream = AsyncStream.zip(_delayed(range(5), delay=0.02), _delayed(range(50), delay=0.02, log=log))
+        assert await stream.map(sum).collect() == [0, 2, 4, 6, 8]
+        assert loop.time() - start < 0.19
+        assert log == ["cancelled"]
+
+
+class TestInterleave:
+    """Test taking the values of the sources in turns."""
+
+    @pytest.mark.asyncio
+    async def test_round_robin(self) -> None:
+        """The values are taken in turns, skipping the sources that ended."""
+        sources = (_delayed([1, 2, 3], delay=0.01), _delayed(["a"]), _delayed([10, 20]))
+        assert await AsyncStream.interleave(*sources).collect() == [1, "a", 10, 2, 20, 3]
+
+    @pytest.mark.asyncio
+    async def test_error(self) -> None:
+        """The errors of the sources are raised."""
+        with pytest.raises(ConnectionError):
+            await AsyncStream.interleave(_delayed([1, 2]), _failing([3])).collect()
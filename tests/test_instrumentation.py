@@ -0,0 +1,91 @@
+"""Tests for the statistics of the stages of the streams (instrumentation.py)."""
+
+import asyncio
+import time
+from typing import AsyncGenerator
+
+import pytest
+
+from pystream_collections import AsyncStream, OperationType, Stream
+from pystream_collections.instrumentation import StageStats
+
+
+def _slow_double(x: int) -> int:
+    time.sleep(0.001)
+    return x * 2
+
+
+async def _slow_source(n: int) -> AsyncGenerator[int, None]:
+    for i in range(n):
+        await asyncio.sleep(0.001)
+        yield i
+
+
+def test_not_instrumented() -> None:
+    """There are no statistics unless they're requested."""
+    stream = Stream(range(3)).map(str)
+    stream.collect()
+    assert stream.stats is None
+
+
+def test_stream_stats() -> None:
+    """Count the elements in and out of each stage, and the time in the functions."""
+    reports = []
+    stream = Stream(range(10)).instrument(reports.append).filter(lambda x: x % 2).map(_slow_double).skip(1)
+    assert stream.collect() == [6, 10, 14, 18]
+
+    assert stream.stats is not None
+    filter_stats, map_stats, skip_stats = stream.stats
+    assert [s.operation for s in stream.stats] == [OperationType.FILTER, OperationType.MAP, OperationType.SKIP]
+    assert (filter_stats.elements_in, filter_stats.elements_out) == (10, 5)
+    assert (map_stats.elements_in, map_stats.elements_out) == (5, 5)
+    assert (skip_stats.elements_in, skip_stats.elements_out) == (5, 4)
+    assert map_stats.callable_time >= 5 * 0.001
+    assert map_stats.callable_time > filter_stats.callable_time
+    assert reports == [stream.stats]
+
+
+def test_stream_stats_short_circuit() -> None:
+    """The statistics reflect what was actually read, and the hook is called once the stream stops being read."""
+    reports: list[list[StageStats]] = []
+    stream = Stream(range(100)).instrument(reports.append).map(str).limit(10)
+    assert stream.first() == "0"
+    assert len(reports) == 1
+    assert stream.stats is not None
+    assert stream.stats[0].elements_in == 1
+
+
+@pytest.mark.asyncio
+async def test_async_stream_stats() -> None:
+    """Also measure the time each stage spends awaiting the previous ones."""
+    reports = []
+    stream = (
+        AsyncStream(_slow_source(10))
+        .instrument(reports.append)
+        .filter(lambda x: x % 2)
+        .map(_slow_double)
+        .skip(1)
+        .limit(2)
+    )
+    assert await stream.collect() == [6, 10]
+
+    assert stream.stats is not None
+    filter_stats, map_stats, skip_stats, limit_stats = stream.stats
+    assert (filter_stats.elements_in, filter_stats.elements_out) == (6, 3)
+    assert (map_stats.elements_in, map_stats.elements_out) == (3, 3)
+    assert (skip_stats.elements_in, skip_stats.elements_out) == (3, 2)
+    assert (limit_stats.elements_in, limit_stats.elements_out) == (2, 2)
+    assert filter_stats.upstream_wait >= 6 * 0.001, "Waiting for the slow source"
+    assert map_stats.callable_time >= 3 * 0.001
+    assert reports == [stream.stats]
+
+
+@pytest.mark.asyncio
+async def test_async_stream_stats_short_circuit() -> None:
+    """The hook is called when the final operation stops reading the stream."""
+    reports = []
+    stream = AsyncStream(_slow_source(100)).instrument(reports.append).map_concurrent(str)
+    assert await stream.find(lambda x: x == "3") == "3"
+    assert len(reports) == 1
+    assert stream.stats is not None
+    assert stream.stats[0].elements_out == 4
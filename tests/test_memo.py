@@ -0,0 +1,137 @@
+"""Tests for the memoized mappers."""
+
+import asyncio
+import time
+
+import pytest
+
+from pystream_collections import AsyncStream, Stream
+from pystream_collections.memo import CacheInfo, MemoCache
+from tests import async_values
+
+
+class _CountingMapper:
+    def __init__(self) -> None:
+        self.calls: list[object] = []
+
+    def __call__(self, x: int) -> int:
+        self.calls.append(x)
+        return x * 10
+
+
+class TestMemoCache:
+    """Test the LRU/TTL cache of results."""
+
+    def test_lru_eviction(self) -> None:
+        """The least recently used results are evicted beyond maxsize."""
+        mapper = _CountingMapper()
+        stream = Stream(1, 2, 1, 3, 2, 1).map_cached(mapper, maxsize=2)
+        assert stream.collect() == [10, 20, 10, 30, 20, 10]
+        # 3 evicts 2 (1 was used more recently), then 2 evicts 1
+        assert mapper.calls == [1, 2, 3, 2, 1]
+        assert stream.cache_info() == [CacheInfo(hits=1, misses=5, maxsize=2, currsize=2)]
+
+    def test_ttl(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Results older than the ttl are computed again."""
+        now = [100.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        cache = MemoCache(ttl=5)
+        cache.put("a", 1)
+        now[0] += 4.9
+        assert cache.get("a") == 1
+        now[0] += 0.2
+        assert cache.get("a") != 1
+        assert cache.info().currsize == 0
+
+    def test_invalid_parameters(self) -> None:
+        """The size and time to live must be positive."""
+        with pytest.raises(ValueError):
+            Stream(1).map_cached(str, maxsize=0)
+        with pytest.raises(ValueError):
+            Stream(1).map_cached(str, ttl=0)
+
+
+class TestStreamMapCached:
+    """Test the memoized map of Stream."""
+
+    def test_key(self) -> None:
+        """The results are kept by key, and None results are cached too."""
+        calls = []
+
+        def _lookup(record: dict) -> None:
+            calls.append(record)
+
+        records = [{"id": 1, "n": 0}, {"id": 1, "n": 1}, {"id": 2, "n": 2}]
+        stream = Stream(records).map_cached(_lookup, key=lambda r: r["id"], maxsize=None)
+        assert stream.collect() == [None, None, None]
+        assert calls == [records[0], records[2]]
+        assert stream.cache_info() == [CacheInfo(hits=1, misses=2, maxsize=None, currsize=2)]
+
+    def test_several_stages(self) -> None:
+        """Each stage has its own cache, and statistics."""
+        stream = Stream("a", "b", "a").map_cached(str.upper).map(str.lower).map_cached(len)
+        assert stream.collect() == [1, 1, 1]
+        assert [(info.hits, info.misses) for info in stream.cache_info()] == [(1, 2), (1, 2)]
+
+
+class TestAsyncStreamMapCached:
+    """Test the memoized map of AsyncStream."""
+
+    @pytest.mark.asyncio
+    async def test_shares_calls_in_flight(self) -> None:
+        """Concurrent calls for the same key wait for the one in flight."""
+        calls = []
+
+        async def _fetch(x: int) -> str:
+            calls.append(x)
+            await asyncio.sleep(0.01)
+            return f"user-{x}"
+
+        stream = AsyncStream(async_values([1, 2, 1, 1, 2, 3])).map_cached(_fetch, max_concurrency=8)
+        assert await stream.collect() == ["user-1", "user-2", "user-1", "user-1", "user-2", "user-3"]
+        assert calls == [1, 2, 3]
+        assert stream.cache_info() == [CacheInfo(hits=3, misses=3, maxsize=1024, currsize=3)]
+
+    @pytest.mark.asyncio
+    async def test_sync_mapper_and_cached_results(self) -> None:
+        """Sync mappers work too, and the results are reused after the call completes."""
+        mapper = _CountingMapper()
+        stream = AsyncStream(async_values([5, 5, 6, 5])).map_cached(mapper, max_concurrency=1)
+        assert await stream.collect() == [50, 50, 60, 50]
+        assert mapper.calls == [5, 6]
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self) -> None:
+        """A failed call is propagated, and called again for the next occurrence."""
+        calls = []
+
+        async def _flaky(x: int) -> int:
+            calls.append(x)
+            if len(calls) == 1:
+                raise ConnectionError("try again")
+            return x
+
+        with pytest.raises(ConnectionError):
+            await AsyncStream(async_values([1])).map_cached(_flaky).collect()
+        cached = AsyncStream(async_values([1, 1])).map_cached(_flaky)
+        assert await cached.collect() == [1, 1]
+        assert calls == [1, 1]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_when_no_longer_awaited(self) -> None:
+        """The shared call is cancelled once nobody is waiting for it."""
+        cancelled = []
+
+        async def _slow(x: int) -> int:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(x)
+                raise
+            return x
+
+        stream = AsyncStream(async_values([1, 1, 2])).map_cached(_slow)
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(stream.collect(), timeout=0.05)
+        await asyncio.sleep(0)
+        assert sorted(cancelled) == [1, 2]
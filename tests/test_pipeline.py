@@ -0,0 +1,72 @@
+"""Tests for pipeline.py."""
+
+from collections import Counter
+
+import pytest
+
+from pystream_collections import Pipeline, Stream
+from pystream_collections.collectors import joining
+from tests import async_values
+
+PIPELINE = Pipeline().map(str.strip).filter(bool).map(str.lower).skip(1).limit(3)
+INPUT = [" A ", "", "b", " C", "d ", "", "e", "f"]
+EXPECTED = ["b", "c", "d"]
+
+
+def test_apply_many_times() -> None:
+    """The same pipeline can be applied to several sources, as many times as needed."""
+    for _ in range(3):
+        assert list(PIPELINE(INPUT)) == EXPECTED
+        assert PIPELINE.collect(iter(INPUT)) == EXPECTED
+    assert PIPELINE.collect([]) == []
+
+
+def test_same_results_as_a_stream() -> None:
+    """A pipeline gives the same results as a stream with the same operations."""
+    stream = Stream(INPUT).map(str.strip).filter(bool).map(str.lower).skip(1).limit(3)
+    assert PIPELINE.collect(INPUT) == stream.collect()
+
+
+def test_is_lazy() -> None:
+    """The results are computed as they're requested, and the source isn't read past the limit."""
+    read = []
+
+    def _source() -> object:
+        for i in range(100):
+            read.append(i)
+            yield i
+
+    assert list(Pipeline().filter(lambda x: x % 2).limit(2)(_source())) == [1, 3]
+    assert read == [0, 1, 2, 3]
+
+
+def test_immutable() -> None:
+    """Adding operations returns a new pipeline, leaving the original one as it was."""
+    base = Pipeline().map(lambda x: x + 1)
+    doubled = base.map(lambda x: x * 2)
+    assert base.collect(range(3)) == [1, 2, 3]
+    assert doubled.collect(range(3)) == [2, 4, 6]
+    assert Pipeline().collect((1, 2)) == [1, 2]
+
+
+def test_collect_types_and_collectors() -> None:
+    """Collecting works with types and collectors."""
+    assert PIPELINE.collect(INPUT, tuple) == tuple(EXPECTED)
+    assert PIPELINE.collect(INPUT, joining(",")) == "b,c,d"
+
+
+@pytest.mark.asyncio
+async def test_async_sources() -> None:
+    """The same pipeline can be applied to asynchronous sources."""
+    assert [e async for e in PIPELINE.apply_async(async_values(INPUT))] == EXPECTED
+    assert await PIPELINE.collect_async(async_values(INPUT)) == EXPECTED
+    assert await PIPELINE.collect_async(async_values(INPUT), Counter) == Counter(EXPECTED)
+    assert list(PIPELINE(INPUT)) == EXPECTED, "Still usable synchronously"
+
+
+def test_invalid_limit() -> None:
+    """The limit and the number of elements to skip cannot be negative."""
+    with pytest.raises(ValueError):
+        Pipeline().limit(-1)
+    with pytest.raises(ValueError):
+        Pipeline().skip(-1)
@@ -0,0 +1,78 @@
+"""Tests for plan.py."""
+
+import functools
+
+from pystream_collections.enums import OperationType
+from pystream_collections.plan import fuse, optimize
+
+
+def test_fuse_groups_consecutive_element_wise_operations() -> None:
+    """Maps, filters, and skips next to each other end up in the same group."""
+    concurrent = functools.partial(print)
+    transformations = [
+        (OperationType.MAP, str),
+        (OperationType.FILTER, bool),
+        (OperationType.SKIP, 2),
+        (OperationType.CONCURRENT_MAP, concurrent),
+        (OperationType.CONCURRENT_MAP, concurrent),
+        (OperationType.MAP, int),
+    ]
+    assert list(fuse(transformations)) == [
+        (True, transformations[:3]),
+        (False, transformations[3:5]),
+        (True, transformations[5:]),
+    ]
+
+
+def test_fuse_empty() -> None:
+    """No transformations, no groups."""
+    assert list(fuse([])) == []
+
+
+def test_optimize_merges_skips_and_limits() -> None:
+    """Consecutive skips add up, consecutive limits keep the smallest one."""
+    transformations = [
+        (OperationType.SKIP, 2),
+        (OperationType.SKIP, 3),
+        (OperationType.MAP, str),
+        (OperationType.LIMIT, 10),
+        (OperationType.LIMIT, 4),
+    ]
+    source = iter(range(100))
+    assert optimize(source, transformations) == (
+        source,
+        [(OperationType.SKIP, 5), (OperationType.MAP, str), (OperationType.LIMIT, 4)],
+    )
+
+
+def test_optimize_hoists_independent_filters() -> None:
+    """Filters marked as independent move ahead of the maps right before them, but not past other operations."""
+    transformations = [
+        (OperationType.SKIP, 1),
+        (OperationType.MAP, str),
+        (OperationType.MAP, repr),
+        (OperationType.FILTER, bool),
+        (OperationType.FILTER, callable),
+    ]
+    _, plan = optimize(iter(()), transformations, hoistable={3, 4})
+    assert plan == [
+        (OperationType.SKIP, 1),
+        (OperationType.FILTER, bool),
+        (OperationType.FILTER, callable),
+        (OperationType.MAP, str),
+        (OperationType.MAP, repr),
+    ]
+    _, plan = optimize(iter(()), transformations, hoistable={4})
+    assert plan == transformations
+
+
+def test_optimize_slices_sequences() -> None:
+    """Skips and limits at the start of the plan are applied by slicing a sequence source."""
+    transformations = [(OperationType.SKIP, 10), (OperationType.LIMIT, 5), (OperationType.SKIP, 1)]
+    assert optimize(range(100), transformations) == (range(11, 15), [])
+    assert optimize([1, 2, 3, 4], [(OperationType.SKIP, 1), (OperationType.MAP, str)]) == (
+        [2, 3, 4],
+        [(OperationType.MAP, str)],
+    )
+    # A negative skip is left to fail when the stream runs, as it would without the optimization.
+    assert optimize((1, 2), [(OperationType.SKIP, -1)]) == ((1, 2), [(OperationType.SKIP, -1)])
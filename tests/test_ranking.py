@@ -0,0 +1,113 @@
+"""Tests for the top-k and bottom-k of the streams."""
+
+import heapq
+import random
+from typing import AsyncGenerator
+
+import pytest
+
+from pystream_collections import AsyncStream, Stream
+from pystream_collections.collectors import bottom_k, grouping_by, top_k
+from pystream_collections.ranking import Ranking
+from tests import async_values
+
+SCORES = [("ana", 7), ("bob", 9), ("carl", 7), ("dan", 3), ("eve", 9), ("fay", 1)]
+
+
+def _score(entry: tuple) -> int:
+    return entry[1]
+
+
+class TestRanking:
+    """Test the bounded heap, against the heapq functions."""
+
+    @pytest.mark.parametrize("k", (0, 1, 3, 10, 100))
+    def test_same_as_heapq(self, k: int) -> None:
+        """The result is the same as heapq.nlargest/nsmallest (including the order of ties)."""
+        values = [(random.randrange(20), i) for i in range(50)]
+        for largest, expected in ((True, heapq.nlargest), (False, heapq.nsmallest)):
+            ranking = Ranking(k, key=lambda v: v[0], largest=largest)
+            for value in values:
+                ranking.add(value)
+            assert ranking.result() == expected(k, values, key=lambda v: v[0])
+
+    def test_merge(self) -> None:
+        """Rankings of parts of the input can be combined."""
+        first, second = Ranking(2), Ranking(2)
+        for value in (5, 1, 8):
+            first.add(value)
+        for value in (7, 9):
+            second.add(value)
+        assert first.merge(second).result() == [9, 8]
+
+    @pytest.mark.parametrize("k", (1, 3, 10))
+    def test_merge_same_as_heapq(self, k: int) -> None:
+        """Merging the rankings of consecutive parts keeps the ties in the order they were seen, like heapq."""
+        for _ in range(200):
+            values = [(random.randrange(4), i) for i in range(random.randrange(30))]
+            cuts = sorted(random.randint(0, len(values)) for _ in range(2))
+            for largest, expected in ((True, heapq.nlargest), (False, heapq.nsmallest)):
+                merged = Ranking(k, key=lambda v: v[0], largest=largest)
+                for part in (values[: cuts[0]], values[cuts[0] : cuts[1]], values[cuts[1] :]):
+                    ranking = Ranking(k, key=lambda v: v[0], largest=largest)
+                    for value in part:
+                        ranking.add(value)
+                    merged.merge(ranking)
+                assert merged.result() == expected(k, values, key=lambda v: v[0])
+
+    def test_negative_k(self) -> None:
+        """K cannot be negative."""
+        with pytest.raises(ValueError):
+            Ranking(-1)
+        with pytest.raises(ValueError):
+            Stream(1).top_k(-1)
+
+
+class TestStreamTopK:
+    """Test the terminals of Stream."""
+
+    def test_top_k(self) -> None:
+        """The k largest, by key, largest first and ties in order of appearance."""
+        assert Stream(SCORES).top_k(3, key=_score) == [("bob", 9), ("eve", 9), ("ana", 7)]
+        assert Stream(range(10)).filter(lambda x: x % 2).nlargest(2) == [9, 7]
+
+    def test_bottom_k(self) -> None:
+        """The k smallest, by key, smallest first."""
+        assert Stream(SCORES).bottom_k(2, key=_score) == [("fay", 1), ("dan", 3)]
+        assert Stream(3, 1, 2).nsmallest(5) == [1, 2, 3]
+
+    def test_collector(self) -> None:
+        """The same result can be gathered with a collector (e.g. per group)."""
+        result = Stream(range(10)).collect(grouping_by(lambda x: x % 2, top_k(2)))
+        assert result == {0: [8, 6], 1: [9, 7]}
+        assert Stream(SCORES).collect(bottom_k(1, key=_score)) == [("fay", 1)]
+
+
+class TestAsyncStreamTopK:
+    """Test the terminals and the running ranking of AsyncStream."""
+
+    @pytest.mark.asyncio
+    async def test_top_and_bottom_k(self) -> None:
+        """The terminals keep the k largest or smallest elements."""
+        assert await AsyncStream(async_values(SCORES)).top_k(2, key=_score) == [("bob", 9), ("eve", 9)]
+        assert await AsyncStream(async_values(SCORES)).nsmallest(2, key=_score) == [("fay", 1), ("dan", 3)]
+
+    @pytest.mark.asyncio
+    async def test_running_top_k(self) -> None:
+        """The ranking is emitted every time it changes."""
+        stream = AsyncStream(async_values([5, 3, 8, 1, 6, 9])).running_top_k(2)
+        assert await stream.collect() == [[5], [5, 3], [8, 5], [8, 6], [9, 8]]
+
+    @pytest.mark.asyncio
+    async def test_running_bottom_k_unbounded(self) -> None:
+        """The running ranking works over an endless source."""
+
+        async def _endless() -> AsyncGenerator[int, None]:
+            n = 0
+            while True:
+                yield (n * 7919) % 1000
+                n += 1
+
+        latest = await AsyncStream(_endless()).running_top_k(3, largest=False).limit(20).collect()
+        assert latest[-1] == sorted(latest[-1])
+        assert all(len(ranking) <= 3 for ranking in latest)
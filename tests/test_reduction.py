@@ -0,0 +1,116 @@
+"""Tests for the associative reductions."""
+
+import asyncio
+import operator
+from collections import Counter
+
+import pytest
+
+from pystream_collections import AsyncStream, Stream
+from pystream_collections.reduction import combine_in_tree
+from tests import async_values
+
+
+def _is_even(x: int) -> bool:
+    return x % 2 == 0
+
+
+def _count_word(counts: Counter, word: str) -> Counter:
+    return counts + Counter([word])
+
+
+class TestCombineInTree:
+    """Test the combination of partial results."""
+
+    @pytest.mark.parametrize("n", (0, 1, 2, 3, 7, 8, 100))
+    def test_keeps_order(self, n: int) -> None:
+        """The partials are combined left with right (associative, but not commutative, e.g. concatenation)."""
+        result = combine_in_tree((str(i) for i in range(n)), operator.add)
+        assert result == (("".join(map(str, range(n))),) if n else ())
+
+    def test_balanced(self) -> None:
+        """The combinations make a balanced tree, not a chain."""
+        result = combine_in_tree(range(8), lambda a, b: f"({a} {b})")
+        assert result == ("(((0 1) (2 3)) ((4 5) (6 7)))",)
+
+
+class TestStreamAssociativeReduce:
+    """Test Stream.reduce in associative mode."""
+
+    @pytest.mark.parametrize("n", (1, 1023, 1024, 5000))
+    def test_same_as_left_fold(self, n: int) -> None:
+        """The result is the same as the regular reduction."""
+        assert Stream(range(n)).reduce(operator.add, associative=True) == sum(range(n))
+        assert Stream(map(str, range(n))).reduce(operator.add, associative=True) == "".join(map(str, range(n)))
+
+    def test_initial(self) -> None:
+        """The initial value is reduced once, and returned for empty streams."""
+        assert Stream(range(10)).reduce(operator.add, initial=100, associative=True) == 145
+        assert Stream([]).reduce(operator.add, initial=100, associative=True) == 100
+        with pytest.raises(TypeError):
+            Stream([]).reduce(operator.add, associative=True)
+
+    def test_combiner(self) -> None:
+        """With a combiner, each chunk is reduced from the initial value (an identity), then combined."""
+        words = ["a", "b", "a"] * 1000
+        result = Stream(words).reduce(_count_word, initial=Counter(), associative=True, combiner=operator.add)
+        assert result == Counter({"a": 2000, "b": 1000})
+        assert Stream([]).reduce(_count_word, initial=Counter(), associative=True, combiner=operator.add) == Counter()
+        with pytest.raises(ValueError):
+            Stream(words).reduce(_count_word, associative=True, combiner=operator.add)
+
+    def test_parallel(self) -> None:
+        """In a parallel stream, the chunks are filtered, mapped, and reduced in the workers."""
+        stream = Stream(range(10_000)).parallel(workers=2, chunksize=100).filter(_is_even).map(operator.neg)
+        assert stream.reduce(operator.add, associative=True) == -sum(range(0, 10_000, 2))
+
+    def test_parallel_combiner_and_leading_operations(self) -> None:
+        """The operations before the last run of map and filter run in this process."""
+        stream = Stream(range(1000)).parallel(workers=2, chunksize=64).skip(10).map(str).filter(bool)
+        result = stream.reduce(_count_word, initial=Counter(), associative=True, combiner=operator.add)
+        assert result == Counter(str(i) for i in range(10, 1000))
+
+    def test_parallel_unpicklable_fallback(self) -> None:
+        """Lambdas can't be sent to other processes, so the chunks are reduced in this process."""
+        stream = Stream(range(100)).parallel(workers=2, chunksize=10)
+        assert stream.reduce(lambda a, b: max(a, b), associative=True) == 99
+
+
+class TestAsyncStreamAssociativeReduce:
+    """Test AsyncStream.reduce in associative mode."""
+
+    @pytest.mark.asyncio
+    async def test_same_as_left_fold(self) -> None:
+        """The result is the same as the regular reduction."""
+        words = [str(i) for i in range(100)]
+        result = await AsyncStream(async_values(words)).reduce(operator.add, associative=True, chunksize=7)
+        assert result == "".join(words)
+        assert await AsyncStream(async_values([])).reduce(operator.add, initial=5, associative=True) == 5
+
+    @pytest.mark.asyncio
+    async def test_concurrent_chunks(self) -> None:
+        """Async reducers run concurrently, one chunk per task."""
+        running = [0]
+        peak = [0]
+
+        async def _slow_add(a: int, b: int) -> int:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+            await asyncio.sleep(0.001)
+            running[0] -= 1
+            return a + b
+
+        stream = AsyncStream(async_values(range(100)))
+        assert await stream.reduce(_slow_add, associative=True, chunksize=10, max_concurrency=4) == sum(range(100))
+        assert peak[0] > 1
+
+    @pytest.mark.asyncio
+    async def test_combiner(self) -> None:
+        """Partial results of another type are merged with the combiner."""
+        stream = AsyncStream(async_values(["a", "b", "a"]))
+        result = await stream.reduce(
+            _count_word, initial=Counter(), associative=True, combiner=operator.add, chunksize=2
+        )
+        assert result == Counter({"a": 2, "b": 1})
+        with pytest.raises(ValueError):
+            await AsyncStream(async_values([1])).reduce(operator.add, associative=True, chunksize=0)
@@ -0,0 +1,79 @@
+"""Tests for the streams created from files."""
+
+import struct
+from pathlib import Path
+
+import pytest
+
+from pystream_collections import Stream
+
+
+@pytest.fixture
+def log_file(tmp_path: Path) -> Path:
+    """Return a small log file, whose last line has no delimiter."""
+    path = tmp_path / "app.log"
+    path.write_bytes(b"INFO start\nERROR failed\n\nINFO done")
+    return path
+
+
+class TestFromFile:
+    """Test the different ways of reading a file into a stream."""
+
+    @pytest.mark.parametrize("chunk_size", (1, 3, 1024))
+    def test_lines(self, log_file: Path, chunk_size: int) -> None:
+        """The lines are split regardless of the size of the blocks read, and they're not decoded."""
+        stream = Stream.from_file(log_file, chunk_size=chunk_size)
+        assert stream.collect() == [b"INFO start", b"ERROR failed", b"", b"INFO done"]
+
+    def test_lines_delimiter_and_decoding(self, tmp_path: Path) -> None:
+        """Any delimiter can be used, and the text is decoded only where needed."""
+        path = tmp_path / "records.txt"
+        path.write_bytes("año||ñandú||".encode())
+        result = Stream.from_file(path, delimiter=b"||", chunk_size=2).map(bytes.decode).collect()
+        assert result == ["año", "ñandú"]
+
+    def test_records(self, tmp_path: Path) -> None:
+        """Fixed-size records are memoryviews of the file."""
+        path = tmp_path / "points.bin"
+        path.write_bytes(b"".join(struct.pack("<ii", i, -i) for i in range(5)))
+        records = Stream.from_file(path, mode="records", record_size=8).map(lambda r: struct.unpack("<ii", r))
+        assert records.collect() == [(i, -i) for i in range(5)]
+
+    def test_records_kept_as_views(self, tmp_path: Path) -> None:
+        """The views are not copies, and they can be kept (the memory map outlives the stream while referenced)."""
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"abcdef")
+        records = Stream.from_file(path, mode="records", record_size=2).collect()
+        assert all(isinstance(record, memoryview) for record in records)
+        assert [bytes(record) for record in records] == [b"ab", b"cd", b"ef"]
+
+    def test_records_wrong_size(self, tmp_path: Path) -> None:
+        """The file must contain whole records."""
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"abcde")
+        with pytest.raises(ValueError):
+            Stream.from_file(path, mode="records", record_size=2).collect()
+        with pytest.raises(ValueError):
+            Stream.from_file(path, mode="records")
+
+    def test_chunks(self, log_file: Path) -> None:
+        """The file is read in blocks of the given size."""
+        chunks = Stream.from_file(log_file, mode="chunks", chunk_size=10).collect()
+        assert [len(chunk) for chunk in chunks] == [10, 10, 10, 4]
+        assert b"".join(chunks) == log_file.read_bytes()
+
+    @pytest.mark.parametrize("mode", ("lines", "records", "chunks"))
+    def test_empty_file(self, tmp_path: Path, mode: str) -> None:
+        """Empty files produce empty streams."""
+        path = tmp_path / "empty"
+        path.touch()
+        assert Stream.from_file(path, mode=mode, record_size=4).collect() == []  # type: ignore[arg-type]
+
+    def test_invalid_parameters(self, log_file: Path) -> None:
+        """The mode, and the sizes must be valid."""
+        with pytest.raises(ValueError):
+            Stream.from_file(log_file, mode="words")  # type: ignore[arg-type]
+        with pytest.raises(ValueError):
+            Stream.from_file(log_file, chunk_size=0)
+        with pytest.raises(ValueError):
+            Stream.from_file(log_file, delimiter=b"")
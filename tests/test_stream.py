@@ -1,6 +1,8 @@
 """Tests for stream.py."""
 
 import operator
+import os
+from typing import Iterable
 
 import pytest
 
@@ -105,3 +107,163 @@ class TestStreamClosed:
             stream.reduce(operator.mul)
         with pytest.raises(ValueError):
             stream.collect()
+
+
+def _is_even(x: int) -> bool:
+    return x % 2 == 0
+
+
+def _process_id(_: int) -> int:
+    return os.getpid()
+
+
+class TestParallel:
+    """Run the map and filter operations in a pool of processes."""
+
+    def test_keeps_order_and_semantics(self) -> None:
+        """The results are the same as the serial stream, in the same order."""
+        stream = Stream(range(1000)).parallel(workers=2, chunksize=7).map(operator.neg).filter(_is_even).skip(3)
+        assert stream.map(abs).collect() == list(range(6, 1000, 2))
+
+    def test_runs_in_other_processes(self) -> None:
+        """The functions are called in worker processes, not in this one."""
+        process_ids = Stream(range(100)).parallel(workers=2, chunksize=10).map(_process_id).collect()
+        assert len(process_ids) == 100
+        assert os.getpid() not in process_ids
+
+    def test_reduce(self) -> None:
+        """The reduction runs over the results of the workers."""
+        stream = Stream(range(100)).parallel(workers=2, chunksize=10).filter(_is_even).map(str)
+        assert stream.reduce(operator.add, initial="") == "".join(str(x) for x in range(0, 100, 2))
+
+    def test_unpicklable_functions_fallback(self) -> None:
+        """Lambdas can't be sent to other processes, so the stream runs serially."""
+        stream = Stream(range(10)).parallel(workers=2, chunksize=3).map(lambda x: x * 2).filter(lambda x: x > 10)
+        assert stream.collect() == [12, 14, 16, 18]
+
+    def test_unpicklable_values_fallback(self) -> None:
+        """The chunks with values that can't be pickled are processed serially."""
+        values = [1, 2, (x for x in ()), 4, 5]
+        stream = Stream(values).parallel(workers=2, chunksize=2).map(type).map(operator.attrgetter("__name__"))
+        assert stream.collect() == ["int", "int", "generator", "int", "int"]
+
+    def test_invalid_options(self) -> None:
+        """The number of workers and the size of the chunks have to be positive."""
+        with pytest.raises(ValueError):
+            Stream(1).parallel(workers=0)
+        with pytest.raises(ValueError):
+            Stream(1).parallel(chunksize=0)
+
+
+class _CountingIterator:
+    """Keep track of how many values were read from the iterator."""
+
+    def __init__(self, n: int) -> None:
+        self.read = 0
+        self._values = iter(range(n))
+
+    def __iter__(self) -> "_CountingIterator":
+        return self
+
+    def __next__(self) -> int:
+        value = next(self._values)
+        self.read += 1
+        return value
+
+
+class TestShortCircuit:
+    """Test the limit and the final operations that stop reading the stream as soon as they can."""
+
+    def test_limit(self) -> None:
+        """Only the first values are kept, and nothing else is read."""
+        source = _CountingIterator(100)
+        assert Stream(source).filter(_is_even).limit(3).map(str).collect() == ["0", "2", "4"]
+        assert source.read == 5
+        assert Stream(range(10)).skip(8).limit(5).collect() == [8, 9]
+        assert Stream(range(10)).limit(0).collect() == []
+
+    def test_limit_negative(self) -> None:
+        """The limit cannot be negative."""
+        with pytest.raises(ValueError):
+            Stream(range(10)).limit(-1)
+
+    def test_first(self) -> None:
+        """Return the first element, or a default value."""
+        source = _CountingIterator(100)
+        assert Stream(source).map(lambda x: x * 10).skip(2).first() == 20
+        assert source.read == 3
+        assert Stream().first(default=None) is None
+        with pytest.raises(ValueError):
+            Stream().first()
+
+    def test_find(self) -> None:
+        """Return the first element that matches, or a default value."""
+        source = _CountingIterator(100)
+        assert Stream(source).find(lambda x: x > 4) == 5
+        assert source.read == 6
+        assert Stream(range(3)).find(lambda x: x > 4) is None
+        assert Stream(range(3)).find(lambda x: x > 4, default=-1) == -1
+
+    def test_any_all(self) -> None:
+        """Stop reading as soon as the answer is known."""
+        source = _CountingIterator(100)
+        assert Stream(source).any(lambda x: x == 3)
+        assert source.read == 4
+        source = _CountingIterator(100)
+        assert not Stream(source).all(lambda x: x < 3)
+        assert source.read == 4
+        assert Stream(1, 2).all()
+        assert not Stream(0, 0).any()
+        assert not Stream().any()
+        assert Stream().all()
+
+    def test_count(self) -> None:
+        """Count the elements in the stream."""
+        assert Stream(range(10)).filter(_is_even).count() == 5
+        assert Stream().count() == 0
+
+    @pytest.mark.parametrize("final_operation", ("first", "count", "any", "all"))
+    def test_closes_the_stream(self, final_operation: str) -> None:
+        """These are final operations too."""
+        stream = Stream(1, 2, 3)
+        getattr(stream, final_operation)()
+        with pytest.raises(ValueError):
+            stream.limit(1)
+        with pytest.raises(ValueError):
+            stream.find(bool)
+
+
+class TestOptimizedPlan:
+    """The optimizations of the plan keep the same results."""
+
+    @pytest.mark.parametrize("source", [list(range(50)), tuple(range(50)), range(50), iter(range(50))])
+    def test_skip_limit(self, source: Iterable[int]) -> None:
+        """Skips and limits give the same result whether they're applied by slicing or not."""
+        stream = Stream(source).skip(3).skip(2).limit(30).limit(20).map(lambda x: x * 2).skip(1).limit(3)
+        assert stream.collect() == [12, 14, 16]
+
+    def test_identity(self) -> None:
+        """A stream with no transformations returns a copy of the source."""
+        values = [1, 2, 3]
+        result = Stream(values).collect()
+        assert result == values and result is not values
+        assert Stream(values).skip(1).collect() == [2, 3]
+        assert values == [1, 2, 3]
+        assert Stream(range(10**12)).skip(10).count() == 10**12 - 10
+
+    def test_independent_filter(self) -> None:
+        """An independent filter runs before the maps, so they're called less often, with the same result."""
+        calls = []
+
+        def _enriched(record: dict) -> dict:
+            calls.append(record["id"])
+            return {**record, "square": record["id"] ** 2}
+
+        records = [{"id": n} for n in range(10)]
+        result = Stream(records).map(_enriched).filter(lambda r: r["id"] % 2 == 0, independent=True).collect()
+        assert result == [{"id": n, "square": n * n} for n in range(0, 10, 2)]
+        assert calls == [0, 2, 4, 6, 8]
+
+    def test_strings_are_iterated(self) -> None:
+        """A single string is still a sequence of characters."""
+        assert Stream("abc").skip(1).collect() == ["b", "c"]
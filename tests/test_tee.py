@@ -0,0 +1,137 @@
+"""Tests for splitting a stream into several ones that share a single pass over the values."""
+
+import asyncio
+import operator
+from typing import AsyncGenerator, Iterator
+
+import pytest
+
+from pystream_collections import AsyncStream, Stream
+from tests import async_values
+
+
+class _OneShot:
+    """An iterator that can be read only once, counting the elements read."""
+
+    def __init__(self, n: int) -> None:
+        self.read = 0
+        self._values = iter(range(n))
+
+    def __iter__(self) -> Iterator[int]:
+        for value in self._values:
+            self.read += 1
+            yield value
+
+
+class TestStreamTee:
+    """Test the tee of Stream."""
+
+    def test_single_pass(self) -> None:
+        """Each new stream gets all the values, read once from the source."""
+        source = _OneShot(10)
+        total, evens, squares = Stream(source).map(lambda x: x + 1).tee(3)
+        assert total.reduce(operator.add) == 55
+        assert evens.filter(lambda x: x % 2 == 0).collect() == [2, 4, 6, 8, 10]
+        assert squares.map(lambda x: x * x).count() == 10
+        assert source.read == 10
+
+    def test_lockstep_within_the_cap(self) -> None:
+        """Streams read at the same pace need a small buffer."""
+        first, second = Stream(_OneShot(1000)).tee(2, max_buffered=1)
+        assert all(a == b for a, b in zip(first.collect(iter), second.collect(iter)))  # type: ignore[arg-type]
+
+    def test_cap_exceeded(self) -> None:
+        """If the buffer would grow beyond the cap, there's a clear error."""
+        first, second = Stream(_OneShot(100)).tee(2, max_buffered=10)
+        values = first.collect(iter)
+        assert [next(values) for _ in range(10)] == list(range(10))  # type: ignore[call-overload]
+        with pytest.raises(ValueError, match="buffer of the tee is full"):
+            next(values)  # type: ignore[call-overload]
+        assert second.limit(3).collect() == [0, 1, 2]
+
+    def test_closed_streams_release_the_buffer(self) -> None:
+        """Streams that stop reading don't hold elements in the buffer."""
+        first, second = Stream(_OneShot(100)).tee(2, max_buffered=5)
+        values = first.collect(iter)
+        assert next(values) == 0  # type: ignore[call-overload]
+        values.close()  # type: ignore[attr-defined]
+        assert second.count() == 100
+
+    def test_errors(self) -> None:
+        """The errors of the source are raised in all the streams."""
+
+        def _failing() -> Iterator[int]:
+            yield 1
+            raise OSError("disk failure")
+
+        first, second = Stream(_failing()).tee()
+        with pytest.raises(OSError):
+            first.collect()
+        with pytest.raises(OSError):
+            second.collect()
+
+    def test_invalid_parameters(self) -> None:
+        """The number of streams, and the cap must be positive, and the original stream is closed."""
+        with pytest.raises(ValueError):
+            Stream(1).tee(0)
+        with pytest.raises(ValueError):
+            Stream(1).tee(max_buffered=0)
+        stream = Stream(1)
+        stream.tee()
+        with pytest.raises(ValueError):
+            stream.collect()
+
+
+class TestAsyncStreamTee:
+    """Test the tee of AsyncStream."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_consumers(self) -> None:
+        """Several terminal operations over a single pass of the source."""
+        read: list = []
+        total, maximum, items = AsyncStream(async_values(range(500), read)).map(lambda x: x * 2).tee(3, buffer_size=8)
+        results = await asyncio.gather(total.reduce(operator.add), maximum.reduce(max), items.count())
+        assert results == [sum(range(0, 1000, 2)), 998, 500]
+        assert read == list(range(500))
+
+    @pytest.mark.asyncio
+    async def test_backpressure(self) -> None:
+        """The fastest consumer waits for the slowest one, when it's <buffer_size> elements behind."""
+        read: list = []
+        fast, slow = AsyncStream(async_values(range(100), read)).tee(2, buffer_size=4)
+        gaps = []
+
+        async def _slow_mapper(x: int) -> int:
+            await asyncio.sleep(0.001)
+            gaps.append(len(read) - x)
+            return x
+
+        results = await asyncio.gather(fast.collect(), slow.map_concurrent(_slow_mapper, max_concurrency=1).collect())
+        assert results == [list(range(100)), list(range(100))]
+        assert max(gaps) <= 5
+
+    @pytest.mark.asyncio
+    async def test_closed_consumer_releases_the_buffer(self) -> None:
+        """A consumer that stops reading doesn't hold the others back."""
+        first, second = AsyncStream(async_values(range(50), [])).tee(2, buffer_size=2)
+        assert await first.first() == 0
+        assert await second.count() == 50
+
+    @pytest.mark.asyncio
+    async def test_errors(self) -> None:
+        """The errors of the source are raised in all the streams."""
+
+        async def _failing() -> AsyncGenerator[int, None]:
+            yield 1
+            raise OSError("connection reset")
+
+        first, second = AsyncStream(_failing()).tee()
+        results = await asyncio.gather(first.collect(), second.collect(), return_exceptions=True)
+        assert all(isinstance(result, OSError) for result in results)
+
+    def test_invalid_parameters(self) -> None:
+        """The number of streams, and the buffer must be positive."""
+        with pytest.raises(ValueError):
+            AsyncStream(async_values(range(1), [])).tee(0)
+        with pytest.raises(ValueError):
+            AsyncStream(async_values(range(1), [])).tee(buffer_size=0)
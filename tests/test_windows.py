@@ -0,0 +1,117 @@
+"""Tests for the windows of AsyncStream."""
+
+import asyncio
+from typing import AsyncGenerator
+
+import pytest
+
+from pystream_collections import AsyncStream
+from pystream_collections.collectors import summing
+from tests import async_values
+
+
+async def _timed_source(*events: tuple[float, int]) -> AsyncGenerator[int, None]:
+    """Yield each value after waiting the given number of seconds."""
+    for delay, value in events:
+        await asyncio.sleep(delay)
+        yield value
+
+
+class TestCountWindows:
+    """Test the windows by number of elements."""
+
+    @pytest.mark.asyncio
+    async def test_tumbling(self) -> None:
+        """Each element is in one window, and the last one can be partial."""
+        assert await AsyncStream(async_values(range(7))).window(count=3).collect() == [[0, 1, 2], [3, 4, 5], [6]]
+
+    @pytest.mark.asyncio
+    async def test_sliding(self) -> None:
+        """The last <count> elements are emitted every <slide> elements."""
+        windows = await AsyncStream(async_values(range(7))).window(count=3, slide=2).collect()
+        assert windows == [[0, 1, 2], [2, 3, 4], [4, 5, 6]]
+
+    @pytest.mark.asyncio
+    async def test_sliding_remainder(self) -> None:
+        """The elements not emitted yet are emitted in a last window, even if the stream is shorter than the window."""
+        assert await AsyncStream(async_values(range(5))).window(count=3, slide=2).collect() == [[0, 1, 2], [2, 3, 4]]
+        assert await AsyncStream(async_values(range(6))).window(count=3, slide=2).collect() == [
+            [0, 1, 2],
+            [2, 3, 4],
+            [3, 4, 5],
+        ]
+        assert await AsyncStream(async_values([1, 2])).window(count=3, slide=1).collect() == [[1, 2]]
+
+    @pytest.mark.asyncio
+    async def test_aggregate(self) -> None:
+        """Each window can be aggregated with a function or a collector."""
+        assert await AsyncStream(async_values(range(6))).window(count=2, aggregate=max).collect() == [1, 3, 5]
+        assert await AsyncStream(async_values(range(6))).window(count=3, aggregate=summing()).collect() == [3, 12]
+
+    @pytest.mark.parametrize(
+        "parameters",
+        (
+            {},
+            {"count": 0},
+            {"seconds": 0},
+            {"count": 2, "slide": 0},
+            {"count": 2, "slide": 1.5},
+            {"count": 2, "seconds": 1, "slide": 1},
+        ),
+    )
+    def test_invalid_parameters(self, parameters: dict) -> None:
+        """The windows must have a valid size, and slide."""
+        with pytest.raises(ValueError):
+            AsyncStream(async_values([])).window(**parameters)
+
+
+class TestTimeWindows:
+    """Test the windows by time."""
+
+    @pytest.mark.asyncio
+    async def test_tumbling_flushes_while_quiet(self) -> None:
+        """The windows close on time, even if no element arrives for a while."""
+        received: list[tuple[float, list]] = []
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        def _record(window: list) -> list:
+            received.append((loop.time() - start, window))
+            return window
+
+        source = _timed_source((0, 1), (0, 2), (0.35, 3))
+        windows = await AsyncStream(source).window(seconds=0.1).map(_record).collect()
+        assert windows == [[1, 2], [3]]
+        # the first window was emitted on time, without waiting for the next element
+        assert received[0][0] < 0.3
+
+    @pytest.mark.asyncio
+    async def test_count_or_time(self) -> None:
+        """With both, a window closes when it's full, or when its time is up."""
+        source = _timed_source((0, 1), (0, 2), (0, 3), (0, 4), (0.3, 5))
+        assert await AsyncStream(source).window(count=3, seconds=0.1).collect() == [[1, 2, 3], [4], [5]]
+
+    @pytest.mark.asyncio
+    async def test_sliding(self) -> None:
+        """Every <slide> seconds, the elements of the last <seconds> are emitted."""
+        source = _timed_source((0, 1), (0.22, 2), (0.22, 3))
+        windows = await AsyncStream(source).window(seconds=0.35, slide=0.1).collect()
+        assert windows[0] == [1]
+        assert [1, 2] in windows
+        assert windows[-1] == [2, 3]
+        assert [1, 2, 3] not in windows
+
+    @pytest.mark.asyncio
+    async def test_unbounded_source(self) -> None:
+        """Windows make unbounded sources usable, e.g. limiting the number of windows read."""
+
+        async def _endless() -> AsyncGenerator[int, None]:
+            n = 0
+            while True:
+                await asyncio.sleep(0.001)
+                yield n
+                n += 1
+
+        windows = await AsyncStream(_endless()).window(seconds=0.05, aggregate=len).limit(3).collect()
+        assert len(windows) == 3
+        assert all(size > 0 for size in windows)